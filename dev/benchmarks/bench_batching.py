@@ -0,0 +1,71 @@
+"""
+Throughput of length-bucketed batching (`Hlm12NliBucketBatcher`) versus naive fixed-size
+batches, on a random-initialised encoder and a long-tailed (log-normal) sentence length distribution.
+
+Usage:
+    python dev/benchmarks/bench_batching.py
+"""
+
+# Python Built-in Modules
+import random
+import string
+import time
+
+# Third-Party Libraries
+import torch
+
+# My Packages and Modules
+from hlm12nli.modelling.batching import Hlm12NliBucketBatcher
+from hlm12nli.modelling.config import Hlm12NliConfig
+from hlm12nli.modelling.encoder import Hlm12NliEncoder
+from hlm12nli.tokenisation.config import Hlm12NliTextTokeniserConfig
+from hlm12nli.tokenisation.tokeniser import Hlm12NliTokeniser
+
+
+def _corpus(rng: random.Random, words: list, n_texts: int = 2000) -> list:
+    texts = []
+    for _ in range(n_texts):
+        n_words = max(1, min(int(rng.lognormvariate(2.4, 0.6)), 250))
+        texts.append(" ".join(rng.choice(words) for _ in range(n_words)))
+    return texts
+
+
+def main() -> None:
+    rng = random.Random(42)
+    words = sorted({"".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(2, 7))) for _ in range(2000)})
+    vocab = ["[PAD]", "[OOV]", "[STR]", "[END]"] + words
+    tokeniser = Hlm12NliTokeniser(Hlm12NliTextTokeniserConfig(vocab=vocab, max_seq_len=256))
+    encoder = Hlm12NliEncoder(
+        config=Hlm12NliConfig(
+            model_name="benchmark",
+            vocab_size=len(vocab),
+            token_vec_dims=128,
+            token_id_pad=0,
+            hidden_state_dims=128,
+            hidden_state_bidirectional=False,
+            attn_heads=4,
+            attn_dropout=0.0,
+            output_dims=128,
+        )
+    ).eval()
+    texts = _corpus(rng, words)
+    batch_size = 32
+
+    start = time.perf_counter()
+    with torch.inference_mode():
+        for i in range(0, len(texts), batch_size):
+            encoder(tokeniser.tokenise_ids(texts[i : i + batch_size]))
+    naive = len(texts) / (time.perf_counter() - start)
+
+    batcher = Hlm12NliBucketBatcher(tokeniser, max_batch_tokens=batch_size * 64)
+    start = time.perf_counter()
+    for _ in batcher.encode(encoder, texts):
+        pass
+    bucketed = len(texts) / (time.perf_counter() - start)
+
+    print(f"naive fixed batches ({batch_size} rows): {naive:10.1f} texts/s")
+    print(f"length-bucketed ({batcher.max_batch_tokens} tokens): {bucketed:10.1f} texts/s ({bucketed / naive:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
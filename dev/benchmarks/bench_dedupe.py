@@ -0,0 +1,80 @@
+"""
+Latency of scoring premise/hypothesis pairs with `Hlm12NliDedupingEncoder`, which encodes each distinct
+sentence once, versus encoding both sides of every pair, on synthetic pair-scoring traffic where each
+premise is scored against several hypotheses.
+
+Usage:
+    python dev/benchmarks/bench_dedupe.py [n_pairs] [hypotheses_per_premise]
+"""
+
+# Python Built-in Modules
+import random
+import string
+import sys
+import time
+
+# Third-Party Libraries
+import numpy as np
+import torch
+
+# My Packages and Modules
+from hlm12nli.modelling.batching import Hlm12NliBucketBatcher
+from hlm12nli.modelling.config import Hlm12NliConfig
+from hlm12nli.modelling.dedupe import Hlm12NliDedupingEncoder
+from hlm12nli.modelling.encoder import Hlm12NliEncoder
+from hlm12nli.tokenisation.config import Hlm12NliTextTokeniserConfig
+from hlm12nli.tokenisation.tokeniser import Hlm12NliTokeniser
+
+
+def main() -> None:
+    n_pairs = int(sys.argv[1]) if len(sys.argv) > 1 else 4096
+    per_premise = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    rng = random.Random(42)
+    words = sorted(
+        {"".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(2, 9))) for _ in range(30_000)}
+    )
+    vocab = ["[PAD]", "[OOV]", "[STR]", "[END]"] + words[:20_000]
+    tokeniser = Hlm12NliTokeniser(Hlm12NliTextTokeniserConfig(vocab=vocab, max_seq_len=64))
+    config = Hlm12NliConfig(
+        model_name="bench",
+        vocab_size=len(vocab),
+        token_vec_dims=128,
+        token_id_pad=0,
+        hidden_state_dims=128,
+        hidden_state_bidirectional=True,
+        attn_heads=4,
+        attn_dropout=0.0,
+        output_dims=256,
+        pack_sequences=True,
+    )
+    encoder = Hlm12NliEncoder(config).eval()
+    hypotheses_pool = [" ".join(rng.choice(words) for _ in range(rng.randint(4, 12))) for _ in range(n_pairs // 2)]
+    premises = [
+        " ".join(rng.choice(words) for _ in range(rng.randint(10, 25))) for _ in range(n_pairs // per_premise + 1)
+    ]
+    premises = [premises[i // per_premise] for i in range(n_pairs)]
+    hypotheses = [rng.choice(hypotheses_pool) for _ in range(n_pairs)]
+
+    batcher = Hlm12NliBucketBatcher(tokeniser)
+    start = time.perf_counter()
+    embeddings = torch.stack(list(batcher.encode(encoder, premises + hypotheses))).numpy()
+    left, right = embeddings[:n_pairs], embeddings[n_pairs:]
+    expected = (left * right).sum(axis=1) / np.linalg.norm(left, axis=1) / np.linalg.norm(right, axis=1)
+    baseline = time.perf_counter() - start
+    print(f"{n_pairs} pairs, {per_premise} hypotheses per premise (threads {torch.get_num_threads()})")
+    print(f"every pair     : {baseline:7.2f} s, {2 * n_pairs:6d} sentences encoded")
+
+    dedupe = Hlm12NliDedupingEncoder(tokeniser, encoder)
+    start = time.perf_counter()
+    actual = dedupe.score_pairs(premises, hypotheses)
+    elapsed = time.perf_counter() - start
+    stats = dedupe.stats()
+    print(
+        f"deduplicated   : {elapsed:7.2f} s, {stats.unique:6d} sentences encoded "
+        f"(dedupe ratio {stats.dedupe_ratio:.2f}, {baseline / elapsed:.2f}x faster, "
+        f"max score error {np.abs(actual - expected).max():.1e})"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Latency and peak memory of embedding a single long document with `Hlm12NliDocumentEncoder` (overlapping
+windows of 128 tokens) versus a single forward pass over the whole document (`max_seq_len` raised to fit it),
+as the document grows. Each measurement runs in a fresh process, so that its peak resident memory is its own.
+
+Usage:
+    python dev/benchmarks/bench_document.py [max_full_tokens]
+"""
+
+# Python Built-in Modules
+import multiprocessing
+import random
+import resource
+import string
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Tuple
+
+# Third-Party Libraries
+import torch
+
+# My Packages and Modules
+from hlm12nli.modelling.config import Hlm12NliConfig
+from hlm12nli.modelling.document import Hlm12NliDocumentEncoder
+from hlm12nli.modelling.encoder import Hlm12NliEncoder
+from hlm12nli.tokenisation.config import Hlm12NliTextTokeniserConfig
+from hlm12nli.tokenisation.tokeniser import Hlm12NliTokeniser
+
+WINDOW_SIZE = 128
+
+
+def _measure(mode: str, n_tokens: int) -> Tuple[float, float]:
+    torch.set_num_threads(1)
+    rng = random.Random(42)
+    words = sorted(
+        {"".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(2, 9))) for _ in range(30_000)}
+    )
+    vocab = ["[PAD]", "[OOV]", "[STR]", "[END]"] + words[:20_000]
+    document = " ".join(rng.choice(words[:20_000]) for _ in range(n_tokens))
+    max_seq_len = n_tokens + 2 if mode == "full" else WINDOW_SIZE
+    tokeniser = Hlm12NliTokeniser(Hlm12NliTextTokeniserConfig(vocab=vocab, max_seq_len=max_seq_len))
+    config = Hlm12NliConfig(
+        model_name="bench",
+        vocab_size=len(vocab),
+        token_vec_dims=128,
+        token_id_pad=0,
+        hidden_state_dims=128,
+        hidden_state_bidirectional=True,
+        attn_heads=4,
+        attn_dropout=0.0,
+        output_dims=256,
+        pack_sequences=True,
+    )
+    torch.manual_seed(42)
+    encoder = Hlm12NliEncoder(config).eval()
+    documents = Hlm12NliDocumentEncoder(tokeniser, encoder, max_batch_windows=16)
+
+    def run(text: str) -> None:
+        if mode == "full":
+            with torch.inference_mode():
+                encoder(tokeniser.tokenise_ids([text]))
+        else:
+            documents([text])
+
+    run("a warm up text")
+    before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    run(document)
+    elapsed = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return elapsed, (peak - before) / 1024
+
+
+def main() -> None:
+    max_full_tokens = int(sys.argv[1]) if len(sys.argv) > 1 else 8192
+    context = multiprocessing.get_context("spawn")
+    print(f"{'tokens':>7} | {'windowed ms':>11} {'peak MB':>8} | {'full ms':>9} {'peak MB':>8}")
+    for n_tokens in (512, 2048, 8192, 32768, 131072):
+        with ProcessPoolExecutor(1, mp_context=context) as pool:
+            windowed_s, windowed_mb = pool.submit(_measure, "windowed", n_tokens).result()
+        full = "skipped".rjust(18)
+        if n_tokens <= max_full_tokens:
+            with ProcessPoolExecutor(1, mp_context=context) as pool:
+                full_s, full_mb = pool.submit(_measure, "full", n_tokens).result()
+            full = f"{full_s * 1000:>9.0f} {full_mb:>8.0f}"
+        print(f"{n_tokens:>7} | {windowed_s * 1000:>11.0f} {windowed_mb:>8.0f} | {full}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+CPU latency of the frozen TorchScript graph exported by `Hlm12NliEncoderExporter` versus the eager
+`Hlm12NliEncoder`, at batch sizes 1, 8 and 64, on a random-initialised encoder.
+
+Usage:
+    python dev/benchmarks/bench_export.py [seq_len]
+"""
+
+# Python Built-in Modules
+import pathlib
+import statistics
+import sys
+import tempfile
+import time
+import warnings
+
+# Third-Party Libraries
+import torch
+
+# My Packages and Modules
+from hlm12nli.modelling.config import Hlm12NliConfig
+from hlm12nli.modelling.encoder import Hlm12NliEncoder
+from hlm12nli.modelling.export import Hlm12NliEncoderExporter
+from hlm12nli.modelling.runtime import Hlm12NliExportedEncoder
+
+
+def _latency_ms(fn, repeats: int = 50) -> float:
+    for _ in range(5):
+        fn()
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1000
+
+
+def main() -> None:
+    seq_len = int(sys.argv[1]) if len(sys.argv) > 1 else 32
+    warnings.simplefilter("ignore", category=FutureWarning)
+    torch.manual_seed(42)
+    encoder = Hlm12NliEncoder(
+        config=Hlm12NliConfig(
+            model_name="benchmark",
+            vocab_size=30000,
+            token_vec_dims=128,
+            token_id_pad=0,
+            hidden_state_dims=128,
+            hidden_state_bidirectional=False,
+            attn_heads=4,
+            attn_dropout=0.1,
+            output_dims=128,
+        )
+    ).eval()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filepath = pathlib.Path(tmpdir) / "encoder.pt"
+        Hlm12NliEncoderExporter(encoder).export(filepath)
+        exported = Hlm12NliExportedEncoder(filepath)
+        print(f"seq_len {seq_len}, {torch.get_num_threads()} threads")
+        for batch_size in (1, 8, 64):
+            lengths = torch.randint(1, seq_len + 1, (batch_size,))
+            mask = torch.arange(seq_len) < lengths[:, None]
+            ids = torch.randint(1, encoder.config.vocab_size, (batch_size, seq_len)).masked_fill(~mask, 0)
+
+            def eager():
+                with torch.inference_mode():
+                    encoder.forward_tensors(ids, mask)
+
+            eager_ms = _latency_ms(eager)
+            exported_ms = _latency_ms(lambda: exported(ids, mask))
+            print(
+                f"batch {batch_size:>3}: eager {eager_ms:8.3f} ms, exported {exported_ms:8.3f} ms "
+                f"({eager_ms / exported_ms:.2f}x)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Recall@10 and queries per second of the IVF index (`Hlm12NliVectorIndex`) at increasing `n_probe`,
+versus exact (brute-force) cosine search, on clustered random vectors.
+
+Usage:
+    python dev/benchmarks/bench_index.py [n_vectors] [dims]
+"""
+
+# Python Built-in Modules
+import pathlib
+import sys
+import tempfile
+import time
+
+# Third-Party Libraries
+import numpy as np
+
+# My Packages and Modules
+from hlm12nli.modelling.index import Hlm12NliVectorIndex
+
+
+def main() -> None:
+    n_vectors = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    dims = int(sys.argv[2]) if len(sys.argv) > 2 else 128
+    n_queries, k = 1000, 10
+    rng = np.random.default_rng(42)
+    centres = rng.normal(size=(1000, dims)).astype(np.float32)
+    vectors = centres[rng.integers(0, len(centres), n_vectors)] + rng.normal(scale=1.5, size=(n_vectors, dims))
+    vectors = vectors.astype(np.float32)
+    queries = vectors[rng.choice(n_vectors, n_queries, replace=False)] + rng.normal(scale=1.5, size=(n_queries, dims))
+    n_lists = int(np.sqrt(n_vectors))
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        index = Hlm12NliVectorIndex(pathlib.Path(tmpdir) / "index", dims=dims, n_lists=n_lists)
+        start = time.perf_counter()
+        for batch in range(0, n_vectors, 10_000):
+            index.add(vectors[batch : batch + 10_000])
+        print(f"{n_vectors} vectors, {dims} dims, {n_lists} lists: added in {time.perf_counter() - start:.1f} s")
+
+        start = time.perf_counter()
+        _, expected = index.search(queries, k=k, n_probe=n_lists)
+        exact_qps = n_queries / (time.perf_counter() - start)
+        print(f"exact        : recall@{k} 1.000, {exact_qps:9.1f} QPS")
+        for n_probe in (1, 4, 16, 64):
+            start = time.perf_counter()
+            _, ids = index.search(queries, k=k, n_probe=n_probe)
+            qps = n_queries / (time.perf_counter() - start)
+            recall = np.mean([len(set(a) & set(b)) / k for a, b in zip(ids, expected)])
+            print(f"n_probe {n_probe:>4} : recall@{k} {recall:.3f}, {qps:9.1f} QPS ({qps / exact_qps:.1f}x)")
+        index.close()
+
+
+if __name__ == "__main__":
+    main()
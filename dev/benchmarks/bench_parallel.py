@@ -0,0 +1,48 @@
+"""
+Scaling of `Hlm12NliParallelTokeniser` with the number of worker processes, on a synthetic SNLI-like corpus.
+
+Usage:
+    python dev/benchmarks/bench_parallel.py [n_texts]
+"""
+
+# Python Built-in Modules
+import os
+import random
+import string
+import sys
+import time
+
+# My Packages and Modules
+from hlm12nli.tokenisation.config import Hlm12NliTextTokeniserConfig
+from hlm12nli.tokenisation.parallel import Hlm12NliParallelTokeniser
+from hlm12nli.tokenisation.tokeniser import Hlm12NliTokeniser
+
+
+def main() -> None:
+    n_texts = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    rng = random.Random(42)
+    words = sorted(
+        {"".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(2, 9))) for _ in range(30_000)}
+    )
+    vocab = ["[PAD]", "[OOV]", "[STR]", "[END]"] + words[:20_000] + ["##" + c for c in string.ascii_lowercase]
+    tokeniser = Hlm12NliTokeniser(Hlm12NliTextTokeniserConfig(vocab=vocab, max_seq_len=128))
+    texts = [" ".join(rng.choice(words) for _ in range(rng.randint(5, 25))) for _ in range(n_texts)]
+
+    start = time.perf_counter()
+    tokeniser.tokenise_ids(texts)
+    baseline = time.perf_counter() - start
+    print(f"in-process: {n_texts / baseline:10.0f} texts/s")
+
+    processes = 2
+    while processes <= (os.cpu_count() or 1):
+        with Hlm12NliParallelTokeniser(tokeniser, processes=processes, min_parallel_size=0) as parallel:
+            parallel.tokenise_ids(texts[: processes * parallel.shard_size])
+            start = time.perf_counter()
+            parallel.tokenise_ids(texts)
+            elapsed = time.perf_counter() - start
+        print(f"{processes:>3} processes: {n_texts / elapsed:10.0f} texts/s ({baseline / elapsed:5.2f}x)")
+        processes *= 2
+
+
+if __name__ == "__main__":
+    main()
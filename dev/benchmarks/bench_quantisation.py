@@ -0,0 +1,63 @@
+"""
+Size, throughput and cosine-similarity drift of the dynamic int8 quantised encoder
+(`Hlm12NliEncoderQuantiser`), with and without a half precision embedding table, versus fp32,
+on a random-initialised encoder.
+
+Usage:
+    python dev/benchmarks/bench_quantisation.py [n_texts]
+"""
+
+# Python Built-in Modules
+import random
+import string
+import sys
+import warnings
+
+# Third-Party Libraries
+import torch
+
+# My Packages and Modules
+from hlm12nli.modelling.config import Hlm12NliConfig
+from hlm12nli.modelling.encoder import Hlm12NliEncoder
+from hlm12nli.modelling.quantisation import Hlm12NliEncoderQuantiser
+from hlm12nli.tokenisation.config import Hlm12NliTextTokeniserConfig
+from hlm12nli.tokenisation.tokeniser import Hlm12NliTokeniser
+
+
+def main() -> None:
+    n_texts = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    warnings.simplefilter("ignore")
+    torch.manual_seed(42)
+    rng = random.Random(42)
+    words = {"".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(2, 7))) for _ in range(30000)}
+    words = sorted(words)
+    vocab = ["[PAD]", "[OOV]", "[STR]", "[END]"] + words
+    tokeniser = Hlm12NliTokeniser(Hlm12NliTextTokeniserConfig(vocab=vocab, max_seq_len=128))
+    encoder = Hlm12NliEncoder(
+        config=Hlm12NliConfig(
+            model_name="benchmark",
+            vocab_size=len(vocab),
+            token_vec_dims=256,
+            token_id_pad=0,
+            hidden_state_dims=256,
+            hidden_state_bidirectional=True,
+            attn_heads=4,
+            attn_dropout=0.1,
+            output_dims=256,
+            pack_sequences=True,
+        )
+    ).eval()
+    texts = [" ".join(rng.choice(words) for _ in range(rng.randint(3, 60))) for _ in range(n_texts)]
+    print(f"{n_texts} texts, {torch.get_num_threads()} threads")
+    for embeddings_dtype in (None, "float16", "bfloat16"):
+        quantiser = Hlm12NliEncoderQuantiser(embeddings_dtype=embeddings_dtype)
+        report = quantiser.validate(encoder, quantiser.quantise(encoder), tokeniser, texts)
+        print(
+            f"int8 + {embeddings_dtype or 'float32'} embeddings: "
+            f"{report.quantised_bytes / 2**20:6.1f} MB ({report.compression:.2f}x smaller), "
+            f"{report.speedup:.2f}x faster, cosine mean {report.cosine_mean:.5f} min {report.cosine_min:.5f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
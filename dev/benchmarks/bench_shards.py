@@ -0,0 +1,64 @@
+"""
+Throughput of a training epoch's data loading from pre-tokenised shards (`Hlm12NliTripletDataset`),
+versus tokenising the triplets of each batch on the fly, on a synthetic SNLI-like corpus.
+
+Usage:
+    python dev/benchmarks/bench_shards.py [n_triplets] [batch_size]
+"""
+
+# Python Built-in Modules
+import pathlib
+import random
+import string
+import sys
+import tempfile
+import time
+
+# My Packages and Modules
+from hlm12nli.etl.shards import Hlm12NliTripletShardWriter
+from hlm12nli.tokenisation.config import Hlm12NliTextTokeniserConfig
+from hlm12nli.tokenisation.tokeniser import Hlm12NliTokeniser
+from hlm12nli.training.data import Hlm12NliTripletDataset
+
+
+def main() -> None:
+    n_triplets = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    batch_size = int(sys.argv[2]) if len(sys.argv) > 2 else 128
+    rng = random.Random(42)
+    words = sorted(
+        {"".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(2, 9))) for _ in range(30_000)}
+    )
+    vocab = ["[PAD]", "[OOV]", "[STR]", "[END]"] + words[:20_000] + ["##" + c for c in string.ascii_lowercase]
+    tokeniser = Hlm12NliTokeniser(Hlm12NliTextTokeniserConfig(vocab=vocab, max_seq_len=128))
+    premises = [" ".join(rng.choice(words) for _ in range(rng.randint(8, 25))) for _ in range(n_triplets // 3 + 1)]
+    triplets = [
+        (premises[i // 3], " ".join(rng.choice(words) for _ in range(rng.randint(4, 12))), "a " + premises[i // 3])
+        for i in range(n_triplets)
+    ]
+
+    order = list(range(n_triplets))
+    rng.shuffle(order)
+    start = time.perf_counter()
+    for batch in range(0, n_triplets, batch_size):
+        rows = [triplets[i] for i in order[batch : batch + batch_size]]
+        for role in range(3):
+            tokeniser.tokenise_ids([row[role] for row in rows])
+    baseline = time.perf_counter() - start
+    print(f"tokenise per batch : {n_triplets / baseline:10.0f} triplets/s")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        start = time.perf_counter()
+        filepaths = Hlm12NliTripletShardWriter(pathlib.Path(tmpdir), tokeniser).write(triplets)
+        size = sum(filepath.stat().st_size for filepath in filepaths)
+        print(f"write shards (once): {time.perf_counter() - start:10.2f} s, {size / 2**20:.1f} MB")
+
+        dataset = Hlm12NliTripletDataset(pathlib.Path(tmpdir), tokeniser)
+        start = time.perf_counter()
+        for _ in dataset.loader(batch_size=batch_size, shuffle=True):
+            pass
+        elapsed = time.perf_counter() - start
+        print(f"load from shards   : {n_triplets / elapsed:10.0f} triplets/s ({baseline / elapsed:5.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
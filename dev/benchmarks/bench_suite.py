@@ -0,0 +1,330 @@
+"""
+Performance baseline of the tokeniser and encoder hot paths, on CPU, with a random-initialised encoder and
+a synthetic SNLI-like corpus (short premises and shorter hypotheses, words made of one to three wordpieces,
+capitalised and punctuated, with some out-of-vocabulary words).
+
+Each stage is timed per batch, after a warm-up pass, and reports its latency (mean, p50, p95, min),
+sentences/sec, tokens/sec (non-padding tokens) and the peak resident memory added during one pass, which
+includes the tensors allocated by torch: the peak RSS of the process is reset before the pass (through
+`/proc/self/clear_refs`, so only on Linux, "n/a" elsewhere) and read back after it. Memory the allocators
+already hold from earlier passes is reused without being counted again. The stages are:
+    wordpiece: `Hlm12NliTokeniserSplitter` without the word cache, i.e. whitespace split and the default
+        "greedy" engine (`_wordpiece`)
+    wordpiece_trie: the same with the linear-time "trie" engine
+    split: `Hlm12NliTokeniser.perform_splitting`, with the word cache warm
+    tokenise: `Hlm12NliTokeniser.tokenise`, the list-based path
+    tokenise_ids: `Hlm12NliTokeniser.tokenise_ids`, the direct-to-ids path
+    to_tensor: converting a list-based `Hlm12NliTokeniserOutput` into the id and mask tensors
+    forward: `Hlm12NliEncoder.forward` on an already tokenised batch
+    end_to_end: `tokenise_ids` followed by `forward`
+over the corpus at several batch sizes, then `tokenise_ids` and `forward` on sentences of fixed lengths
+to show the scaling with the sequence length. The tokeniser runs with its default "greedy" wordpiece engine.
+
+The results are written as JSON, and can be compared with those of a previous run, reporting the change of
+throughput of each entry and exiting with status 1 when any entry regressed beyond the threshold.
+
+Usage:
+    python dev/benchmarks/bench_suite.py [--output results.json] [--compare baseline.json] [--threshold 0.1]
+                                         [--quick] [--threads 1]
+"""
+
+# Python Built-in Modules
+import argparse
+import datetime
+import json
+import platform
+import random
+import resource
+import string
+import sys
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Third-Party Libraries
+import numpy as np
+import torch
+
+# My Packages and Modules
+from hlm12nli.modelling.config import Hlm12NliConfig
+from hlm12nli.modelling.encoder import Hlm12NliEncoder
+from hlm12nli.tokenisation.config import Hlm12NliTextTokeniserConfig
+from hlm12nli.tokenisation.output import Hlm12NliTokeniserOutput
+from hlm12nli.tokenisation.splitter import Hlm12NliTokeniserSplitter
+from hlm12nli.tokenisation.tokeniser import Hlm12NliTokeniser
+
+_SPECIAL_TOKENS = ["[PAD]", "[OOV]", "[STR]", "[END]"]
+
+
+def _pieces(rng: random.Random, n_pieces: int) -> List[str]:
+    pieces = set(string.ascii_lowercase)
+    while len(pieces) < n_pieces:
+        pieces.add("".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(2, 6))))
+    return sorted(pieces)
+
+
+def _vocab(pieces: List[str]) -> List[str]:
+    return _SPECIAL_TOKENS + pieces + ["##" + piece for piece in pieces] + [".", ",", "##.", "##,"]
+
+
+def _words(rng: random.Random, pieces: List[str], n_words: int) -> List[str]:
+    words = []
+    for _ in range(n_words):
+        word = "".join(rng.choice(pieces) for _ in range(rng.choices((1, 2, 3), weights=(5, 3, 1))[0]))
+        words.append(word if rng.random() > 0.02 else word + "ü")
+    return words
+
+
+def _sentence(rng: random.Random, words: List[str], weights: List[float], n_words: int) -> str:
+    sentence = " ".join(rng.choices(words, weights=weights, k=n_words))
+    return sentence[0].upper() + sentence[1:] + rng.choice((".", ".", " .", ","))
+
+
+def _corpus(rng: random.Random, words: List[str], n_pairs: int) -> List[str]:
+    weights = [1.0 / (rank + 1) for rank in range(len(words))]
+    texts = []
+    for _ in range(n_pairs):
+        texts.append(_sentence(rng, words, weights, max(3, min(int(rng.lognormvariate(2.5, 0.4)), 80))))
+        texts.append(_sentence(rng, words, weights, max(2, min(int(rng.lognormvariate(1.9, 0.35)), 40))))
+    return texts
+
+
+def _measure(
+    name: str,
+    fn: Callable[[List[str]], object],
+    batches: List[List[str]],
+    n_tokens: int,
+    repeat: int,
+    batch_size: int,
+    seq_len: Optional[int] = None,
+) -> dict:
+    for batch in batches[: max(1, len(batches) // 10)]:
+        fn(batch)
+    latencies = []
+    for _ in range(repeat):
+        for batch in batches:
+            start = time.perf_counter()
+            fn(batch)
+            latencies.append(time.perf_counter() - start)
+    baseline = _reset_peak_rss()
+    for batch in batches:
+        fn(batch)
+    peak = _status_bytes("VmHWM") - baseline if baseline is not None else None
+    latencies = np.asarray(latencies)
+    elapsed = latencies.sum() / repeat
+    n_sentences = sum(len(batch) for batch in batches)
+    return {
+        "name": name,
+        "batch_size": batch_size,
+        "seq_len": seq_len,
+        "batches": len(batches),
+        "sentences": n_sentences,
+        "tokens": n_tokens,
+        "latency_ms": {
+            "mean": float(latencies.mean() * 1000),
+            "p50": float(np.percentile(latencies, 50) * 1000),
+            "p95": float(np.percentile(latencies, 95) * 1000),
+            "min": float(latencies.min() * 1000),
+        },
+        "sentences_per_sec": n_sentences / elapsed,
+        "tokens_per_sec": n_tokens / elapsed,
+        "peak_rss_bytes": peak,
+    }
+
+
+def _stages(
+    tokeniser: Hlm12NliTokeniser,
+    encoder: Hlm12NliEncoder,
+    splitters: Dict[str, Hlm12NliTokeniserSplitter],
+) -> Tuple[Dict[str, Callable[[List[str]], object]], Dict[int, Hlm12NliTokeniserOutput], Dict[int, object]]:
+    def to_tensor(batch: List[str]) -> None:
+        x = batch_outputs[id(batch)]
+        fresh = Hlm12NliTokeniserOutput(
+            tokens=x.tokens, padded_tokens=x.padded_tokens, encoded_tokens=x.encoded_tokens, mask=x.mask
+        )
+        fresh.encoded_tokens_to_tensor()
+        fresh.mask_to_tensor()
+
+    def wordpiece(engine: str) -> Callable[[List[str]], None]:
+        def split(batch: List[str]) -> None:
+            splitters[engine]([text.lower() for text in batch])
+
+        return split
+
+    def forward(batch: List[str]) -> None:
+        with torch.inference_mode():
+            encoder(batch_ids[id(batch)])
+
+    def end_to_end(batch: List[str]) -> None:
+        with torch.inference_mode():
+            encoder(tokeniser.tokenise_ids(batch))
+
+    batch_outputs: Dict[int, Hlm12NliTokeniserOutput] = {}
+    batch_ids: Dict[int, object] = {}
+    stages = {
+        "wordpiece": wordpiece("greedy"),
+        "wordpiece_trie": wordpiece("trie"),
+        "split": tokeniser.perform_splitting,
+        "tokenise": tokeniser.tokenise,
+        "tokenise_ids": tokeniser.tokenise_ids,
+        "to_tensor": to_tensor,
+        "forward": forward,
+        "end_to_end": end_to_end,
+    }
+    return stages, batch_outputs, batch_ids
+
+
+def run(quick: bool, threads: int) -> dict:
+    torch.manual_seed(42)
+    torch.set_num_threads(threads)
+    rng = random.Random(42)
+    pieces = _pieces(rng, 8_000 if quick else 15_000)
+    vocab = _vocab(pieces)
+    words = _words(rng, pieces, 20_000)
+    texts = _corpus(rng, words, 256 if quick else 2048)
+    tokeniser = Hlm12NliTokeniser(Hlm12NliTextTokeniserConfig(vocab=vocab, max_seq_len=256))
+    encoder = Hlm12NliEncoder(
+        config=Hlm12NliConfig(
+            model_name="benchmark",
+            vocab_size=len(vocab),
+            token_vec_dims=128,
+            token_id_pad=0,
+            hidden_state_dims=128,
+            hidden_state_bidirectional=True,
+            attn_heads=4,
+            attn_dropout=0.0,
+            output_dims=128,
+            pack_sequences=True,
+        )
+    ).eval()
+    splitters = {
+        engine: Hlm12NliTokeniserSplitter(vocab=tokeniser.vocab, token_oov="[OOV]", expr_subword="##", engine=engine)
+        for engine in ("greedy", "trie")
+    }
+    stages, batch_outputs, batch_ids = _stages(tokeniser, encoder, splitters)
+    repeat = 1 if quick else 3
+    results = []
+
+    for batch_size in (1, 8, 32) if quick else (1, 8, 32, 128):
+        batches = [texts[i : i + batch_size] for i in range(0, len(texts), batch_size)]
+        if batch_size == 1:
+            batches = batches[:256]
+        for batch in batches:
+            batch_outputs[id(batch)] = tokeniser.tokenise(batch)
+            batch_ids[id(batch)] = tokeniser.tokenise_ids(batch)
+        n_tokens = sum(int(batch_ids[id(batch)].lengths.sum()) for batch in batches)
+        for name, fn in stages.items():
+            results.append(_measure(name, fn, batches, n_tokens, repeat, batch_size))
+            print(_format(results[-1]), file=sys.stderr)
+
+    batch_size = 32
+    weights = [1.0 / (rank + 1) for rank in range(len(words))]
+    for seq_len in (16, 32, 64) if quick else (16, 32, 64, 128, 256):
+        batches = [[_sentence(rng, words, weights, seq_len) for _ in range(batch_size)] for _ in range(8)]
+        for batch in batches:
+            batch_ids[id(batch)] = tokeniser.tokenise_ids(batch)
+        n_tokens = sum(int(batch_ids[id(batch)].lengths.sum()) for batch in batches)
+        for name in ("tokenise_ids", "forward"):
+            results.append(_measure(name, stages[name], batches, n_tokens, repeat, batch_size, seq_len=seq_len))
+            print(_format(results[-1]), file=sys.stderr)
+
+    return {
+        "meta": {
+            "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "processor": platform.processor(),
+            "torch": torch.__version__,
+            "numpy": np.__version__,
+            "threads": threads,
+            "quick": quick,
+            "vocab_size": len(vocab),
+            "corpus_sentences": len(texts),
+            "max_rss_bytes": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024,
+        },
+        "results": results,
+    }
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> bool:
+    """
+    Prints the change of tokens/sec of every entry present in both runs, returning whether any regressed
+    by more than `threshold`.
+    """
+    previous = {_key(result): result for result in baseline["results"]}
+    regressed = False
+    for result in current["results"]:
+        before = previous.get(_key(result))
+        if before is None:
+            continue
+        change = result["tokens_per_sec"] / before["tokens_per_sec"] - 1.0
+        flag = ""
+        if change < -threshold:
+            regressed = True
+            flag = "  REGRESSION"
+        print(f"{_label(result):<40} {change * 100:+7.1f}%{flag}")
+    return regressed
+
+
+def _key(result: dict) -> tuple:
+    return result["name"], result["batch_size"], result["seq_len"]
+
+
+def _label(result: dict) -> str:
+    label = f"{result['name']} batch={result['batch_size']}"
+    return label + (f" seq_len={result['seq_len']}" if result["seq_len"] is not None else "")
+
+
+def _format(result: dict) -> str:
+    return (
+        f"{_label(result):<40} p50 {result['latency_ms']['p50']:9.3f} ms, "
+        f"{result['sentences_per_sec']:10.1f} sent/s, {result['tokens_per_sec']:11.1f} tok/s, "
+        f"peak {_megabytes(result['peak_rss_bytes'])} MB"
+    )
+
+
+def _megabytes(nbytes: Optional[int]) -> str:
+    return f"{nbytes / 2**20:7.2f}" if nbytes is not None else "    n/a"
+
+
+def _reset_peak_rss() -> Optional[int]:
+    try:
+        with open("/proc/self/clear_refs", "w") as fh:
+            fh.write("5")
+    except OSError:
+        return None
+    return _status_bytes("VmRSS")
+
+
+def _status_bytes(field: str) -> int:
+    with open("/proc/self/status") as fh:
+        for line in fh:
+            if line.startswith(field + ":"):
+                return int(line.split()[1]) * 1024
+    raise KeyError(field)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output", help="the JSON file to write the results to, stdout by default")
+    parser.add_argument("--compare", help="the JSON results of a previous run to compare with")
+    parser.add_argument("--threshold", type=float, default=0.1, help="the relative throughput loss to flag")
+    parser.add_argument("--quick", action="store_true", help="a smaller corpus and fewer configurations")
+    parser.add_argument("--threads", type=int, default=1, help="the number of torch intra-op threads")
+    args = parser.parse_args()
+
+    results = run(quick=args.quick, threads=args.threads)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fh:
+            json.dump(results, fh, indent=2)
+    else:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as fh:
+            baseline = json.load(fh)
+        if compare(results, baseline, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+CPU throughput, in triplets per second, of the triplet loss with in-batch mining (`Hlm12NliTripletLoss`)
+versus mining the negative of each anchor in a Python loop, and of a full training step of
+`Hlm12NliTripletModule` (forward, loss, backward and optimiser step), with and without the cross-batch memory.
+Requires the `training` extra.
+
+Usage:
+    python dev/benchmarks/bench_training.py [n_steps]
+"""
+
+# Python Built-in Modules
+import pathlib
+import random
+import string
+import sys
+import tempfile
+import time
+
+# Third-Party Libraries
+import torch
+
+# My Packages and Modules
+from hlm12nli.etl.shards import Hlm12NliTripletShardWriter
+from hlm12nli.modelling.config import Hlm12NliConfig
+from hlm12nli.modelling.encoder import Hlm12NliEncoder
+from hlm12nli.tokenisation.config import Hlm12NliTextTokeniserConfig
+from hlm12nli.tokenisation.tokeniser import Hlm12NliTokeniser
+from hlm12nli.training.data import Hlm12NliTripletDataset
+from hlm12nli.training.losses import Hlm12NliTripletLoss
+from hlm12nli.training.module import Hlm12NliTripletModule
+
+
+def _loop_loss(loss: Hlm12NliTripletLoss, anchors, positives, negatives) -> torch.Tensor:
+    candidates = torch.cat([positives, negatives])
+    losses = []
+    for i in range(len(anchors)):
+        d_ap = loss.paired_distances(anchors[i : i + 1], positives[i : i + 1])
+        d_an = [
+            loss.paired_distances(anchors[i : i + 1], candidates[j : j + 1]) for j in range(len(candidates)) if j != i
+        ]
+        losses.append(torch.relu(d_ap - torch.min(torch.cat(d_an)) + loss.margin))
+    return torch.cat(losses).mean()
+
+
+def _throughput(fn, n_samples: int, repeats: int) -> float:
+    fn()
+    start = time.perf_counter()
+    for _ in range(repeats):
+        fn()
+    return n_samples * repeats / (time.perf_counter() - start)
+
+
+def main() -> None:
+    n_steps = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    torch.manual_seed(42)
+    loss = Hlm12NliTripletLoss(mining="batch_hard")
+    print("loss only (dims 256)")
+    for batch_size in (32, 128, 512):
+        anchors, positives, negatives = torch.randn(3, batch_size, 256, requires_grad=True)
+        vectorised = _throughput(lambda: loss(anchors, positives, negatives).loss.backward(), batch_size, 20)
+        if batch_size > 128:
+            print(f"  batch {batch_size:>4}: vectorised {vectorised:12.0f} /s")
+            continue
+        loop = _throughput(lambda: _loop_loss(loss, anchors, positives, negatives).backward(), batch_size, 1)
+        print(f"  batch {batch_size:>4}: vectorised {vectorised:12.0f} /s, per-anchor loop {loop:10.0f} /s")
+
+    rng = random.Random(42)
+    words = sorted(
+        {"".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(2, 9))) for _ in range(30_000)}
+    )
+    vocab = ["[PAD]", "[OOV]", "[STR]", "[END]"] + words[:20_000]
+    tokeniser = Hlm12NliTokeniser(Hlm12NliTextTokeniserConfig(vocab=vocab, max_seq_len=64))
+    sentences = [" ".join(rng.choice(words) for _ in range(rng.randint(5, 20))) for _ in range(30_000)]
+    triplets = [(rng.choice(sentences), rng.choice(sentences), rng.choice(sentences)) for _ in range(10_000)]
+    config = Hlm12NliConfig(
+        model_name="bench",
+        vocab_size=len(vocab),
+        token_vec_dims=128,
+        token_id_pad=0,
+        hidden_state_dims=128,
+        hidden_state_bidirectional=True,
+        attn_heads=4,
+        attn_dropout=0.0,
+        output_dims=256,
+        pack_sequences=True,
+    )
+    with tempfile.TemporaryDirectory() as tmpdir:
+        Hlm12NliTripletShardWriter(pathlib.Path(tmpdir), tokeniser).write(triplets)
+        dataset = Hlm12NliTripletDataset(pathlib.Path(tmpdir), tokeniser)
+        print(f"training step (threads {torch.get_num_threads()})")
+        for mining, memory_size in (("batch_hard", 0), ("semi_hard", 0), ("batch_hard", 4096)):
+            for batch_size in (32, 128):
+                module = Hlm12NliTripletModule(Hlm12NliEncoder(config), mining=mining, memory_size=memory_size)
+                optimiser = module.configure_optimizers()
+                batches = iter(dataset.loader(batch_size=batch_size))
+
+                def step():
+                    optimiser.zero_grad()
+                    module.training_step(next(batches), 0).backward()
+                    optimiser.step()
+
+                throughput = _throughput(step, batch_size, n_steps)
+                print(f"  {mining:<10} memory {memory_size:>4} batch {batch_size:>4}: {throughput:8.0f} triplets/s")
+
+
+if __name__ == "__main__":
+    main()
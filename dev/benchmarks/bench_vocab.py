@@ -0,0 +1,75 @@
+"""
+Cold-start time and resident memory of loading the vocabulary from JSON (`Hlm12NliTokeniserVocabReader`)
+versus the memory-mapped binary format (`Hlm12NliTokeniserBinaryVocabReader`) and the fingerprinted compiled
+vocab (`Hlm12NliTokeniserCompiledVocabReader`, already compiled), each in a fresh process.
+Linux only, as the resident memory is read from /proc.
+
+Usage:
+    python dev/benchmarks/bench_vocab.py [n_tokens]
+"""
+
+# Python Built-in Modules
+import json
+import pathlib
+import random
+import string
+import subprocess
+import sys
+import tempfile
+
+# My Packages and Modules
+from hlm12nli.tokenisation.vocab_binary import (
+    Hlm12NliTokeniserBinaryVocabWriter,
+    Hlm12NliTokeniserCompiledVocabReader,
+)
+
+_PROBE = """
+import os, sys, time
+from hlm12nli.tokenisation.vocab import Hlm12NliTokeniserVocabReader
+from hlm12nli.tokenisation.vocab_binary import Hlm12NliTokeniserBinaryVocabReader, Hlm12NliTokeniserCompiledVocabReader
+reader_cls = {
+    "json": Hlm12NliTokeniserVocabReader,
+    "binary": Hlm12NliTokeniserBinaryVocabReader,
+    "compiled": Hlm12NliTokeniserCompiledVocabReader,
+}[sys.argv[1]]
+def rss():
+    with open("/proc/self/statm") as fh:
+        return int(fh.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+before = rss()
+start = time.perf_counter()
+vocab = reader_cls(sys.argv[2]).read(do_lowercase=True)
+elapsed = time.perf_counter() - start
+hits = sum(1 for token in sys.argv[3:] if token in vocab)
+print(elapsed, (rss() - before) / 2**20, hits)
+"""
+
+
+def main() -> None:
+    n_tokens = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+    rng = random.Random(42)
+    tokens = set()
+    while len(tokens) < n_tokens:
+        piece = "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(3, 12)))
+        tokens.add(piece if rng.random() < 0.6 else "##" + piece)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        json_filepath = pathlib.Path(tmpdir) / "vocab.json"
+        bin_filepath = pathlib.Path(tmpdir) / "vocab.bin"
+        with open(json_filepath, "w", encoding="utf-8") as fh:
+            json.dump({token: index for index, token in enumerate(sorted(tokens))}, fh)
+        Hlm12NliTokeniserBinaryVocabWriter(bin_filepath).convert(json_filepath, do_lowercase=True)
+        Hlm12NliTokeniserCompiledVocabReader(json_filepath).compile(do_lowercase=True)
+        probes = rng.sample(sorted(tokens), 100)
+        print(f"{n_tokens} tokens")
+        for kind, filepath in (("json", json_filepath), ("binary", bin_filepath), ("compiled", json_filepath)):
+            result = subprocess.run(
+                [sys.executable, "-c", _PROBE, kind, str(filepath), *probes],
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+            elapsed, rss_mb, hits = result.stdout.split()
+            print(f"{kind:>8}: load {float(elapsed) * 1000:9.1f} ms, rss +{float(rss_mb):7.1f} MB, {hits} hits")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Micro-benchmark of the wordpiece engines of `Hlm12NliTokeniserSplitter` over word length.
+
+Usage:
+    python dev/benchmarks/bench_wordpiece.py
+"""
+
+# Python Built-in Modules
+import random
+import string
+import timeit
+
+# My Packages and Modules
+from hlm12nli.tokenisation.splitter import Hlm12NliTokeniserSplitter
+
+
+def _vocab(rng: random.Random, size: int = 20_000) -> dict:
+    alphabet = string.ascii_lowercase
+    tokens = {"[OOV]"}
+    tokens.update(alphabet)
+    tokens.update("##" + c for c in alphabet)
+    while len(tokens) < size:
+        piece = "".join(rng.choice(alphabet) for _ in range(rng.randint(2, 8)))
+        tokens.add(piece if rng.random() < 0.5 else "##" + piece)
+    return {t: i for i, t in enumerate(sorted(tokens))}
+
+
+def main() -> None:
+    rng = random.Random(42)
+    vocab = _vocab(rng)
+    engines = {
+        engine: Hlm12NliTokeniserSplitter(vocab=vocab, token_oov="[OOV]", expr_subword="##", engine=engine)
+        for engine in ("greedy", "trie")
+    }
+    print(f"{'word_len':>8} {'greedy_us':>10} {'trie_us':>10} {'speedup':>8}")
+    for word_len in (4, 8, 16, 32, 64, 128, 256):
+        words = ["".join(rng.choice(string.ascii_lowercase) for _ in range(word_len)) for _ in range(200)]
+        texts = [" ".join(words)]
+        timings = {}
+        for engine, splitter in engines.items():
+            assert engines["greedy"](texts) == splitter(texts)
+            number = 5
+            elapsed = min(timeit.repeat(lambda: splitter(texts), number=number, repeat=3))
+            timings[engine] = elapsed / number / len(words) * 1e6
+        speedup = timings["greedy"] / timings["trie"]
+        print(f"{word_len:>8} {timings['greedy']:>10.2f} {timings['trie']:>10.2f} {speedup:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
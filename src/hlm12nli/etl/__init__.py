@@ -0,0 +1,9 @@
+# Local Folders
+from .shards import Hlm12NliTripletShard, Hlm12NliTripletShardWriter
+from .snli import Hlm12NliSnliTripletReader
+
+__all__ = [
+    "Hlm12NliSnliTripletReader",
+    "Hlm12NliTripletShard",
+    "Hlm12NliTripletShardWriter",
+]
@@ -0,0 +1,266 @@
+# Python Built-in Modules
+import os
+import pathlib
+import struct
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Third-Party Libraries
+import numpy as np
+
+# My Packages and Modules
+from hlm12nli.tokenisation import Hlm12NliTokeniser
+from hlm12nli.tokenisation.parallel import Hlm12NliParallelTokeniser
+
+_MAGIC = b"HLM12SHD"
+_VERSION = 1
+_HEADER = struct.Struct("<8sIQQQ32s")
+
+
+def _aligned(offset: int) -> int:
+    return offset + -offset % 8
+
+
+class Hlm12NliTripletShard:
+    """
+    Read-only, memory-mapped shard of pre-tokenised triplets, as written by `Hlm12NliTripletShardWriter`.
+    Only the pages of the sentences actually read are loaded, and they are shared by every process
+    mapping the same file (e.g. the workers of a data loader).
+
+    File layout (little-endian, arrays aligned on 8 bytes):
+        header: magic (8 bytes), version (u32), number of sentences n (u64), number of tokens t (u64),
+            number of triplets k (u64), sha256 digest of the tokeniser fingerprint (32 bytes)
+        tokens: t x i32, the token ids of every sentence, enveloped by the start and end tokens, concatenated
+        offsets: (n + 1) x i64, the start of each sentence in `tokens`
+        triplets: k x 3 x i32, the anchor, positive and negative sentence of each triplet
+
+    Attributes:
+        filepath: pathlib.Path
+            The path to the shard file.
+        fingerprint: str
+            The fingerprint of the tokeniser the sentences were tokenised with.
+        tokens: np.ndarray
+            The token ids of every sentence, concatenated.
+        offsets: np.ndarray
+            The start of each sentence in `tokens`, followed by the total number of tokens.
+        triplets: np.ndarray
+            The sentence indices of each triplet, of shape [n_triplets, 3].
+    """
+
+    filepath: pathlib.Path
+    fingerprint: str
+    tokens: np.ndarray
+    offsets: np.ndarray
+    triplets: np.ndarray
+
+    def __init__(self, filepath: pathlib.Path) -> None:
+        """
+        Maps a shard file.
+
+        Args:
+            filepath: pathlib.Path
+                The path to the shard file.
+        """
+        self.filepath = pathlib.Path(filepath)
+        mm = np.memmap(self.filepath, dtype=np.uint8, mode="r")
+        if mm.size < _HEADER.size:
+            raise ValueError(f"{self.filepath} is not a triplet shard file.")
+        magic, version, n_sentences, n_tokens, n_triplets, digest = _HEADER.unpack_from(mm, 0)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError(f"{self.filepath} is not a triplet shard file of version {_VERSION}.")
+        self.fingerprint = digest.hex()
+        start = _aligned(_HEADER.size)
+        self.tokens = mm[start : start + 4 * n_tokens].view(np.int32)
+        start = _aligned(start + 4 * n_tokens)
+        self.offsets = mm[start : start + 8 * (n_sentences + 1)].view(np.int64)
+        start += 8 * (n_sentences + 1)
+        self.triplets = mm[start : start + 12 * n_triplets].view(np.int32).reshape(n_triplets, 3)
+
+    def __reduce__(self):
+        return type(self), (self.filepath,)
+
+    def __len__(self) -> int:
+        return len(self.triplets)
+
+    @property
+    def n_sentences(self) -> int:
+        """
+        Returns the number of distinct sentences in the shard.
+        """
+        return len(self.offsets) - 1
+
+    def sentence(self, index: int) -> np.ndarray:
+        """
+        Returns the token ids of a sentence, enveloped by the start and end tokens.
+        """
+        return self.tokens[self.offsets[index] : self.offsets[index + 1]]
+
+    def gather(self, sentences: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Reads the token ids of several sentences at once.
+
+        Args:
+            sentences: np.ndarray
+                The indices of the sentences.
+
+        Returns:
+            The token ids of the sentences, concatenated, and the length of each sentence.
+        """
+        starts = self.offsets[sentences]
+        lengths = self.offsets[sentences + 1] - starts
+        ends = np.cumsum(lengths)
+        positions = np.arange(ends[-1] if len(ends) else 0) + np.repeat(starts - (ends - lengths), lengths)
+        return self.tokens[positions], lengths
+
+
+class Hlm12NliTripletShardWriter:
+    """
+    Tokenises triplets of sentences once, ahead of training, into compact shards of token ids
+    (see `Hlm12NliTripletShard` for the layout), so that training epochs never run the tokeniser.
+
+    Sentences are deduplicated within a shard (e.g. a premise shared by several triplets is stored once),
+    truncated as the tokeniser does, and stored without padding. Each shard records the fingerprint of
+    the tokeniser, so that readers can refuse shards tokenised with another configuration.
+
+    Attributes:
+        dirpath: pathlib.Path
+            The directory receiving the `shard-XXXXX.bin` files.
+        tokeniser: Hlm12NliTokeniser
+            The tokeniser producing the token ids.
+        shard_size: int
+            The number of triplets per shard.
+        chunk_size: int
+            The number of sentences tokenised at once.
+        processes: int
+            The number of processes tokenising the sentences.
+        filepaths: List[pathlib.Path]
+            The shards written so far.
+    """
+
+    FILENAME_PATTERN = "shard-{index:05d}.bin"
+
+    dirpath: pathlib.Path
+    tokeniser: Hlm12NliTokeniser
+    shard_size: int
+    chunk_size: int
+    processes: int
+    filepaths: List[pathlib.Path]
+
+    def __init__(
+        self,
+        dirpath: pathlib.Path,
+        tokeniser: Hlm12NliTokeniser,
+        shard_size: int = 100_000,
+        chunk_size: int = 4096,
+        processes: int = 1,
+    ) -> None:
+        """
+        Constructs a new Hlm12NliTripletShardWriter, removing the shards previously written to `dirpath`.
+
+        Args:
+            dirpath: pathlib.Path
+                The directory receiving the shards, created if needed.
+            tokeniser: Hlm12NliTokeniser
+                The tokeniser producing the token ids.
+            shard_size: int
+                The number of triplets per shard.
+            chunk_size: int
+                The number of sentences tokenised at once.
+            processes: int
+                The number of processes tokenising the sentences, see `Hlm12NliParallelTokeniser`.
+        """
+        if shard_size < 1 or chunk_size < 1:
+            raise ValueError(f"shard_size and chunk_size must be positive, got {shard_size} and {chunk_size}.")
+        self.dirpath = pathlib.Path(dirpath)
+        self.tokeniser = tokeniser
+        self.shard_size = shard_size
+        self.chunk_size = chunk_size
+        self.processes = processes
+        self.filepaths = []
+        self._digest = bytes.fromhex(tokeniser.fingerprint())
+        self._sentences: Dict[str, int] = {}
+        self._triplets: List[Tuple[int, int, int]] = []
+        self._parallel: Optional[Hlm12NliParallelTokeniser] = None
+        if processes > 1:
+            self._parallel = Hlm12NliParallelTokeniser(
+                tokeniser, processes=processes, shard_size=chunk_size, min_parallel_size=2 * chunk_size
+            )
+        self.dirpath.mkdir(parents=True, exist_ok=True)
+        for filepath in self.dirpath.glob("shard-*.bin"):
+            filepath.unlink()
+
+    def __enter__(self) -> "Hlm12NliTripletShardWriter":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def add(self, anchor: str, positive: str, negative: str) -> None:
+        """
+        Adds a triplet, writing the current shard once it holds `shard_size` triplets.
+        """
+        self._triplets.append((self._sentence(anchor), self._sentence(positive), self._sentence(negative)))
+        if len(self._triplets) >= self.shard_size:
+            self._flush()
+
+    def write(self, triplets: Iterable[Tuple[str, str, str]]) -> List[pathlib.Path]:
+        """
+        Adds every triplet, then writes the last shard.
+
+        Args:
+            triplets: Iterable[Tuple[str, str, str]]
+                The anchor, positive and negative sentence of each triplet,
+                e.g. a `Hlm12NliSnliTripletReader`.
+
+        Returns:
+            The paths to the shards written.
+        """
+        for anchor, positive, negative in triplets:
+            self.add(anchor, positive, negative)
+        self.close()
+        return self.filepaths
+
+    def close(self) -> None:
+        """
+        Writes the pending triplets, if any, and terminates the tokenising processes.
+        """
+        if self._triplets:
+            self._flush()
+        if self._parallel is not None:
+            self._parallel.close()
+
+    def _sentence(self, text: str) -> int:
+        index = self._sentences.get(text)
+        if index is None:
+            index = self._sentences[text] = len(self._sentences)
+        return index
+
+    def _tokenise(self, texts: List[str]) -> Iterable[Tuple[np.ndarray, np.ndarray]]:
+        if self._parallel is not None:
+            outputs = self._parallel.iter_tokenise_ids(texts)
+        else:
+            outputs = (
+                self.tokeniser.tokenise_ids(texts[start : start + self.chunk_size], dtype=np.int32)
+                for start in range(0, len(texts), self.chunk_size)
+            )
+        for output in outputs:
+            yield output.encoded_tokens[output.mask], output.lengths
+
+    def _flush(self) -> None:
+        chunks = list(self._tokenise(list(self._sentences)))
+        tokens = np.concatenate([tokens for tokens, _ in chunks]).astype(np.int32, copy=False)
+        offsets = np.zeros(len(self._sentences) + 1, dtype=np.int64)
+        np.cumsum(np.concatenate([lengths for _, lengths in chunks]), out=offsets[1:])
+        triplets = np.asarray(self._triplets, dtype=np.int32).reshape(-1, 3)
+        filepath = self.dirpath / self.FILENAME_PATTERN.format(index=len(self.filepaths))
+        header = _HEADER.pack(_MAGIC, _VERSION, len(offsets) - 1, len(tokens), len(triplets), self._digest)
+        tmp_filepath = filepath.with_suffix(".tmp")
+        with open(tmp_filepath, "wb") as fh:
+            fh.write(header.ljust(_aligned(len(header)), b"\0"))
+            fh.write(tokens.tobytes())
+            fh.write(b"\0" * (-tokens.nbytes % 8))
+            fh.write(offsets.tobytes())
+            fh.write(triplets.tobytes())
+        os.replace(tmp_filepath, filepath)
+        self.filepaths.append(filepath)
+        self._sentences = {}
+        self._triplets = []
@@ -0,0 +1,62 @@
+# Python Built-in Modules
+import json
+import pathlib
+from typing import Iterator, List, Tuple
+
+
+class Hlm12NliSnliTripletReader:
+    """
+    Reads the `(premise, entailed hypothesis, contradicted hypothesis)` triplets out of an SNLI
+    (or MultiNLI) jsonl file, as used to train the encoder with a triplet loss.
+
+    Each premise is paired with every hypothesis it entails and every hypothesis it contradicts,
+    ignoring neutral pairs and pairs without a gold label. The file is streamed: the pairs of a premise
+    must be consecutive, as they are in the distributed SNLI files.
+
+    Attributes:
+        filepath: pathlib.Path
+            The path to the jsonl file.
+    """
+
+    LABEL_ENTAILMENT = "entailment"
+    LABEL_CONTRADICTION = "contradiction"
+
+    filepath: pathlib.Path
+
+    def __init__(self, filepath: pathlib.Path) -> None:
+        """
+        Constructs a new Hlm12NliSnliTripletReader.
+
+        Args:
+            filepath: pathlib.Path
+                The path to the jsonl file, e.g. `snli_1.0_train.jsonl`.
+        """
+        self.filepath = pathlib.Path(filepath)
+
+    def __iter__(self) -> Iterator[Tuple[str, str, str]]:
+        return self.read()
+
+    def read(self) -> Iterator[Tuple[str, str, str]]:
+        """
+        Yields the triplets of the file, in order.
+        """
+        premise, entailed, contradicted = None, [], []
+        with open(self.filepath, "r", encoding="utf-8") as fh:
+            for line in fh:
+                if not line.strip():
+                    continue
+                pair = json.loads(line)
+                if pair["sentence1"] != premise:
+                    yield from self._triplets(premise, entailed, contradicted)
+                    premise, entailed, contradicted = pair["sentence1"], [], []
+                if pair["gold_label"] == self.LABEL_ENTAILMENT:
+                    entailed.append(pair["sentence2"])
+                elif pair["gold_label"] == self.LABEL_CONTRADICTION:
+                    contradicted.append(pair["sentence2"])
+        yield from self._triplets(premise, entailed, contradicted)
+
+    @staticmethod
+    def _triplets(premise: str, entailed: List[str], contradicted: List[str]) -> Iterator[Tuple[str, str, str]]:
+        for positive in entailed:
+            for negative in contradicted:
+                yield premise, positive, negative
@@ -0,0 +1,164 @@
+# Python Built-in Modules
+import warnings
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
+
+# Third-Party Libraries
+import torch
+
+# My Packages and Modules
+from hlm12nli.tokenisation import Hlm12NliTokeniser, Hlm12NliTokeniserIdsOutput
+
+# Local Folders
+from .encoder import Hlm12NliEncoder
+
+
+def warn_if_padding_dependent(encoder: Hlm12NliEncoder) -> None:
+    """
+    Warns if the embeddings of the encoder depend on the padding of the batch, i.e. if it is bidirectional and
+    does not pack its sequences, so that texts batched with longer ones are not embedded as they are alone.
+    Called by every front-end that batches texts of different lengths.
+    """
+    config = encoder.config
+    if config.hidden_state_bidirectional and not config.pack_sequences:
+        warnings.warn(
+            "The encoder is bidirectional and does not pack its sequences, so the embeddings depend on the "
+            "padding of each batch. Set pack_sequences=True for batch-invariant embeddings.",
+            UserWarning,
+            stacklevel=3,
+        )
+
+
+class Hlm12NliBucketBatcher:
+    """
+    Inference front-end that groups texts of similar tokenised length into the same batch, so that
+    short texts do not pay for the padding of long ones. Batches are formed under a budget of
+    padded tokens (rows x padded length) rather than a fixed number of rows, and the results are
+    returned in the original order of the texts.
+
+    The texts are consumed in windows of `window_size`, which bounds the memory used to sort them.
+
+    The embeddings only match those of the texts encoded one at a time if the encoder packs its sequences,
+    or is unidirectional: the backward pass of a bidirectional LSTM reads the padding otherwise, so the
+    embedding of a text would depend on the batch it lands in. `encode` warns in that case, as do the other
+    front-ends batching texts of different lengths (see `warn_if_padding_dependent`).
+
+    Attributes:
+        tokeniser: Hlm12NliTokeniser
+            The tokeniser used to measure and encode the texts.
+        max_batch_tokens: int
+            The maximum number of padded tokens (rows x padded length) per batch.
+        max_batch_size: int | None
+            The maximum number of rows per batch, if any.
+        window_size: int
+            The number of texts sorted together before being batched.
+    """
+
+    tokeniser: Hlm12NliTokeniser
+    max_batch_tokens: int
+    max_batch_size: Optional[int]
+    window_size: int
+
+    def __init__(
+        self,
+        tokeniser: Hlm12NliTokeniser,
+        max_batch_tokens: int = 8192,
+        max_batch_size: Optional[int] = None,
+        window_size: int = 4096,
+    ) -> None:
+        """
+        Constructs a new Hlm12NliBucketBatcher.
+
+        Args:
+            tokeniser: Hlm12NliTokeniser
+                The tokeniser used to measure and encode the texts.
+            max_batch_tokens: int
+                The maximum number of padded tokens (rows x padded length) per batch. A single text longer
+                than the budget still forms a batch on its own.
+            max_batch_size: int | None
+                The maximum number of rows per batch, if any.
+            window_size: int
+                The number of texts sorted together before being batched.
+        """
+        if max_batch_tokens < 1:
+            raise ValueError(f"max_batch_tokens must be positive, got {max_batch_tokens}.")
+        if window_size < 1:
+            raise ValueError(f"window_size must be positive, got {window_size}.")
+        self.tokeniser = tokeniser
+        self.max_batch_tokens = max_batch_tokens
+        self.max_batch_size = max_batch_size
+        self.window_size = window_size
+
+    def plan(self, lengths: Sequence[int]) -> List[List[int]]:
+        """
+        Sorts the sequences by length and groups them into batches under the token budget.
+
+        Args:
+            lengths: Sequence[int]
+                The padded-to-be length of each sequence.
+
+        Returns:
+            The indices of the sequences in each batch.
+        """
+        fixed_len = self.tokeniser.seq_len
+        batches, batch = [], []
+        for index in sorted(range(len(lengths)), key=lengths.__getitem__):
+            width = fixed_len if fixed_len is not None else lengths[index]
+            full_rows = self.max_batch_size is not None and len(batch) >= self.max_batch_size
+            if batch and (full_rows or (len(batch) + 1) * width > self.max_batch_tokens):
+                batches.append(batch)
+                batch = []
+            batch.append(index)
+        if batch:
+            batches.append(batch)
+        return batches
+
+    def batches(self, texts: Iterable[str]) -> Iterator[Tuple[List[int], Hlm12NliTokeniserIdsOutput]]:
+        """
+        Tokenises the texts into length-bucketed batches.
+
+        Args:
+            texts: Iterable[str]
+                The texts, consumed lazily in windows of `window_size`.
+
+        Returns:
+            An iterator over the positions of the texts of each batch (in the input stream) and the tokenised batch.
+        """
+        offset = 0
+        for window in self._windows(texts):
+            rows = self.tokeniser.split_ids(window)
+            lengths = [self.tokeniser.sequence_length(len(row)) for row in rows]
+            for batch in self.plan(lengths):
+                yield [offset + i for i in batch], self.tokeniser.pad_ids([rows[i] for i in batch])
+            offset += len(window)
+
+    def encode(self, encoder: Hlm12NliEncoder, texts: Iterable[str]) -> Iterator[torch.Tensor]:
+        """
+        Encodes the texts in length-bucketed batches, without tracking gradients.
+
+        Args:
+            encoder: Hlm12NliEncoder
+                The encoder to run on each batch.
+            texts: Iterable[str]
+                The texts, consumed lazily in windows of `window_size`.
+
+        Returns:
+            An iterator over the embedding of each text, in the input order.
+        """
+        warn_if_padding_dependent(encoder)
+        for window in self._windows(texts):
+            results: List[Optional[torch.Tensor]] = [None] * len(window)
+            for positions, x in self.batches(window):
+                with torch.inference_mode():
+                    y = encoder(x)
+                for row, position in enumerate(positions):
+                    results[position] = y.embeddings[row]
+            yield from results
+
+    def _windows(self, texts: Iterable[str]) -> Iterator[List[str]]:
+        iterator = iter(texts)
+        while True:
+            window = list(islice(iterator, self.window_size))
+            if not window:
+                return
+            yield window
@@ -27,9 +27,20 @@ class Hlm12NliConfig(NestMLTextEncoderConfigBase):
             The dropout rate of the multi-head attention layer.
         output_dims: int
             The number of output dimensions, inherited from `NestMLEncoderConfigBase`
+        pack_sequences: bool
+            Whether to pack the sequences by their length before the LSTM layer, skipping the padding positions
+            and making the outputs independent of the padded width of the batch.
+        pooling: str
+            The strategy reducing the token representations into the sentence embedding,
+            one of "mean", "max", "first" or "attention".
+        output_last_hidden_state: bool
+            Whether the output should carry the per-token hidden states besides the pooled embeddings.
     """
 
     token_vec_dims: int = field()
     token_id_pad: int = field()
     attn_heads: int = field()
     attn_dropout: float = field()
+    pack_sequences: bool = field(default=False)
+    pooling: str = field(default="mean")
+    output_last_hidden_state: bool = field(default=True)
@@ -0,0 +1,193 @@
+# Python Built-in Modules
+from dataclasses import dataclass, field
+from typing import Dict, List, Sequence, Tuple
+
+# Third-Party Libraries
+import numpy as np
+import torch
+
+# My Packages and Modules
+from hlm12nli.profiling import stage
+from hlm12nli.tokenisation import Hlm12NliTokeniser
+
+# Local Folders
+from .batching import Hlm12NliBucketBatcher
+from .encoder import Hlm12NliEncoder
+
+
+@dataclass(frozen=True)
+class Hlm12NliDedupeStats:
+    """
+    Snapshot of the counters of a `Hlm12NliDedupingEncoder`.
+
+    Attributes:
+        texts: int
+            The number of texts requested.
+        unique: int
+            The number of texts actually encoded, after deduplication within each call.
+    """
+
+    texts: int = field()
+    unique: int = field()
+
+    @property
+    def dedupe_ratio(self) -> float:
+        """
+        Returns the number of texts requested per text encoded, i.e. how many times less encoder work was done.
+        """
+        return self.texts / self.unique if self.unique else 1.0
+
+    @property
+    def saved(self) -> float:
+        """
+        Returns the ratio of the requested texts that did not need to be encoded.
+        """
+        return 1.0 - self.unique / self.texts if self.texts else 0.0
+
+
+class Hlm12NliDedupingEncoder:
+    """
+    Inference front-end that encodes each distinct text of a call once, e.g. a premise scored against
+    many hypotheses, and scatters the embeddings back to every position the text appeared at.
+
+    Texts are deduplicated on the same normalised form as `Hlm12NliEmbeddingStore` (whitespace collapsed and,
+    if the tokeniser lowercases, lowercased), which the tokeniser maps to the same token ids. The distinct texts
+    are encoded in length-bucketed batches; unless the encoder packs its sequences, their embeddings may differ
+    slightly from those of the same texts encoded in other batches.
+
+    Attributes:
+        tokeniser: Hlm12NliTokeniser
+            The tokeniser used to encode the texts.
+        encoder: Hlm12NliEncoder
+            The encoder producing the embeddings.
+        batcher: Hlm12NliBucketBatcher
+            The batcher grouping the distinct texts by length.
+    """
+
+    tokeniser: Hlm12NliTokeniser
+    encoder: Hlm12NliEncoder
+    batcher: Hlm12NliBucketBatcher
+
+    def __init__(self, tokeniser: Hlm12NliTokeniser, encoder: Hlm12NliEncoder, max_batch_tokens: int = 8192) -> None:
+        """
+        Constructs a new Hlm12NliDedupingEncoder.
+
+        Args:
+            tokeniser: Hlm12NliTokeniser
+                The tokeniser used to encode the texts.
+            encoder: Hlm12NliEncoder
+                The encoder producing the embeddings, in evaluation mode.
+            max_batch_tokens: int
+                The maximum number of padded tokens per forward pass.
+        """
+        self.tokeniser = tokeniser
+        self.encoder = encoder
+        self.batcher = Hlm12NliBucketBatcher(tokeniser, max_batch_tokens=max_batch_tokens)
+        self.texts = 0
+        self.unique = 0
+
+    def __call__(self, texts: Sequence[str]) -> np.ndarray:
+        return self.encode(texts)
+
+    def key(self, text: str) -> str:
+        """
+        Returns the normalised form of a text, equal for texts that produce the same token ids.
+        """
+        text = " ".join(text.split())
+        return text.lower() if self.tokeniser.do_lowercase else text
+
+    def deduplicate(self, texts: Sequence[str]) -> Tuple[List[str], np.ndarray]:
+        """
+        Finds the distinct texts of a batch.
+
+        Args:
+            texts: Sequence[str]
+                The texts.
+
+        Returns:
+            The distinct texts, in order of first appearance, and the index of each text among them,
+            so that `distinct[inverse[i]]` normalises like `texts[i]`.
+        """
+        positions: Dict[str, int] = {}
+        distinct: List[str] = []
+        inverse = np.empty(len(texts), dtype=np.int64)
+        with stage("encoder.dedupe", items=len(texts)):
+            for i, text in enumerate(texts):
+                key = self.key(text)
+                position = positions.get(key)
+                if position is None:
+                    position = positions[key] = len(distinct)
+                    distinct.append(text)
+                inverse[i] = position
+        return distinct, inverse
+
+    def encode(self, texts: Sequence[str]) -> np.ndarray:
+        """
+        Returns the embeddings of the texts, encoding each distinct text once.
+
+        Args:
+            texts: Sequence[str]
+                The texts to embed.
+
+        Returns:
+            The embeddings, of shape [len(texts), output_dims].
+        """
+        distinct, inverse = self.deduplicate(texts)
+        return self._encode(distinct, len(texts))[inverse]
+
+    def encode_pairs(self, premises: Sequence[str], hypotheses: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the embeddings of the premises and the hypotheses of sentence pairs, encoding each distinct text
+        once across both sides.
+
+        Args:
+            premises: Sequence[str]
+                The first sentence of each pair.
+            hypotheses: Sequence[str]
+                The second sentence of each pair.
+
+        Returns:
+            The embeddings of the premises and of the hypotheses, each of shape [n_pairs, output_dims].
+        """
+        self._check_pairs(premises, hypotheses)
+        embeddings = self.encode(list(premises) + list(hypotheses))
+        return embeddings[: len(premises)], embeddings[len(premises) :]
+
+    def score_pairs(self, premises: Sequence[str], hypotheses: Sequence[str]) -> np.ndarray:
+        """
+        Returns the cosine similarity of the embeddings of each sentence pair, normalising each distinct
+        embedding once rather than once per pair.
+
+        Args:
+            premises: Sequence[str]
+                The first sentence of each pair.
+            hypotheses: Sequence[str]
+                The second sentence of each pair.
+
+        Returns:
+            The similarity of each pair, of shape [n_pairs].
+        """
+        self._check_pairs(premises, hypotheses)
+        distinct, inverse = self.deduplicate(list(premises) + list(hypotheses))
+        embeddings = self._encode(distinct, len(inverse))
+        embeddings /= np.maximum(np.linalg.norm(embeddings, axis=1, keepdims=True), 1e-12)
+        left, right = inverse[: len(premises)], inverse[len(premises) :]
+        return np.einsum("ij,ij->i", embeddings[left], embeddings[right])
+
+    def stats(self) -> Hlm12NliDedupeStats:
+        """
+        Returns a snapshot of the number of texts requested and encoded so far.
+        """
+        return Hlm12NliDedupeStats(texts=self.texts, unique=self.unique)
+
+    def _encode(self, distinct: List[str], n_texts: int) -> np.ndarray:
+        self.texts += n_texts
+        self.unique += len(distinct)
+        if not distinct:
+            return np.empty((0, self.encoder.config.output_dims), dtype=np.float32)
+        return torch.stack(list(self.batcher.encode(self.encoder, distinct))).float().cpu().numpy()
+
+    @staticmethod
+    def _check_pairs(premises: Sequence[str], hypotheses: Sequence[str]) -> None:
+        if len(premises) != len(hypotheses):
+            raise ValueError(f"Expected as many premises as hypotheses, got {len(premises)} and {len(hypotheses)}.")
@@ -0,0 +1,216 @@
+# Python Built-in Modules
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+# Third-Party Libraries
+import numpy as np
+import torch
+
+# My Packages and Modules
+from hlm12nli.profiling import stage
+from hlm12nli.tokenisation import Hlm12NliTokeniser
+
+# Local Folders
+from .batching import warn_if_padding_dependent
+from .encoder import Hlm12NliEncoder
+
+
+class Hlm12NliDocumentEncoder:
+    """
+    Inference front-end embedding documents longer than the encoder's window. The subtoken ids of each
+    document are split into overlapping windows of `window_size` tokens (start and end tokens included), the
+    windows are encoded in batches of at most `max_batch_windows`, and their embeddings are combined into one
+    embedding per document. The encoder's activations, dominated by the attention over each window, are thus
+    bounded by the window size and the batch of windows rather than by the length of the documents. Documents
+    are tokenised as a stream (see `windows`), and only one embedding per window is kept per document.
+
+    Windows advance by `window_size - 2 - overlap` tokens and the last window is aligned with the end of the
+    document, so every window but the first is preceded by at least `overlap` tokens of context. Each window is
+    weighted by the number of tokens it covers that no earlier window did, so that overlaps are not counted twice.
+    Combination strategies:
+        "mean": the weighted mean of the window embeddings.
+        "attention": a softmax over the windows of the cosine similarity between each window embedding and the
+            weighted mean (scaled by `1 / temperature`, with the weights as a prior), emphasising the windows
+            most representative of the document. It has no parameters, so it needs no training.
+
+    Documents that fit in a single window are embedded exactly as by the encoder alone.
+
+    Attributes:
+        tokeniser: Hlm12NliTokeniser
+            The tokeniser splitting the documents into subtoken ids.
+        encoder: Hlm12NliEncoder
+            The encoder producing the window embeddings.
+        window_size: int
+            The number of tokens per window, start and end tokens included.
+        overlap: int
+            The number of tokens shared by consecutive windows.
+        combine: str
+            The combination strategy, "mean" or "attention".
+        temperature: float
+            The temperature of the softmax of the "attention" strategy.
+        max_batch_windows: int
+            The maximum number of windows encoded per forward pass.
+    """
+
+    COMBINE_STRATEGIES = ("mean", "attention")
+    CHUNK_CHARS = 1 << 16
+
+    tokeniser: Hlm12NliTokeniser
+    encoder: Hlm12NliEncoder
+    window_size: int
+    overlap: int
+    combine: str
+    temperature: float
+    max_batch_windows: int
+
+    def __init__(
+        self,
+        tokeniser: Hlm12NliTokeniser,
+        encoder: Hlm12NliEncoder,
+        window_size: Optional[int] = None,
+        overlap: Optional[int] = None,
+        combine: str = "mean",
+        temperature: float = 0.1,
+        max_batch_windows: int = 32,
+    ) -> None:
+        """
+        Constructs a new Hlm12NliDocumentEncoder.
+
+        Args:
+            tokeniser: Hlm12NliTokeniser
+                The tokeniser splitting the documents into subtoken ids.
+            encoder: Hlm12NliEncoder
+                The encoder producing the window embeddings, in evaluation mode.
+            window_size: int | None
+                The number of tokens per window, start and end tokens included, at most the tokeniser's
+                `seq_len` (or `max_seq_len`), which it defaults to.
+            overlap: int | None
+                The number of tokens shared by consecutive windows, a quarter of the window by default.
+            combine: str
+                The combination strategy, "mean" or "attention".
+            temperature: float
+                The temperature of the softmax of the "attention" strategy.
+            max_batch_windows: int
+                The maximum number of windows encoded per forward pass.
+        """
+        limit = tokeniser.seq_len or tokeniser.max_seq_len
+        window_size = window_size or limit
+        overlap = overlap if overlap is not None else window_size // 4
+        if not 3 <= window_size <= limit:
+            raise ValueError(f"window_size must be between 3 and the tokeniser's {limit} tokens, got {window_size}.")
+        if not 0 <= overlap < window_size - 2:
+            raise ValueError(f"overlap must be between 0 and {window_size - 3} tokens, got {overlap}.")
+        if combine not in self.COMBINE_STRATEGIES:
+            raise ValueError(f"Unknown combination strategy '{combine}', expected one of {self.COMBINE_STRATEGIES}.")
+        if temperature <= 0 or max_batch_windows < 1:
+            raise ValueError(
+                f"temperature and max_batch_windows must be positive, got {temperature}, {max_batch_windows}."
+            )
+        self.tokeniser = tokeniser
+        self.encoder = encoder
+        self.window_size = window_size
+        self.overlap = overlap
+        self.combine = combine
+        self.temperature = temperature
+        self.max_batch_windows = max_batch_windows
+
+    def __call__(self, documents: Sequence[str]) -> np.ndarray:
+        return self.encode(documents)
+
+    def windows(self, document: str) -> Iterator[Tuple[int, List[int], int]]:
+        """
+        Splits a document into windows of subtoken ids. The document is tokenised in chunks of
+        `CHUNK_CHARS` characters cut at whitespace (which subtokens never cross), and only the ids still needed
+        by the next windows are kept, so that memory does not grow with the length of the document.
+
+        Args:
+            document: str
+                The document to split.
+
+        Returns:
+            An iterator over the start of each window in the stream of subtoken ids, its subtoken ids (without
+            start and end tokens) and its weight, the number of tokens it covers that no earlier window did.
+        """
+        content = self.window_size - 2
+        step = content - self.overlap
+        buffer: List[int] = []
+        offset = start = covered = 0
+        for chunk in self._chunks(document):
+            buffer.extend(chunk)
+            total = offset + len(buffer)
+            while total - start >= content:
+                yield start, buffer[start - offset : start - offset + content], start + content - covered
+                covered = start + content
+                start += step
+            keep = min(start, total - content)
+            if keep > offset:
+                del buffer[: keep - offset]
+                offset = keep
+        total = offset + len(buffer)
+        if covered == 0:
+            yield 0, buffer, max(total, 1)
+        elif covered < total:
+            yield total - content, buffer[-content:], total - covered
+
+    def encode(self, documents: Sequence[str]) -> np.ndarray:
+        """
+        Returns the embeddings of the documents, encoding the windows of every document together.
+
+        Args:
+            documents: Sequence[str]
+                The documents to embed.
+
+        Returns:
+            The embeddings, of shape [len(documents), output_dims].
+        """
+        warn_if_padding_dependent(self.encoder)
+        dims = self.encoder.config.output_dims
+        embeddings: List[List[np.ndarray]] = [[] for _ in documents]
+        weights: List[List[int]] = [[] for _ in documents]
+        rows, owners = [], []
+        for document, row, weight in self._windows(documents):
+            rows.append(row)
+            owners.append(document)
+            weights[document].append(weight)
+            if len(rows) == self.max_batch_windows:
+                self._encode_windows(rows, owners, embeddings)
+                rows, owners = [], []
+        if rows:
+            self._encode_windows(rows, owners, embeddings)
+        output = np.empty((len(documents), dims), dtype=np.float32)
+        with stage("encoder.combine", items=len(documents)):
+            for document in range(len(documents)):
+                output[document] = self._combine(np.stack(embeddings[document]), np.asarray(weights[document]))
+        return output
+
+    def _windows(self, documents: Sequence[str]) -> Iterator[Tuple[int, List[int], int]]:
+        for document, text in enumerate(documents):
+            for _, ids, weight in self.windows(text):
+                yield document, ids, weight
+
+    def _chunks(self, document: str) -> Iterator[List[int]]:
+        start = 0
+        while start < len(document):
+            end = min(start + self.CHUNK_CHARS, len(document))
+            while end < len(document) and not document[end].isspace():
+                end += 1
+            (ids,) = self.tokeniser.split_ids([document[start:end]])
+            yield ids
+            start = end
+
+    def _encode_windows(self, rows: List[List[int]], owners: List[int], embeddings: List[List[np.ndarray]]) -> None:
+        x = self.tokeniser.pad_ids(rows)
+        with torch.inference_mode():
+            y = self.encoder(x).embeddings.float().cpu().numpy()
+        for owner, embedding in zip(owners, y):
+            embeddings[owner].append(embedding)
+
+    def _combine(self, embeddings: np.ndarray, weights: np.ndarray) -> np.ndarray:
+        weights = weights / weights.sum()
+        mean = weights @ embeddings
+        if self.combine == "mean" or len(embeddings) == 1:
+            return mean
+        norms = np.maximum(np.linalg.norm(embeddings, axis=1), 1e-12)
+        scores = embeddings @ mean / (norms * max(np.linalg.norm(mean), 1e-12)) / self.temperature
+        scores += np.log(weights)
+        attention = np.exp(scores - scores.max())
+        return (attention / attention.sum()) @ embeddings
@@ -1,13 +1,18 @@
+# Python Built-in Modules
+from typing import Optional, Tuple
+
 # Third-Party Libraries
 import torch
 from nest_ml.text import NestMLTextEncoderModelBase
 
 # My Packages and Modules
+from hlm12nli.profiling import stage
 from hlm12nli.tokenisation import Hlm12NliTokeniserOutput
 
 # Local Folders
 from .config import Hlm12NliConfig
 from .output import Hlm12NliOutput
+from .pooling import Hlm12NliPooling
 
 
 class Hlm12NliEncoder(
@@ -30,6 +35,12 @@ class Hlm12NliEncoder(
         layer_norm: torch.nn.LayerNorm
             The layer normalization layer, responsible for normalizing the sum of the lstm representations with the
             multi-headed attention weights.
+        pooling: Hlm12NliPooling
+            The pooling layer, reducing the token representations into a single vector per sentence.
+        linear: torch.nn.Linear
+            The output projection layer, applied to the pooled representation.
+        lstm_output_dims: int
+            The number of dimensions of the LSTM outputs, twice `hidden_state_dims` when bidirectional.
     """
 
     def __init__(self, config: Hlm12NliConfig):
@@ -42,6 +53,7 @@ class Hlm12NliEncoder(
         """
         torch.nn.Module.__init__(self)
         NestMLTextEncoderModelBase.__init__(self, config=config)
+        self.lstm_output_dims = config.hidden_state_dims * (2 if config.hidden_state_bidirectional else 1)
         self.embeddings = torch.nn.Embedding(
             num_embeddings=config.vocab_size,
             embedding_dim=config.token_vec_dims,
@@ -54,16 +66,20 @@ class Hlm12NliEncoder(
             batch_first=True,
         )
         self.mha = torch.nn.MultiheadAttention(
-            embed_dim=config.hidden_state_dims,
+            embed_dim=self.lstm_output_dims,
             num_heads=config.attn_heads,
             dropout=config.attn_dropout,
             batch_first=True,
         )
         self.layer_norm = torch.nn.LayerNorm(
-            normalized_shape=config.hidden_state_dims,
+            normalized_shape=self.lstm_output_dims,
+        )
+        self.pooling = Hlm12NliPooling(
+            strategy=config.pooling,
+            dims=self.lstm_output_dims,
         )
         self.linear = torch.nn.Linear(
-            in_features=config.hidden_state_dims,
+            in_features=self.lstm_output_dims,
             out_features=config.output_dims,
         )
 
@@ -72,17 +88,70 @@ class Hlm12NliEncoder(
         """
         Returns the device that the model is currently on.
         """
-        return next(self.parameters()).device
+        return self.embeddings.weight.device
 
     def forward(
         self,
         x: Hlm12NliTokeniserOutput,
     ) -> Hlm12NliOutput:
-        x = x.encoded_tokens_to_tensor(device=self.device)
-        y = self.embeddings(x)
-        y, _ = self.lstm(y)
-        attn, _ = self.mha(y, y, y, key_padding_mask=x.mask_to_tensor(device=self.device))
-        y = y + attn
-        y = self.layer_norm(y)
-        y = self.linear(y)
+        device = self.device
+        with stage("encoder.forward", items=len(x.encoded_tokens)):
+            ids = x.encoded_tokens_to_tensor(device=device, non_blocking=True)
+            mask = x.mask_to_tensor(device=device, non_blocking=True)
+            lengths = x.lengths_to_tensor() if self.config.pack_sequences else None
+            embeddings, y = self.forward_tensors(ids, mask, lengths)
+        return Hlm12NliOutput(
+            embeddings=embeddings,
+            last_hidden_state=y if self.config.output_last_hidden_state else None,
+        )
+
+    def forward_tensors(
+        self,
+        ids: torch.Tensor,
+        mask: torch.Tensor,
+        lengths: Optional[torch.Tensor] = None,
+    ) -> Tuple[torch.Tensor, torch.Tensor]:
+        """
+        Encodes token ids already on the model's device, the tensor-only path used for exporting the model.
+
+        Args:
+            ids: torch.Tensor
+                The padded token ids, of shape [batch_size, seq_len].
+            mask: torch.Tensor
+                The boolean mask of the non-padding positions, of shape [batch_size, seq_len].
+            lengths: torch.Tensor | None
+                The length of each sequence, on the CPU, used when packing sequences. Computed from the mask if None.
+
+        Returns:
+            The embeddings, of shape [batch_size, output_dims], and the last hidden state.
+        """
+        with stage("encoder.embeddings", items=ids.numel()) as span:
+            y = self.embeddings(ids)
+            span.add(nbytes=y.element_size() * y.nelement())
+        with stage("encoder.lstm", items=ids.numel()) as span:
+            if self.config.pack_sequences:
+                if lengths is None:
+                    lengths = mask.sum(dim=1).cpu()
+                y = self._lstm_packed(y, lengths)
+            else:
+                y, _ = self.lstm(y)
+            span.add(nbytes=y.element_size() * y.nelement())
+        with stage("encoder.attention", items=ids.numel()) as span:
+            attn, _ = self.mha(y, y, y, key_padding_mask=~mask)
+            y = y + attn
+            y = self.layer_norm(y)
+            span.add(nbytes=2 * y.element_size() * y.nelement())
+        with stage("encoder.pooling", items=len(ids)) as span:
+            pooled = self.pooling(y, mask)
+            span.add(nbytes=pooled.element_size() * pooled.nelement())
+        with stage("encoder.projection", items=len(ids)) as span:
+            embeddings = self.linear(pooled)
+            span.add(nbytes=embeddings.element_size() * embeddings.nelement())
+        return embeddings, y
+
+    def _lstm_packed(self, y: torch.Tensor, lengths: torch.Tensor) -> torch.Tensor:
+        lengths = lengths.clamp(min=1)
+        packed = torch.nn.utils.rnn.pack_padded_sequence(y, lengths, batch_first=True, enforce_sorted=False)
+        packed, _ = self.lstm(packed)
+        y, _ = torch.nn.utils.rnn.pad_packed_sequence(packed, batch_first=True, total_length=y.shape[1])
         return y
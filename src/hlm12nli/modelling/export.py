@@ -0,0 +1,103 @@
+# Python Built-in Modules
+import dataclasses
+import json
+import pathlib
+import warnings
+from typing import Tuple
+
+# Third-Party Libraries
+import torch
+
+# Local Folders
+from .encoder import Hlm12NliEncoder
+from .runtime import CONFIG_FILENAME
+
+
+class Hlm12NliEncoderExporter:
+    """
+    Exports a `Hlm12NliEncoder` into a frozen TorchScript graph taking tensors (ids, mask) instead of
+    a tokeniser output, which `Hlm12NliExportedEncoder` runs without the Python model code (or `nest_ml`).
+
+    The encoder is traced in evaluation mode, which removes dropout, then frozen, which inlines the parameters
+    as constants and folds the operations depending only on them, and finally optimised for inference.
+
+    Attributes:
+        encoder: Hlm12NliEncoder
+            The encoder to export.
+    """
+
+    encoder: Hlm12NliEncoder
+
+    def __init__(self, encoder: Hlm12NliEncoder) -> None:
+        """
+        Constructs a new Hlm12NliEncoderExporter.
+
+        Args:
+            encoder: Hlm12NliEncoder
+                The encoder to export.
+        """
+        self.encoder = encoder
+
+    def export(self, filepath: pathlib.Path, seq_len: int = 16, optimise: bool = True) -> torch.jit.ScriptModule:
+        """
+        Traces, freezes and saves the encoder.
+
+        Args:
+            filepath: pathlib.Path
+                The path to save the graph to.
+            seq_len: int
+                The sequence length of the example batch used for tracing; the graph accepts any batch size
+                and sequence length.
+            optimise: bool
+                Whether to apply `torch.jit.optimize_for_inference` (operator fusion, pre-packed weights).
+
+        Returns:
+            The frozen graph, as saved.
+        """
+        graph = self.trace(seq_len=seq_len, optimise=optimise)
+        config = json.dumps(dataclasses.asdict(self.encoder.config), default=str)
+        torch.jit.save(graph, str(filepath), _extra_files={CONFIG_FILENAME: config})
+        return graph
+
+    def trace(self, seq_len: int = 16, optimise: bool = True) -> torch.jit.ScriptModule:
+        """
+        Traces and freezes the encoder, without saving it.
+
+        Args:
+            seq_len: int
+                The sequence length of the example batch used for tracing.
+            optimise: bool
+                Whether to apply `torch.jit.optimize_for_inference`.
+
+        Returns:
+            The frozen graph, mapping (ids, mask) to embeddings.
+        """
+        was_training = self.encoder.training
+        self.encoder.eval()
+        try:
+            ids, mask = self._example(seq_len)
+            with torch.no_grad(), warnings.catch_warnings():
+                warnings.simplefilter("ignore", category=torch.jit.TracerWarning)
+                graph = torch.jit.trace(_Hlm12NliTensorEncoder(self.encoder), (ids, mask), check_trace=False)
+                graph = torch.jit.freeze(graph.eval())
+                if optimise:
+                    graph = torch.jit.optimize_for_inference(graph)
+            return graph
+        finally:
+            self.encoder.train(was_training)
+
+    def _example(self, seq_len: int) -> Tuple[torch.Tensor, torch.Tensor]:
+        lengths = torch.tensor([seq_len, max(1, seq_len // 2)])
+        mask = torch.arange(seq_len) < lengths[:, None]
+        ids = torch.randint(0, self.encoder.config.vocab_size, (len(lengths), seq_len))
+        ids = ids.masked_fill(~mask, self.encoder.config.token_id_pad)
+        return ids.to(self.encoder.device), mask.to(self.encoder.device)
+
+
+class _Hlm12NliTensorEncoder(torch.nn.Module):
+    def __init__(self, encoder: Hlm12NliEncoder) -> None:
+        super().__init__()
+        self.encoder = encoder
+
+    def forward(self, ids: torch.Tensor, mask: torch.Tensor) -> torch.Tensor:
+        return self.encoder.forward_tensors(ids, mask)[0]
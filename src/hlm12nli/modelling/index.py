@@ -0,0 +1,302 @@
+# Python Built-in Modules
+import json
+import os
+import pathlib
+from typing import List, Optional, Tuple, Union
+
+# Third-Party Libraries
+import numpy as np
+import torch
+
+
+class Hlm12NliVectorIndex:
+    """
+    Approximate nearest-neighbour index over sentence embeddings, searched by cosine similarity.
+
+    An inverted file index (IVF): the normalised vectors are assigned to the closest of `n_lists` centroids,
+    learned by spherical k-means, and a query only scores the vectors of its `n_probe` closest lists, so that
+    `n_probe` trades recall (up to exact search when `n_probe == n_lists`) for latency. Until the index is
+    trained, which happens automatically once it holds `train_size` vectors, vectors are unassigned and always
+    searched exhaustively, so small indexes are exact.
+
+    The vectors, their ids and their list assignments live in memory-mapped files in `dirpath`, grown as vectors
+    are added, next to the centroids and a JSON header. Only the centroids and the assignments are read into
+    memory when the index is reopened.
+
+    Attributes:
+        dirpath: pathlib.Path
+            The directory holding the index files.
+        dims: int
+            The number of dimensions of the vectors.
+        n_lists: int
+            The number of inverted lists (k-means centroids).
+        n_probe: int
+            The default number of lists scored per query.
+        train_size: int
+            The number of vectors after which the index is trained automatically.
+    """
+
+    FILENAME_HEADER = "index.json"
+    FILENAME_VECTORS = "vectors.f32"
+    FILENAME_IDS = "ids.i64"
+    FILENAME_LISTS = "lists.i32"
+    FILENAME_CENTROIDS = "centroids.f32"
+
+    dirpath: pathlib.Path
+    dims: int
+    n_lists: int
+    n_probe: int
+    train_size: int
+
+    def __init__(
+        self,
+        dirpath: pathlib.Path,
+        dims: int,
+        n_lists: int = 256,
+        n_probe: int = 8,
+        train_size: Optional[int] = None,
+        seed: int = 42,
+    ) -> None:
+        """
+        Constructs a new Hlm12NliVectorIndex, reopening the index in `dirpath` if there is one.
+
+        Args:
+            dirpath: pathlib.Path
+                The directory holding the index files, created if needed.
+            dims: int
+                The number of dimensions of the vectors, e.g. `Hlm12NliConfig.output_dims`.
+            n_lists: int
+                The number of inverted lists, typically around the square root of the number of vectors.
+            n_probe: int
+                The default number of lists scored per query.
+            train_size: int | None
+                The number of vectors after which the index is trained automatically, defaults to 40 per list.
+            seed: int
+                The seed of the k-means initialisation.
+        """
+        if n_lists < 1 or n_probe < 1:
+            raise ValueError(f"n_lists and n_probe must be positive, got {n_lists} and {n_probe}.")
+        self.dirpath = pathlib.Path(dirpath)
+        self.dims = dims
+        self.n_lists = n_lists
+        self.n_probe = n_probe
+        self.train_size = train_size if train_size is not None else n_lists * 40
+        self._rng = np.random.default_rng(seed)
+        self._size = 0
+        self._capacity = 0
+        self._centroids: Optional[np.ndarray] = None
+        self._members: Optional[List[np.ndarray]] = None
+        self._open()
+
+    def __enter__(self) -> "Hlm12NliVectorIndex":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def is_trained(self) -> bool:
+        """
+        Returns whether the centroids have been learned.
+        """
+        return self._centroids is not None
+
+    def add(
+        self,
+        vectors: Union[np.ndarray, torch.Tensor],
+        ids: Optional[np.ndarray] = None,
+    ) -> None:
+        """
+        Adds a batch of vectors, e.g. the embeddings of a `Hlm12NliEncoder` output.
+
+        Args:
+            vectors: np.ndarray | torch.Tensor
+                The vectors, of shape [batch_size, dims]; normalised before being stored.
+            ids: np.ndarray | None
+                The id of each vector, returned by `search`, defaults to the insertion order.
+        """
+        vectors = self._normalise(vectors)
+        n = len(vectors)
+        if ids is None:
+            ids = np.arange(self._size, self._size + n, dtype=np.int64)
+        ids = np.asarray(ids, dtype=np.int64)
+        if ids.shape != (n,):
+            raise ValueError(f"Expected {n} ids, got an array of shape {ids.shape}.")
+        if self._size + n > self._capacity:
+            self._grow(self._size + n)
+        start, end = self._size, self._size + n
+        self._vectors[start:end] = vectors
+        self._ids[start:end] = ids
+        self._lists[start:end] = self._assign(vectors) if self.is_trained else -1
+        self._size = end
+        self._members = None
+        if not self.is_trained and self._size >= self.train_size:
+            self.train()
+
+    def train(self, n_iter: int = 20) -> None:
+        """
+        Learns the centroids by spherical k-means over (a sample of) the vectors in the index,
+        then assigns every vector to its closest centroid.
+
+        Args:
+            n_iter: int
+                The number of k-means iterations.
+        """
+        if self._size < self.n_lists:
+            raise ValueError(f"At least {self.n_lists} vectors are needed to train, the index holds {self._size}.")
+        sample_size = min(self._size, max(self.train_size, self.n_lists * 256))
+        sample = np.sort(self._rng.choice(self._size, size=sample_size, replace=False))
+        sample = np.asarray(self._vectors[sample])
+        centroids = sample[self._rng.choice(len(sample), size=self.n_lists, replace=False)].copy()
+        for _ in range(n_iter):
+            assignments = self._assign(sample, centroids)
+            counts = np.bincount(assignments, minlength=self.n_lists)
+            starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+            empty = counts == 0
+            sums = np.zeros_like(centroids)
+            sums[~empty] = np.add.reduceat(sample[np.argsort(assignments, kind="stable")], starts[~empty])
+            sums[empty] = sample[self._rng.choice(len(sample), size=int(empty.sum()), replace=False)]
+            centroids = sums / np.maximum(np.linalg.norm(sums, axis=1, keepdims=True), 1e-12)
+        self._centroids = centroids.astype(np.float32)
+        for start in range(0, self._size, 65536):
+            end = min(start + 65536, self._size)
+            self._lists[start:end] = self._assign(np.asarray(self._vectors[start:end]))
+        self._members = None
+
+    def search(
+        self,
+        queries: Union[np.ndarray, torch.Tensor],
+        k: int = 10,
+        n_probe: Optional[int] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Finds the `k` vectors most similar to each query by cosine similarity.
+
+        Args:
+            queries: np.ndarray | torch.Tensor
+                The queries, of shape [n_queries, dims].
+            k: int
+                The number of neighbours to return per query.
+            n_probe: int | None
+                The number of lists scored per query, defaults to `self.n_probe`; higher is slower but more exact.
+
+        Returns:
+            The cosine similarities and the ids of the neighbours, each of shape [n_queries, k], sorted by
+            decreasing similarity and padded with -inf and -1 when fewer than `k` vectors were scored.
+        """
+        queries = self._normalise(queries)
+        n_probe = min(n_probe or self.n_probe, self.n_lists)
+        scores = np.full((len(queries), k), -np.inf, dtype=np.float32)
+        ids = np.full((len(queries), k), -1, dtype=np.int64)
+        if not self.is_trained or n_probe == self.n_lists:
+            vectors = self._vectors[: self._size]
+            for start in range(0, len(queries), 256):
+                end = start + 256
+                self._top_k(queries[start:end] @ vectors.T, None, scores[start:end], ids[start:end])
+            return scores, ids
+        members = self._inverted_lists()
+        probes = np.argpartition(-(queries @ self._centroids.T), n_probe - 1, axis=1)[:, :n_probe]
+        for i, query in enumerate(queries):
+            rows = np.concatenate([members[-1]] + [members[p] for p in probes[i]])
+            self._top_k((self._vectors[rows] @ query)[None], rows, scores[i : i + 1], ids[i : i + 1])
+        return scores, ids
+
+    def flush(self) -> None:
+        """
+        Writes the vectors, the centroids and the header to disk.
+        """
+        for array in (self._vectors, self._ids, self._lists):
+            array.flush()
+        if self._centroids is not None:
+            self._centroids.tofile(self.dirpath / self.FILENAME_CENTROIDS)
+        header = {
+            "dims": self.dims,
+            "n_lists": self.n_lists,
+            "size": self._size,
+            "capacity": self._capacity,
+            "trained": self.is_trained,
+        }
+        tmp = self.dirpath / (self.FILENAME_HEADER + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump(header, fh)
+        os.replace(tmp, self.dirpath / self.FILENAME_HEADER)
+
+    def close(self) -> None:
+        """
+        Flushes the index to disk and releases the memory maps.
+        """
+        self.flush()
+        del self._vectors, self._ids, self._lists
+
+    def _open(self) -> None:
+        self.dirpath.mkdir(parents=True, exist_ok=True)
+        try:
+            with open(self.dirpath / self.FILENAME_HEADER, "r", encoding="utf-8") as fh:
+                header = json.load(fh)
+        except FileNotFoundError:
+            header = None
+        if header is None:
+            self._map(capacity=1024, mode="w+")
+            return
+        if (header["dims"], header["n_lists"]) != (self.dims, self.n_lists):
+            raise ValueError(
+                f"The index in {self.dirpath} has {header['dims']} dims and {header['n_lists']} lists, "
+                f"expected {self.dims} and {self.n_lists}."
+            )
+        self._size = header["size"]
+        self._map(capacity=header["capacity"], mode="r+")
+        if header["trained"]:
+            centroids = np.fromfile(self.dirpath / self.FILENAME_CENTROIDS, dtype=np.float32)
+            self._centroids = centroids.reshape(self.n_lists, self.dims)
+
+    def _map(self, capacity: int, mode: str) -> None:
+        self._capacity = capacity
+        self._vectors = np.memmap(
+            self.dirpath / self.FILENAME_VECTORS, dtype=np.float32, mode=mode, shape=(capacity, self.dims)
+        )
+        self._ids = np.memmap(self.dirpath / self.FILENAME_IDS, dtype=np.int64, mode=mode, shape=(capacity,))
+        self._lists = np.memmap(self.dirpath / self.FILENAME_LISTS, dtype=np.int32, mode=mode, shape=(capacity,))
+
+    def _grow(self, size: int) -> None:
+        capacity = max(size, self._capacity * 2)
+        self.flush()
+        del self._vectors, self._ids, self._lists
+        for filename, row_bytes in (
+            (self.FILENAME_VECTORS, self.dims * 4),
+            (self.FILENAME_IDS, 8),
+            (self.FILENAME_LISTS, 4),
+        ):
+            with open(self.dirpath / filename, "r+b") as fh:
+                fh.truncate(capacity * row_bytes)
+        self._map(capacity=capacity, mode="r+")
+
+    def _normalise(self, vectors: Union[np.ndarray, torch.Tensor]) -> np.ndarray:
+        if isinstance(vectors, torch.Tensor):
+            vectors = vectors.detach().float().cpu().numpy()
+        vectors = np.asarray(vectors, dtype=np.float32).reshape(-1, self.dims)
+        return vectors / np.maximum(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-12)
+
+    def _assign(self, vectors: np.ndarray, centroids: Optional[np.ndarray] = None) -> np.ndarray:
+        centroids = self._centroids if centroids is None else centroids
+        return np.argmax(vectors @ centroids.T, axis=1).astype(np.int32)
+
+    def _top_k(self, candidates: np.ndarray, rows: Optional[np.ndarray], scores: np.ndarray, ids: np.ndarray) -> None:
+        k = min(scores.shape[1], candidates.shape[1])
+        if k == 0:
+            return
+        best = np.argpartition(-candidates, k - 1, axis=1)[:, :k]
+        best = np.take_along_axis(best, np.argsort(-np.take_along_axis(candidates, best, axis=1), axis=1), axis=1)
+        scores[:, :k] = np.take_along_axis(candidates, best, axis=1)
+        ids[:, :k] = self._ids[best if rows is None else rows[best]]
+
+    def _inverted_lists(self) -> List[np.ndarray]:
+        if self._members is None:
+            lists = np.asarray(self._lists[: self._size])
+            order = np.argsort(lists, kind="stable")
+            bounds = np.searchsorted(lists[order], np.arange(-1, self.n_lists + 1))
+            members = [order[bounds[i] : bounds[i + 1]] for i in range(self.n_lists + 1)]
+            self._members = members[1:] + members[:1]
+        return self._members
@@ -11,10 +11,11 @@ class Hlm12NliOutput(NestMLTextEncoderOutputBase):
     Output for the HLM12NLI model.
 
     Attributes:
-        embeddings: List[List[float]]
-            Bath ofsentence representations.
-        last_hidden_state: List[List[List[float]]]
-            Batch of hidden states for each token in each sentence.
+        embeddings: torch.Tensor
+            Batch of sentence representations, of shape [batch_size, output_dims].
+        last_hidden_state: torch.Tensor | None
+            Batch of hidden states for each token in each sentence, of shape [batch_size, seq_len, hidden_dims],
+            or None when `Hlm12NliConfig.output_last_hidden_state` is disabled.
     """
 
     pass
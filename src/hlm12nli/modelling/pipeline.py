@@ -0,0 +1,283 @@
+# Python Built-in Modules
+import csv
+import json
+import pathlib
+import queue
+import struct
+import threading
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+
+# Third-Party Libraries
+import numpy as np
+import torch
+
+# My Packages and Modules
+from hlm12nli.tokenisation import Hlm12NliTokeniser
+
+# Local Folders
+from .batching import Hlm12NliBucketBatcher, warn_if_padding_dependent
+from .encoder import Hlm12NliEncoder
+
+_DONE = object()
+
+
+class Hlm12NliTextReader:
+    """
+    Lazily reads texts, one per record, from a JSON lines (.jsonl), tab-separated (.tsv) or plain text file.
+
+    Attributes:
+        filepath: pathlib.Path
+            The path to the file.
+        field: str | int | None
+            The key (JSON lines) or the column name or index (TSV, whose first row is the header when a name is given)
+            holding the text. Ignored for plain text files.
+        format: str
+            The file format, "jsonl", "tsv" or "txt", inferred from the suffix by default.
+    """
+
+    filepath: pathlib.Path
+    field: Optional[Union[str, int]]
+    format: str
+
+    def __init__(
+        self,
+        filepath: pathlib.Path,
+        field: Optional[Union[str, int]] = None,
+        format: Optional[str] = None,
+    ) -> None:
+        """
+        Constructs a new Hlm12NliTextReader.
+
+        Args:
+            filepath: pathlib.Path
+                The path to the file.
+            field: str | int | None
+                The key (JSON lines) or the column name or index (TSV) holding the text.
+            format: str | None
+                The file format, "jsonl", "tsv" or "txt", inferred from the suffix by default.
+        """
+        self.filepath = pathlib.Path(filepath)
+        self.field = field
+        self.format = format or self.filepath.suffix.lstrip(".").lower()
+        if self.format not in ("jsonl", "tsv", "txt"):
+            raise ValueError(f"Unsupported format '{self.format}', expected 'jsonl', 'tsv' or 'txt'.")
+        if self.format == "jsonl" and field is None:
+            raise ValueError("A field is required to read texts from JSON lines.")
+
+    def __iter__(self) -> Iterator[str]:
+        with open(self.filepath, "r", encoding="utf-8", newline="") as fh:
+            if self.format == "txt":
+                for line in fh:
+                    yield line.rstrip("\r\n")
+            elif self.format == "jsonl":
+                for line in fh:
+                    if line.strip():
+                        yield json.loads(line)[self.field]
+            else:
+                rows = csv.reader(fh, delimiter="\t", quoting=csv.QUOTE_NONE)
+                column = self.field if self.field is not None else 0
+                if isinstance(column, str):
+                    column = next(rows).index(column)
+                for row in rows:
+                    yield row[column]
+
+
+class Hlm12NliNpyWriter:
+    """
+    Appends float32 embeddings to a `.npy` file, whose header is rewritten with the final number
+    of rows on `close`, so that it can then be opened with `np.load(filepath, mmap_mode="r")`.
+
+    Attributes:
+        filepath: pathlib.Path
+            The path to the `.npy` file.
+        dims: int
+            The number of dimensions of each embedding.
+        rows: int
+            The number of embeddings written so far.
+    """
+
+    HEADER_LEN = 128
+
+    filepath: pathlib.Path
+    dims: int
+    rows: int
+
+    def __init__(self, filepath: pathlib.Path, dims: int) -> None:
+        """
+        Creates (or truncates) the `.npy` file.
+
+        Args:
+            filepath: pathlib.Path
+                The path to the `.npy` file.
+            dims: int
+                The number of dimensions of each embedding.
+        """
+        self.filepath = pathlib.Path(filepath)
+        self.dims = dims
+        self.rows = 0
+        self._fh = open(self.filepath, "wb")
+        self._write_header()
+
+    def __enter__(self) -> "Hlm12NliNpyWriter":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def write(self, embeddings: np.ndarray) -> None:
+        """
+        Appends a batch of embeddings, of shape [batch_size, dims].
+        """
+        embeddings = np.ascontiguousarray(embeddings, dtype="<f4")
+        if embeddings.ndim != 2 or embeddings.shape[1] != self.dims:
+            raise ValueError(f"Expected embeddings of shape [batch_size, {self.dims}], got {embeddings.shape}.")
+        self._fh.write(embeddings.tobytes())
+        self.rows += len(embeddings)
+
+    def close(self) -> None:
+        """
+        Rewrites the header with the final number of rows and closes the file.
+        """
+        if self._fh.closed:
+            return
+        self._fh.seek(0)
+        self._write_header()
+        self._fh.close()
+
+    def _write_header(self) -> None:
+        header = repr({"descr": "<f4", "fortran_order": False, "shape": (self.rows, self.dims)})
+        prefix = b"\x93NUMPY\x01\x00" + struct.pack("<H", self.HEADER_LEN - 10)
+        self._fh.write(prefix + header.ljust(self.HEADER_LEN - 11).encode("latin1") + b"\n")
+
+
+class Hlm12NliEmbeddingPipeline:
+    """
+    Streaming pipeline from texts to embeddings (reader -> tokeniser -> batcher -> encoder -> writer),
+    with constant memory regardless of the size of the corpus.
+
+    Tokenisation and length-bucketed batching run in a background thread, feeding a bounded queue of
+    ready batches, so that tokenising batch N+1 overlaps with encoding batch N (the encoder releases the GIL
+    while computing). When the queue is full the tokeniser waits, which bounds the memory in flight.
+
+    Attributes:
+        tokeniser: Hlm12NliTokeniser
+            The tokeniser used to encode the texts.
+        encoder: Hlm12NliEncoder
+            The encoder producing the embeddings.
+        batcher: Hlm12NliBucketBatcher
+            The batcher grouping texts of similar lengths.
+        queue_size: int
+            The maximum number of tokenised batches waiting to be encoded.
+    """
+
+    tokeniser: Hlm12NliTokeniser
+    encoder: Hlm12NliEncoder
+    batcher: Hlm12NliBucketBatcher
+    queue_size: int
+
+    def __init__(
+        self,
+        tokeniser: Hlm12NliTokeniser,
+        encoder: Hlm12NliEncoder,
+        max_batch_tokens: int = 8192,
+        window_size: int = 4096,
+        queue_size: int = 4,
+    ) -> None:
+        """
+        Constructs a new Hlm12NliEmbeddingPipeline.
+
+        Args:
+            tokeniser: Hlm12NliTokeniser
+                The tokeniser used to encode the texts.
+            encoder: Hlm12NliEncoder
+                The encoder producing the embeddings.
+            max_batch_tokens: int
+                The maximum number of padded tokens per batch.
+            window_size: int
+                The number of texts sorted together by length, which bounds how far results are held back.
+            queue_size: int
+                The maximum number of tokenised batches waiting to be encoded.
+        """
+        if queue_size < 1:
+            raise ValueError(f"queue_size must be positive, got {queue_size}.")
+        warn_if_padding_dependent(encoder)
+        self.tokeniser = tokeniser
+        self.encoder = encoder
+        self.batcher = Hlm12NliBucketBatcher(tokeniser, max_batch_tokens=max_batch_tokens, window_size=window_size)
+        self.queue_size = queue_size
+
+    def __call__(self, texts: Iterable[str]) -> Iterator[np.ndarray]:
+        """
+        Embeds the texts, lazily consuming them.
+
+        Args:
+            texts: Iterable[str]
+                The texts to embed, e.g. a `Hlm12NliTextReader`.
+
+        Returns:
+            An iterator over consecutive chunks of embeddings, of shape [chunk_size, output_dims], in the input order.
+        """
+        batches: "queue.Queue" = queue.Queue(maxsize=self.queue_size)
+        stop = threading.Event()
+        producer = threading.Thread(target=self._produce, args=(texts, batches, stop), daemon=True)
+        producer.start()
+        pending: Dict[int, np.ndarray] = {}
+        position = 0
+        try:
+            while True:
+                item = batches.get()
+                if item is _DONE:
+                    break
+                if isinstance(item, BaseException):
+                    raise item
+                positions, x = item
+                with torch.inference_mode():
+                    embeddings = self.encoder(x).embeddings.float().cpu().numpy()
+                pending.update(zip(positions, embeddings))
+                ready: List[np.ndarray] = []
+                while position in pending:
+                    ready.append(pending.pop(position))
+                    position += 1
+                if ready:
+                    yield np.stack(ready)
+        finally:
+            stop.set()
+            producer.join()
+
+    def run(self, texts: Iterable[str], writer: Hlm12NliNpyWriter) -> int:
+        """
+        Embeds the texts and writes the embeddings as they are produced.
+
+        Args:
+            texts: Iterable[str]
+                The texts to embed, e.g. a `Hlm12NliTextReader`.
+            writer: Hlm12NliNpyWriter
+                The writer receiving the embeddings.
+
+        Returns:
+            The number of embeddings written.
+        """
+        rows = 0
+        for embeddings in self(texts):
+            writer.write(embeddings)
+            rows += len(embeddings)
+        return rows
+
+    def _produce(self, texts: Iterable[str], batches: "queue.Queue", stop: threading.Event) -> None:
+        try:
+            for item in self.batcher.batches(texts):
+                if not self._put(batches, item, stop):
+                    return
+            self._put(batches, _DONE, stop)
+        except BaseException as e:
+            self._put(batches, e, stop)
+
+    @staticmethod
+    def _put(batches: "queue.Queue", item: object, stop: threading.Event) -> bool:
+        while not stop.is_set():
+            try:
+                batches.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
@@ -0,0 +1,64 @@
+# Third-Party Libraries
+import torch
+
+
+class Hlm12NliPooling(torch.nn.Module):
+    """
+    Reduces the per-token hidden states into a single vector per sequence, ignoring the padding positions.
+
+    Strategies:
+        mean: the average of the hidden states of the non-padding positions.
+        max: the element-wise maximum over the non-padding positions.
+        first: the hidden state of the first position (the start token).
+        attention: the average of the hidden states weighted by a learned, masked softmax attention score.
+
+    Attributes:
+        strategy: str
+            The pooling strategy, one of "mean", "max", "first" or "attention".
+        scorer: torch.nn.Linear | None
+            The layer producing the attention score of each position, only for the "attention" strategy.
+    """
+
+    STRATEGIES = ("mean", "max", "first", "attention")
+
+    strategy: str
+
+    def __init__(self, strategy: str, dims: int):
+        """
+        Constructs a new Hlm12NliPooling.
+
+        Args:
+            strategy: str
+                The pooling strategy, one of "mean", "max", "first" or "attention".
+            dims: int
+                The number of dimensions of the hidden states.
+        """
+        super().__init__()
+        if strategy not in self.STRATEGIES:
+            raise ValueError(f"Unknown pooling strategy '{strategy}', expected one of {self.STRATEGIES}.")
+        self.strategy = strategy
+        self.scorer = torch.nn.Linear(in_features=dims, out_features=1) if strategy == "attention" else None
+
+    def forward(self, y: torch.Tensor, mask: torch.Tensor) -> torch.Tensor:
+        """
+        Pools the hidden states.
+
+        Args:
+            y: torch.Tensor
+                The hidden states, of shape [batch_size, seq_len, dims].
+            mask: torch.Tensor
+                The boolean mask of the non-padding positions, of shape [batch_size, seq_len].
+
+        Returns:
+            The pooled hidden states, of shape [batch_size, dims].
+        """
+        if self.strategy == "first":
+            return y[:, 0]
+        weights = mask.unsqueeze(-1)
+        if self.strategy == "max":
+            return y.masked_fill(~weights, torch.finfo(y.dtype).min).amax(dim=1)
+        if self.strategy == "mean":
+            weights = weights.to(y.dtype)
+            return (y * weights).sum(dim=1) / weights.sum(dim=1).clamp(min=1)
+        scores = self.scorer(y).masked_fill(~weights, torch.finfo(y.dtype).min)
+        return (y * torch.softmax(scores, dim=1)).sum(dim=1)
@@ -0,0 +1,224 @@
+# Python Built-in Modules
+import contextlib
+import copy
+import io
+import time
+from dataclasses import dataclass
+from typing import Iterator, List, Optional
+
+# Third-Party Libraries
+import numpy as np
+import torch
+from torch.ao.quantization import quantize_dynamic
+
+# My Packages and Modules
+from hlm12nli.tokenisation import Hlm12NliTokeniser
+
+# Local Folders
+from .batching import Hlm12NliBucketBatcher
+from .encoder import Hlm12NliEncoder
+
+_EMBEDDINGS_DTYPES = {"float16": torch.float16, "bfloat16": torch.bfloat16}
+
+
+@dataclass(frozen=True)
+class Hlm12NliQuantisationReport:
+    """
+    Drift and cost of a quantised encoder versus its fp32 reference, on a held-out set of texts.
+
+    Attributes:
+        n_texts: int
+            The number of texts compared.
+        cosine_mean: float
+            The mean cosine similarity between the reference and quantised embeddings of each text.
+        cosine_min: float
+            The lowest cosine similarity, i.e. the worst drift.
+        cosine_p01: float
+            The 1st percentile of the cosine similarities.
+        reference_bytes: int
+            The serialised size of the reference encoder.
+        quantised_bytes: int
+            The serialised size of the quantised encoder.
+        reference_seconds: float
+            The time taken by the reference encoder to embed the texts.
+        quantised_seconds: float
+            The time taken by the quantised encoder to embed the texts.
+    """
+
+    n_texts: int
+    cosine_mean: float
+    cosine_min: float
+    cosine_p01: float
+    reference_bytes: int
+    quantised_bytes: int
+    reference_seconds: float
+    quantised_seconds: float
+
+    @property
+    def compression(self) -> float:
+        """
+        Returns how many times smaller the quantised encoder is.
+        """
+        return self.reference_bytes / self.quantised_bytes if self.quantised_bytes else 0.0
+
+    @property
+    def speedup(self) -> float:
+        """
+        Returns how many times faster the quantised encoder embeds the texts.
+        """
+        return self.reference_seconds / self.quantised_seconds if self.quantised_seconds else 0.0
+
+
+class Hlm12NliHalfEmbedding(torch.nn.Embedding):
+    """
+    Embedding table stored in half precision (float16 or bfloat16), halving its memory, whose looked up
+    vectors are cast back to float32 for the layers downstream.
+    """
+
+    @classmethod
+    def from_embedding(cls, embedding: torch.nn.Embedding, dtype: torch.dtype) -> "Hlm12NliHalfEmbedding":
+        """
+        Converts a float32 embedding table.
+
+        Args:
+            embedding: torch.nn.Embedding
+                The embedding table to convert.
+            dtype: torch.dtype
+                The precision to store the table in, `torch.float16` or `torch.bfloat16`.
+        """
+        return cls(
+            num_embeddings=embedding.num_embeddings,
+            embedding_dim=embedding.embedding_dim,
+            padding_idx=embedding.padding_idx,
+            _weight=embedding.weight.detach().to(dtype),
+            _freeze=True,
+        )
+
+    def forward(self, input: torch.Tensor) -> torch.Tensor:
+        return super().forward(input).float()
+
+
+class Hlm12NliEncoderQuantiser:
+    """
+    Produces a quantised copy of a `Hlm12NliEncoder` for CPU inference: dynamic int8 quantisation of the LSTM
+    and linear layers (weights stored as int8, activations quantised on the fly), and optionally the embedding
+    table stored in float16 or bfloat16. The attention layers stay in float32.
+
+    Since the drift caused by quantisation depends on the model and the data, `validate` reports the cosine
+    similarity between the quantised and fp32 embeddings of a held-out set of texts, so that it can be decided
+    per deployment.
+
+    Attributes:
+        embeddings_dtype: str | None
+            The precision of the embedding table, "float16", "bfloat16" or None to keep it in float32.
+    """
+
+    embeddings_dtype: Optional[str]
+
+    def __init__(self, embeddings_dtype: Optional[str] = None) -> None:
+        """
+        Constructs a new Hlm12NliEncoderQuantiser.
+
+        Args:
+            embeddings_dtype: str | None
+                The precision of the embedding table, "float16", "bfloat16" or None to keep it in float32.
+        """
+        if embeddings_dtype is not None and embeddings_dtype not in _EMBEDDINGS_DTYPES:
+            raise ValueError(
+                f"Unknown embeddings dtype '{embeddings_dtype}', expected one of {tuple(_EMBEDDINGS_DTYPES)}."
+            )
+        self.embeddings_dtype = embeddings_dtype
+
+    def quantise(self, encoder: Hlm12NliEncoder) -> Hlm12NliEncoder:
+        """
+        Quantises a copy of the encoder, leaving the original untouched.
+
+        Args:
+            encoder: Hlm12NliEncoder
+                The fp32 encoder, on the CPU.
+
+        Returns:
+            The quantised encoder, in evaluation mode.
+        """
+        quantised = copy.deepcopy(encoder).cpu().eval()
+        quantised = quantize_dynamic(
+            quantised,
+            {torch.nn.LSTM, torch.nn.Linear},
+            dtype=torch.qint8,
+        )
+        if self.embeddings_dtype is not None:
+            quantised.embeddings = Hlm12NliHalfEmbedding.from_embedding(
+                quantised.embeddings,
+                dtype=_EMBEDDINGS_DTYPES[self.embeddings_dtype],
+            )
+        return quantised
+
+    def validate(
+        self,
+        reference: Hlm12NliEncoder,
+        quantised: Hlm12NliEncoder,
+        tokeniser: Hlm12NliTokeniser,
+        texts: List[str],
+        max_batch_tokens: int = 8192,
+    ) -> Hlm12NliQuantisationReport:
+        """
+        Compares the embeddings of the quantised encoder with those of the reference on held-out texts.
+        Both encoders are run in evaluation mode, and their training flags are restored afterwards.
+
+        Args:
+            reference: Hlm12NliEncoder
+                The fp32 encoder.
+            quantised: Hlm12NliEncoder
+                The quantised encoder, as returned by `quantise`.
+            tokeniser: Hlm12NliTokeniser
+                The tokeniser used to encode the texts.
+            texts: List[str]
+                The held-out texts.
+            max_batch_tokens: int
+                The maximum number of padded tokens per batch.
+
+        Returns:
+            The cosine similarity drift, size and speed of the quantised encoder versus the reference.
+        """
+        batcher = Hlm12NliBucketBatcher(tokeniser, max_batch_tokens=max_batch_tokens)
+        with _evaluating(reference, quantised):
+            expected, reference_seconds = self._embed(batcher, reference, texts)
+            actual, quantised_seconds = self._embed(batcher, quantised, texts)
+        cosine = torch.nn.functional.cosine_similarity(actual, expected, dim=1).numpy()
+        return Hlm12NliQuantisationReport(
+            n_texts=len(texts),
+            cosine_mean=float(cosine.mean()) if len(texts) else 1.0,
+            cosine_min=float(cosine.min()) if len(texts) else 1.0,
+            cosine_p01=float(np.percentile(cosine, 1)) if len(texts) else 1.0,
+            reference_bytes=self._serialised_bytes(reference),
+            quantised_bytes=self._serialised_bytes(quantised),
+            reference_seconds=reference_seconds,
+            quantised_seconds=quantised_seconds,
+        )
+
+    @staticmethod
+    def _embed(batcher: Hlm12NliBucketBatcher, encoder: Hlm12NliEncoder, texts: List[str]):
+        start = time.perf_counter()
+        embeddings = [e.float().cpu() for e in batcher.encode(encoder, texts)]
+        elapsed = time.perf_counter() - start
+        if not embeddings:
+            return torch.empty((0, encoder.config.output_dims)), elapsed
+        return torch.stack(embeddings), elapsed
+
+    @staticmethod
+    def _serialised_bytes(encoder: Hlm12NliEncoder) -> int:
+        buffer = io.BytesIO()
+        torch.save(encoder.state_dict(), buffer)
+        return buffer.tell()
+
+
+@contextlib.contextmanager
+def _evaluating(*modules: torch.nn.Module) -> Iterator[None]:
+    flags = [(module, module.training) for root in modules for module in root.modules()]
+    try:
+        for root in modules:
+            root.eval()
+        yield
+    finally:
+        for module, training in flags:
+            module.training = training
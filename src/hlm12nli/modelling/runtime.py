@@ -0,0 +1,73 @@
+# Python Built-in Modules
+import json
+import pathlib
+from typing import Any, Dict, Optional, Union
+
+# Third-Party Libraries
+import numpy as np
+import torch
+
+CONFIG_FILENAME = "config.json"
+
+
+class Hlm12NliExportedEncoder:
+    """
+    Runs an encoder exported by `Hlm12NliEncoderExporter`, depending only on `torch` (and `numpy`),
+    so that it can be deployed without the Python model code or `nest_ml`.
+
+    Attributes:
+        filepath: pathlib.Path
+            The path to the exported graph.
+        device: torch.device
+            The device the graph runs on.
+        config: Dict[str, Any]
+            The configuration of the exported encoder.
+    """
+
+    filepath: pathlib.Path
+    device: torch.device
+    config: Dict[str, Any]
+
+    def __init__(self, filepath: pathlib.Path, device: Optional[Union[str, torch.device]] = None) -> None:
+        """
+        Loads the exported graph.
+
+        Args:
+            filepath: pathlib.Path
+                The path to the exported graph.
+            device: str | torch.device | None
+                The device to run the graph on, defaults to the CPU.
+        """
+        self.filepath = pathlib.Path(filepath)
+        self.device = torch.device(device or "cpu")
+        extra_files = {CONFIG_FILENAME: ""}
+        self._graph = torch.jit.load(str(self.filepath), map_location=self.device, _extra_files=extra_files)
+        self._graph.eval()
+        self.config = json.loads(extra_files[CONFIG_FILENAME] or "{}")
+
+    def __call__(
+        self,
+        ids: Union[torch.Tensor, np.ndarray],
+        mask: Union[torch.Tensor, np.ndarray],
+    ) -> torch.Tensor:
+        """
+        Encodes padded token ids into embeddings.
+
+        Args:
+            ids: torch.Tensor | np.ndarray
+                The padded token ids, of shape [batch_size, seq_len], e.g. `Hlm12NliTokeniserIdsOutput.encoded_tokens`.
+            mask: torch.Tensor | np.ndarray
+                The boolean mask of the non-padding positions, of shape [batch_size, seq_len].
+
+        Returns:
+            The embeddings, of shape [batch_size, output_dims].
+        """
+        ids = self._as_tensor(ids, torch.int64)
+        mask = self._as_tensor(mask, torch.bool)
+        with torch.inference_mode():
+            return self._graph(ids, mask)
+
+    def _as_tensor(self, x: Union[torch.Tensor, np.ndarray], dtype: torch.dtype) -> torch.Tensor:
+        if isinstance(x, np.ndarray):
+            x = torch.from_numpy(np.ascontiguousarray(x))
+        return x.to(device=self.device, dtype=dtype)
@@ -0,0 +1,305 @@
+# Python Built-in Modules
+import hashlib
+import json
+import os
+import pathlib
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+# Third-Party Libraries
+import numpy as np
+import torch
+
+# My Packages and Modules
+from hlm12nli.tokenisation import Hlm12NliTokeniser
+from hlm12nli.tokenisation.fingerprint import fingerprint
+
+# Local Folders
+from .batching import Hlm12NliBucketBatcher
+from .encoder import Hlm12NliEncoder
+
+
+@dataclass(frozen=True)
+class Hlm12NliEmbeddingStoreStats:
+    """
+    Snapshot of the counters of a `Hlm12NliEmbeddingStore`.
+
+    Attributes:
+        hits: int
+            The number of texts served from the store.
+        misses: int
+            The number of texts that had to be encoded.
+        evictions: int
+            The number of embeddings removed to keep the store within its capacity.
+        size: int
+            The number of embeddings currently in the store.
+        capacity: int
+            The maximum number of embeddings the store holds.
+    """
+
+    hits: int = field()
+    misses: int = field()
+    evictions: int = field()
+    size: int = field()
+    capacity: int = field()
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        Returns the ratio of texts that were served from the store.
+        """
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class Hlm12NliEmbeddingStore:
+    """
+    Persistent, content-addressed cache of sentence embeddings in front of a `Hlm12NliEncoder`.
+
+    Embeddings are keyed by the hash of the normalised text (whitespace collapsed and, if the tokeniser
+    lowercases, lowercased) and live in a memory-mapped float32 file, next to a JSON index mapping each key
+    to its row. The key of each row is also written next to its vector, and index entries whose row holds
+    another key are dropped on reopening, so that an index left stale by an unclean exit (after rows were
+    evicted and reused) never serves the vector of another text. Both files are only reused while the fingerprint of the encoder config, a digest of its weights,
+    the tokeniser config (including its vocabulary) and the `revision` is unchanged, otherwise the store starts
+    empty.
+    Texts missing from the store are encoded in length-bucketed batches. When full, the least recently used
+    embeddings are evicted.
+
+    Attributes:
+        dirpath: pathlib.Path
+            The directory holding the `embeddings.f32`, `keys.u8` and `index.json` files.
+        tokeniser: Hlm12NliTokeniser
+            The tokeniser used to encode missing texts.
+        encoder: Hlm12NliEncoder
+            The encoder used to encode missing texts.
+        capacity: int
+            The maximum number of embeddings held.
+        dims: int
+            The number of dimensions of the embeddings.
+        fingerprint: str
+            The fingerprint of the encoder (configuration and weights) and tokeniser configuration the embeddings
+            were produced with.
+    """
+
+    FILENAME_VECTORS = "embeddings.f32"
+    FILENAME_KEYS = "keys.u8"
+    KEY_BYTES = 16
+    FILENAME_INDEX = "index.json"
+
+    dirpath: pathlib.Path
+    tokeniser: Hlm12NliTokeniser
+    encoder: Hlm12NliEncoder
+    capacity: int
+    dims: int
+    fingerprint: str
+
+    def __init__(
+        self,
+        dirpath: pathlib.Path,
+        tokeniser: Hlm12NliTokeniser,
+        encoder: Hlm12NliEncoder,
+        capacity: int = 100_000,
+        max_batch_tokens: int = 8192,
+        revision: str = "",
+    ) -> None:
+        """
+        Constructs a new Hlm12NliEmbeddingStore, reopening the files in `dirpath` if they are still valid.
+
+        Args:
+            dirpath: pathlib.Path
+                The directory holding the store files, created if needed.
+            tokeniser: Hlm12NliTokeniser
+                The tokeniser used to encode missing texts.
+            encoder: Hlm12NliEncoder
+                The encoder used to encode missing texts.
+            capacity: int
+                The maximum number of embeddings held.
+            max_batch_tokens: int
+                The maximum number of padded tokens per batch when encoding missing texts.
+            revision: str
+                An additional identifier of the model, e.g. of its training run; the weights are already part of
+                the fingerprint.
+        """
+        if capacity < 1:
+            raise ValueError(f"The store capacity must be positive, got {capacity}.")
+        self.dirpath = pathlib.Path(dirpath)
+        self.tokeniser = tokeniser
+        self.encoder = encoder
+        self.capacity = capacity
+        self.dims = encoder.config.output_dims
+        self.fingerprint = fingerprint(encoder.config, _weights_digest(encoder), tokeniser.fingerprint(), revision)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._batcher = Hlm12NliBucketBatcher(tokeniser, max_batch_tokens=max_batch_tokens)
+        self._slots: "OrderedDict[str, int]" = OrderedDict()
+        self._vectors = self._open()
+
+    def __enter__(self) -> "Hlm12NliEmbeddingStore":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __call__(self, texts: List[str]) -> np.ndarray:
+        """
+        Returns the embeddings of the texts, encoding (once) those not in the store yet.
+
+        Args:
+            texts: List[str]
+                The texts to embed.
+
+        Returns:
+            The embeddings, of shape [len(texts), dims].
+        """
+        output = np.empty((len(texts), self.dims), dtype=np.float32)
+        missing: Dict[str, List[int]] = OrderedDict()
+        for i, text in enumerate(texts):
+            key = self.key(text)
+            slot = self._slots.get(key)
+            if slot is None:
+                self.misses += 1
+                missing.setdefault(key, []).append(i)
+            else:
+                self.hits += 1
+                self._slots.move_to_end(key)
+                output[i] = self._vectors[slot]
+        if missing:
+            unique_texts = [texts[positions[0]] for positions in missing.values()]
+            embeddings = self._batcher.encode(self.encoder, unique_texts)
+            for (key, positions), embedding in zip(missing.items(), embeddings):
+                vector = embedding.detach().cpu().numpy()
+                output[positions] = vector
+                self._put(key, vector)
+        return output
+
+    def lookup(self, text: str) -> Optional[np.ndarray]:
+        """
+        Returns the embedding of a text without encoding it, as a read-only view of the memory-mapped file.
+        The view is only valid until the row is evicted.
+
+        Args:
+            text: str
+                The text to look up.
+
+        Returns:
+            The embedding, or None if the text is not in the store.
+        """
+        slot = self._slots.get(self.key(text))
+        if slot is None:
+            return None
+        view = self._vectors[slot]
+        view.flags.writeable = False
+        return view
+
+    def key(self, text: str) -> str:
+        """
+        Returns the content address of a text, the hash of its normalised form.
+        """
+        text = " ".join(text.split())
+        if self.tokeniser.do_lowercase:
+            text = text.lower()
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=self.KEY_BYTES).hexdigest()
+
+    def stats(self) -> Hlm12NliEmbeddingStoreStats:
+        """
+        Returns a snapshot of the counters of the store.
+        """
+        return Hlm12NliEmbeddingStoreStats(
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            size=len(self._slots),
+            capacity=self.capacity,
+        )
+
+    def flush(self) -> None:
+        """
+        Writes the embeddings and the index to disk.
+        """
+        self._vectors.flush()
+        self._keys.flush()
+        index = {
+            "fingerprint": self.fingerprint,
+            "dims": self.dims,
+            "capacity": self.capacity,
+            "entries": list(self._slots.items()),
+        }
+        tmp = self.dirpath / (self.FILENAME_INDEX + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump(index, fh)
+        os.replace(tmp, self.dirpath / self.FILENAME_INDEX)
+
+    def close(self) -> None:
+        """
+        Flushes the store to disk and releases the memory map.
+        """
+        self.flush()
+        del self._vectors
+        del self._keys
+
+    def _open(self) -> np.memmap:
+        self.dirpath.mkdir(parents=True, exist_ok=True)
+        vectors_path = self.dirpath / self.FILENAME_VECTORS
+        keys_path = self.dirpath / self.FILENAME_KEYS
+        index = self._read_index()
+        shape = (self.capacity, self.dims)
+        if index is not None and vectors_path.exists() and keys_path.exists():
+            self._keys = np.memmap(keys_path, dtype=np.uint8, mode="r+", shape=(self.capacity, self.KEY_BYTES))
+            self._slots = OrderedDict(
+                (key, slot) for key, slot in index["entries"] if self._keys[slot].tobytes() == bytes.fromhex(key)
+            )
+            return np.memmap(vectors_path, dtype=np.float32, mode="r+", shape=shape)
+        self._keys = np.memmap(keys_path, dtype=np.uint8, mode="w+", shape=(self.capacity, self.KEY_BYTES))
+        return np.memmap(vectors_path, dtype=np.float32, mode="w+", shape=shape)
+
+    def _read_index(self) -> Optional[dict]:
+        try:
+            with open(self.dirpath / self.FILENAME_INDEX, "r", encoding="utf-8") as fh:
+                index = json.load(fh)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        expected = (self.fingerprint, self.dims, self.capacity)
+        if (index.get("fingerprint"), index.get("dims"), index.get("capacity")) != expected:
+            return None
+        return index
+
+    def _put(self, key: str, vector: np.ndarray) -> None:
+        slot = self._slots.get(key)
+        if slot is None:
+            if len(self._slots) < self.capacity:
+                slot = len(self._slots)
+            else:
+                _, slot = self._slots.popitem(last=False)
+                self.evictions += 1
+        self._slots[key] = slot
+        self._slots.move_to_end(key)
+        self._keys[slot] = 0
+        self._vectors[slot] = vector
+        self._keys[slot] = np.frombuffer(bytes.fromhex(key), dtype=np.uint8)
+
+
+def _weights_digest(encoder: Hlm12NliEncoder) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    for name, value in encoder.state_dict().items():
+        digest.update(name.encode("utf-8"))
+        _update_digest(digest, value)
+    return digest.hexdigest()
+
+
+def _update_digest(digest: hashlib.blake2b, value: object) -> None:
+    if isinstance(value, (tuple, list)):
+        for item in value:
+            _update_digest(digest, item)
+    elif isinstance(value, torch.Tensor):
+        if value.is_quantized:
+            value = value.dequantize()
+        value = value.detach().cpu().contiguous().reshape(-1)
+        digest.update(value.view(torch.uint8).numpy())
+    else:
+        digest.update(repr(value).encode("utf-8"))
@@ -0,0 +1,337 @@
+# Python Built-in Modules
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional
+
+_ACTIVE_SINK: ContextVar[Optional["Hlm12NliProfilingSink"]] = ContextVar("hlm12nli_profiling_sink", default=None)
+_GLOBAL_SINK: Optional["Hlm12NliProfilingSink"] = None
+
+
+@dataclass(frozen=True)
+class Hlm12NliStageEvent:
+    """
+    A single timed execution of an instrumented stage.
+
+    Attributes:
+        stage: str
+            The name of the stage, e.g. "tokeniser.wordpiece" or "encoder.lstm".
+        seconds: float
+            The wall time spent in the stage. On accelerators, kernels run asynchronously, so this is the time
+            to launch them unless `CUDA_LAUNCH_BLOCKING=1` is set.
+        items: int
+            The number of items processed (texts, words, tokens or rows, depending on the stage).
+        nbytes: int
+            The size of the buffers allocated by the stage, e.g. its output tensor.
+    """
+
+    stage: str = field()
+    seconds: float = field()
+    items: int = field(default=0)
+    nbytes: int = field(default=0)
+
+
+@dataclass(frozen=True)
+class Hlm12NliStageStats:
+    """
+    Aggregate of the events of a stage.
+
+    Attributes:
+        stage: str
+            The name of the stage.
+        calls: int
+            The number of executions.
+        seconds: float
+            The total wall time.
+        min_seconds: float
+            The shortest execution.
+        max_seconds: float
+            The longest execution.
+        items: int
+            The total number of items processed.
+        nbytes: int
+            The total size of the buffers allocated.
+    """
+
+    stage: str = field()
+    calls: int = field()
+    seconds: float = field()
+    min_seconds: float = field()
+    max_seconds: float = field()
+    items: int = field()
+    nbytes: int = field()
+
+    @property
+    def mean_seconds(self) -> float:
+        """
+        Returns the mean wall time of an execution.
+        """
+        return self.seconds / self.calls if self.calls else 0.0
+
+
+class Hlm12NliProfilingSink:
+    """
+    Receives the events of the instrumented stages; subclasses decide what to do with them.
+    Sinks may receive events from several threads at once.
+    """
+
+    def record(self, event: Hlm12NliStageEvent) -> None:
+        """
+        Receives the event of a stage that just finished.
+        """
+        raise NotImplementedError
+
+
+class Hlm12NliMemorySink(Hlm12NliProfilingSink):
+    """
+    Aggregates the events per stage in memory, keeping the stages in the order they first ran.
+    """
+
+    def __init__(self) -> None:
+        """
+        Constructs a new, empty Hlm12NliMemorySink.
+        """
+        self._lock = threading.Lock()
+        self._stats: Dict[str, List[float]] = {}
+
+    def record(self, event: Hlm12NliStageEvent) -> None:
+        with self._lock:
+            stats = self._stats.get(event.stage)
+            if stats is None:
+                self._stats[event.stage] = [1, event.seconds, event.seconds, event.seconds, event.items, event.nbytes]
+                return
+            stats[0] += 1
+            stats[1] += event.seconds
+            stats[2] = min(stats[2], event.seconds)
+            stats[3] = max(stats[3], event.seconds)
+            stats[4] += event.items
+            stats[5] += event.nbytes
+
+    def summary(self) -> Dict[str, Hlm12NliStageStats]:
+        """
+        Returns the aggregate of each stage recorded so far.
+        """
+        with self._lock:
+            return {
+                stage: Hlm12NliStageStats(
+                    stage=stage,
+                    calls=int(calls),
+                    seconds=seconds,
+                    min_seconds=min_seconds,
+                    max_seconds=max_seconds,
+                    items=int(items),
+                    nbytes=int(nbytes),
+                )
+                for stage, (calls, seconds, min_seconds, max_seconds, items, nbytes) in self._stats.items()
+            }
+
+    def reset(self) -> None:
+        """
+        Forgets every event recorded so far.
+        """
+        with self._lock:
+            self._stats.clear()
+
+    def format(self) -> str:
+        """
+        Returns a human-readable table of the aggregates.
+        """
+        lines = [f"{'stage':<24} {'calls':>7} {'total_ms':>10} {'mean_ms':>9} {'items':>9} {'MB':>8}"]
+        for stats in self.summary().values():
+            lines.append(
+                f"{stats.stage:<24} {stats.calls:>7} {stats.seconds * 1000:>10.3f} {stats.mean_seconds * 1000:>9.3f} "
+                f"{stats.items:>9} {stats.nbytes / 2**20:>8.2f}"
+            )
+        return "\n".join(lines)
+
+
+class Hlm12NliLoggingSink(Hlm12NliProfilingSink):
+    """
+    Logs every event.
+
+    Attributes:
+        logger: logging.Logger
+            The logger receiving the events.
+        level: int
+            The level of the log records.
+    """
+
+    logger: logging.Logger
+    level: int
+
+    def __init__(self, logger: Optional[logging.Logger] = None, level: int = logging.DEBUG) -> None:
+        """
+        Constructs a new Hlm12NliLoggingSink.
+
+        Args:
+            logger: logging.Logger | None
+                The logger receiving the events, the `hlm12nli.profiling` logger by default.
+            level: int
+                The level of the log records.
+        """
+        self.logger = logger or logging.getLogger(__name__)
+        self.level = level
+
+    def record(self, event: Hlm12NliStageEvent) -> None:
+        self.logger.log(
+            self.level,
+            "%s took %.3f ms for %d items (%d bytes)",
+            event.stage,
+            event.seconds * 1000,
+            event.items,
+            event.nbytes,
+        )
+
+
+class Hlm12NliPrometheusSink(Hlm12NliMemorySink):
+    """
+    Aggregates the events per stage and renders them in the Prometheus text exposition format,
+    e.g. to be served on a `/metrics` endpoint.
+
+    Attributes:
+        namespace: str
+            The prefix of the metric names.
+    """
+
+    namespace: str
+
+    def __init__(self, namespace: str = "hlm12nli") -> None:
+        """
+        Constructs a new Hlm12NliPrometheusSink.
+
+        Args:
+            namespace: str
+                The prefix of the metric names.
+        """
+        super().__init__()
+        self.namespace = namespace
+
+    def render(self) -> str:
+        """
+        Returns the counters of every stage in the Prometheus text exposition format.
+        """
+        summary = self.summary()
+        metrics = [
+            ("stage_calls_total", "Number of executions of the stage.", lambda stats: stats.calls),
+            ("stage_seconds_total", "Wall time spent in the stage.", lambda stats: stats.seconds),
+            ("stage_items_total", "Number of items processed by the stage.", lambda stats: stats.items),
+            ("stage_bytes_total", "Size of the buffers allocated by the stage.", lambda stats: stats.nbytes),
+        ]
+        lines = []
+        for name, description, value in metrics:
+            name = f"{self.namespace}_{name}"
+            lines.append(f"# HELP {name} {description}")
+            lines.append(f"# TYPE {name} counter")
+            for stage, stats in summary.items():
+                lines.append(f'{name}{{stage="{stage}"}} {value(stats)}')
+        return "\n".join(lines) + "\n"
+
+
+class _Span:
+    __slots__ = ("sink", "stage", "items", "nbytes", "_start")
+
+    def __init__(self, sink: Hlm12NliProfilingSink, stage: str, items: int) -> None:
+        self.sink = sink
+        self.stage = stage
+        self.items = items
+        self.nbytes = 0
+
+    def __enter__(self) -> "_Span":
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *args) -> None:
+        seconds = time.perf_counter() - self._start
+        self.sink.record(Hlm12NliStageEvent(stage=self.stage, seconds=seconds, items=self.items, nbytes=self.nbytes))
+
+    def add(self, items: int = 0, nbytes: int = 0) -> None:
+        self.items += items
+        self.nbytes += nbytes
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, *args) -> None:
+        pass
+
+    def add(self, items: int = 0, nbytes: int = 0) -> None:
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def active_sink() -> Optional[Hlm12NliProfilingSink]:
+    """
+    Returns the sink receiving the events in the current context, if profiling is enabled.
+    """
+    return _ACTIVE_SINK.get() or _GLOBAL_SINK
+
+
+def stage(name: str, items: int = 0):
+    """
+    Returns a context manager timing the stage `name` into the active sink. When profiling is disabled,
+    it is a shared no-op, so that instrumented code only pays for this call.
+
+    Args:
+        name: str
+            The name of the stage.
+        items: int
+            The number of items processed, which can be increased with `add(items=..., nbytes=...)` on the
+            returned context manager once known.
+    """
+    sink = _ACTIVE_SINK.get() or _GLOBAL_SINK
+    if sink is None:
+        return _NULL_SPAN
+    return _Span(sink, name, items)
+
+
+@contextmanager
+def profile(sink: Optional[Hlm12NliProfilingSink] = None) -> Iterator[Hlm12NliProfilingSink]:
+    """
+    Records the stages run within the block (in the current thread or asyncio task) into `sink`,
+    e.g. to capture the profile of a single batch:
+
+        with profile() as sink:
+            encoder(tokeniser.tokenise_ids(texts))
+        print(sink.format())
+
+    Work handed over to other threads is only recorded if they run in a copy of the context,
+    otherwise use `enable`.
+
+    Args:
+        sink: Hlm12NliProfilingSink | None
+            The sink receiving the events, a new `Hlm12NliMemorySink` by default.
+
+    Returns:
+        The sink.
+    """
+    sink = sink if sink is not None else Hlm12NliMemorySink()
+    token = _ACTIVE_SINK.set(sink)
+    try:
+        yield sink
+    finally:
+        _ACTIVE_SINK.reset(token)
+
+
+def enable(sink: Hlm12NliProfilingSink) -> None:
+    """
+    Records the stages run anywhere in the process into `sink`, unless a `profile` block is active.
+    """
+    global _GLOBAL_SINK
+    _GLOBAL_SINK = sink
+
+
+def disable() -> None:
+    """
+    Stops recording the stages enabled with `enable`.
+    """
+    global _GLOBAL_SINK
+    _GLOBAL_SINK = None
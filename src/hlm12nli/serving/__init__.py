@@ -0,0 +1,12 @@
+# Local Folders
+from .metrics import Hlm12NliServingMetrics, Hlm12NliServingStats
+from .server import Hlm12NliEmbeddingClient, Hlm12NliEmbeddingServer
+from .service import Hlm12NliEmbeddingService
+
+__all__ = [
+    "Hlm12NliEmbeddingClient",
+    "Hlm12NliEmbeddingServer",
+    "Hlm12NliEmbeddingService",
+    "Hlm12NliServingMetrics",
+    "Hlm12NliServingStats",
+]
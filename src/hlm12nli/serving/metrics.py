@@ -0,0 +1,133 @@
+# Python Built-in Modules
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict
+
+# Third-Party Libraries
+import numpy as np
+
+
+@dataclass(frozen=True)
+class Hlm12NliServingStats:
+    """
+    Snapshot of the counters of a `Hlm12NliEmbeddingService`.
+
+    Attributes:
+        requests: int
+            The number of requests answered, successfully or not.
+        texts: int
+            The number of texts encoded.
+        batches: int
+            The number of micro-batches run by the encoder.
+        errors: int
+            The number of requests that failed.
+        queued: int
+            The number of requests waiting to be batched.
+        latency_p50_ms: float
+            The median latency of the recent requests, from submission to answer, in milliseconds.
+        latency_p99_ms: float
+            The 99th percentile latency of the recent requests, in milliseconds.
+        latency_mean_ms: float
+            The mean latency of the recent requests, in milliseconds.
+        batch_sizes: Dict[int, int]
+            The histogram of the micro-batch sizes, in texts, mapping each size to the number of batches of that size.
+    """
+
+    requests: int = field()
+    texts: int = field()
+    batches: int = field()
+    errors: int = field()
+    queued: int = field()
+    latency_p50_ms: float = field()
+    latency_p99_ms: float = field()
+    latency_mean_ms: float = field()
+    batch_sizes: Dict[int, int] = field()
+
+    @property
+    def mean_batch_size(self) -> float:
+        """
+        Returns the mean number of texts per micro-batch.
+        """
+        return self.texts / self.batches if self.batches else 0.0
+
+
+class Hlm12NliServingMetrics:
+    """
+    Latency and batch size recorder of a `Hlm12NliEmbeddingService`. Latencies are kept for the
+    `window` most recent requests, so that the percentiles follow the current load; the counters and
+    the batch size histogram cover the lifetime of the service.
+
+    Not thread-safe: it is only updated from the event loop of the service.
+
+    Attributes:
+        window: int
+            The number of recent request latencies the percentiles are computed over.
+    """
+
+    window: int
+
+    def __init__(self, window: int = 10_000) -> None:
+        """
+        Constructs a new Hlm12NliServingMetrics.
+
+        Args:
+            window: int
+                The number of recent request latencies the percentiles are computed over.
+        """
+        if window < 1:
+            raise ValueError(f"window must be positive, got {window}.")
+        self.window = window
+        self.requests = 0
+        self.texts = 0
+        self.batches = 0
+        self.errors = 0
+        self._latencies: Deque[float] = deque(maxlen=window)
+        self._batch_sizes: Counter = Counter()
+
+    def record_request(self, latency: float, failed: bool = False) -> None:
+        """
+        Records an answered request.
+
+        Args:
+            latency: float
+                The time from submission to answer, in seconds.
+            failed: bool
+                Whether the request failed.
+        """
+        self.requests += 1
+        self.errors += int(failed)
+        self._latencies.append(latency)
+
+    def record_batch(self, size: int) -> None:
+        """
+        Records a micro-batch of `size` texts.
+        """
+        self.batches += 1
+        self.texts += size
+        self._batch_sizes[size] += 1
+
+    def stats(self, queued: int = 0) -> Hlm12NliServingStats:
+        """
+        Returns a snapshot of the metrics.
+
+        Args:
+            queued: int
+                The number of requests currently waiting to be batched.
+        """
+        if self._latencies:
+            latencies = np.fromiter(self._latencies, dtype=np.float64) * 1000.0
+            p50, p99 = np.percentile(latencies, [50, 99])
+            mean = latencies.mean()
+        else:
+            p50 = p99 = mean = 0.0
+        return Hlm12NliServingStats(
+            requests=self.requests,
+            texts=self.texts,
+            batches=self.batches,
+            errors=self.errors,
+            queued=queued,
+            latency_p50_ms=float(p50),
+            latency_p99_ms=float(p99),
+            latency_mean_ms=float(mean),
+            batch_sizes=dict(sorted(self._batch_sizes.items())),
+        )
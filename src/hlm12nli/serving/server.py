@@ -0,0 +1,256 @@
+# Python Built-in Modules
+import asyncio
+import dataclasses
+import json
+from http import HTTPStatus
+from typing import Dict, List, Optional, Tuple
+
+# Third-Party Libraries
+import numpy as np
+
+# Local Folders
+from .service import Hlm12NliEmbeddingService
+
+
+class Hlm12NliEmbeddingServer:
+    """
+    Minimal HTTP/1.1 JSON front-end of a `Hlm12NliEmbeddingService`, built on `asyncio` streams
+    so that it needs no web framework. Connections are kept alive between requests.
+
+    Routes:
+        POST /embed, with a body `{"texts": [...]}`, answers `{"embeddings": [[...], ...]}`.
+        GET /stats answers the `Hlm12NliServingStats` of the service.
+        GET /health answers `{"status": "ok"}`.
+
+    Attributes:
+        service: Hlm12NliEmbeddingService
+            The service answering the requests, started and stopped with the server.
+        host: str
+            The interface the server listens on.
+        port: int
+            The port the server listens on, 0 to pick a free one (see `address`).
+        max_request_bytes: int
+            The maximum size of a request body.
+    """
+
+    service: Hlm12NliEmbeddingService
+    host: str
+    port: int
+    max_request_bytes: int
+
+    def __init__(
+        self,
+        service: Hlm12NliEmbeddingService,
+        host: str = "127.0.0.1",
+        port: int = 8080,
+        max_request_bytes: int = 1 << 20,
+    ) -> None:
+        """
+        Constructs a new Hlm12NliEmbeddingServer.
+
+        Args:
+            service: Hlm12NliEmbeddingService
+                The service answering the requests, started and stopped with the server.
+            host: str
+                The interface the server listens on.
+            port: int
+                The port the server listens on, 0 to pick a free one.
+            max_request_bytes: int
+                The maximum size of a request body.
+        """
+        self.service = service
+        self.host = host
+        self.port = port
+        self.max_request_bytes = max_request_bytes
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def __aenter__(self) -> "Hlm12NliEmbeddingServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.stop()
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        """
+        Returns the host and port the server is bound to.
+        """
+        if self._server is None:
+            raise RuntimeError("The server is not running.")
+        host, port = self._server.sockets[0].getsockname()[:2]
+        return host, port
+
+    async def start(self) -> None:
+        """
+        Starts the service and starts listening.
+        """
+        await self.service.start()
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+
+    async def stop(self) -> None:
+        """
+        Stops listening, then stops the service once the pending requests are answered.
+        """
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        await self.service.stop()
+
+    async def serve_forever(self) -> None:
+        """
+        Starts the server and serves until cancelled.
+        """
+        await self.start()
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.stop()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    return
+                method, path = request_line.decode("latin1").split()[:2]
+                headers = await self._read_headers(reader)
+                length = int(headers.get("content-length", 0))
+                if length > self.max_request_bytes:
+                    status, payload = HTTPStatus.REQUEST_ENTITY_TOO_LARGE, {"error": "The request body is too large."}
+                    keep_alive = False
+                else:
+                    body = await reader.readexactly(length)
+                    status, payload = await self._route(method, path, body)
+                    keep_alive = headers.get("connection", "").lower() != "close"
+                self._respond(writer, status, payload, keep_alive)
+                await writer.drain()
+                if not keep_alive:
+                    return
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            return
+        finally:
+            writer.close()
+
+    async def _route(self, method: str, path: str, body: bytes) -> Tuple[HTTPStatus, dict]:
+        routes = {"/embed": "POST", "/stats": "GET", "/health": "GET"}
+        if path not in routes:
+            return HTTPStatus.NOT_FOUND, {"error": f"Unknown path '{path}'."}
+        if method != routes[path]:
+            return HTTPStatus.METHOD_NOT_ALLOWED, {"error": f"{path} only accepts {routes[path]}."}
+        if path == "/health":
+            return HTTPStatus.OK, {"status": "ok"}
+        if path == "/stats":
+            return HTTPStatus.OK, dataclasses.asdict(self.service.stats())
+        try:
+            texts = json.loads(body)["texts"]
+        except (ValueError, KeyError, TypeError):
+            return HTTPStatus.BAD_REQUEST, {"error": 'Expected a JSON body {"texts": [...]}.'}
+        if not isinstance(texts, list) or not all(isinstance(text, str) for text in texts):
+            return HTTPStatus.BAD_REQUEST, {"error": "Expected texts to be a list of strings."}
+        try:
+            embeddings = await self.service.embed(texts)
+        except Exception as e:
+            return HTTPStatus.INTERNAL_SERVER_ERROR, {"error": str(e)}
+        return HTTPStatus.OK, {"embeddings": embeddings.tolist()}
+
+    @staticmethod
+    async def _read_headers(reader: asyncio.StreamReader) -> Dict[str, str]:
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                return headers
+            name, _, value = line.decode("latin1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+    @staticmethod
+    def _respond(writer: asyncio.StreamWriter, status: HTTPStatus, payload: dict, keep_alive: bool) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        head = (
+            f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+            "Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+        )
+        writer.write(head.encode("latin1") + body)
+
+
+class Hlm12NliEmbeddingClient:
+    """
+    Asynchronous client of a `Hlm12NliEmbeddingServer`, e.g. to test or benchmark a server running
+    in the same process. Each call opens its own connection, so concurrent calls are independent requests.
+
+    Attributes:
+        host: str
+            The host of the server.
+        port: int
+            The port of the server.
+    """
+
+    host: str
+    port: int
+
+    def __init__(self, host: str, port: int) -> None:
+        """
+        Constructs a new Hlm12NliEmbeddingClient.
+
+        Args:
+            host: str
+                The host of the server, e.g. `Hlm12NliEmbeddingServer.address[0]`.
+            port: int
+                The port of the server, e.g. `Hlm12NliEmbeddingServer.address[1]`.
+        """
+        self.host = host
+        self.port = port
+
+    async def embed(self, texts: List[str]) -> np.ndarray:
+        """
+        Returns the embeddings of the texts, of shape [len(texts), output_dims].
+        """
+        payload = await self.request("POST", "/embed", {"texts": texts})
+        return np.asarray(payload["embeddings"], dtype=np.float32)
+
+    async def stats(self) -> dict:
+        """
+        Returns the serving stats of the server.
+        """
+        return await self.request("GET", "/stats")
+
+    async def request(self, method: str, path: str, payload: Optional[dict] = None) -> dict:
+        """
+        Sends a request to the server and returns its decoded JSON answer.
+
+        Args:
+            method: str
+                The HTTP method.
+            path: str
+                The path of the route.
+            payload: dict | None
+                The JSON body of the request.
+
+        Returns:
+            The JSON body of the answer.
+        """
+        body = json.dumps(payload).encode("utf-8") if payload is not None else b""
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        try:
+            head = (
+                f"{method} {path} HTTP/1.1\r\n"
+                f"Host: {self.host}:{self.port}\r\n"
+                "Content-Type: application/json\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                "Connection: close\r\n\r\n"
+            )
+            writer.write(head.encode("latin1") + body)
+            await writer.drain()
+            status = int((await reader.readline()).split()[1])
+            headers = await Hlm12NliEmbeddingServer._read_headers(reader)
+            answer = json.loads(await reader.readexactly(int(headers["content-length"])))
+        finally:
+            writer.close()
+            await writer.wait_closed()
+        if status != HTTPStatus.OK:
+            raise RuntimeError(f"The server answered {method} {path} with {status}: {answer.get('error')}")
+        return answer
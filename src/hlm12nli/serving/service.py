@@ -0,0 +1,247 @@
+# Python Built-in Modules
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import List, Optional, Set
+
+# Third-Party Libraries
+import numpy as np
+import torch
+
+# My Packages and Modules
+from hlm12nli.modelling.batching import Hlm12NliBucketBatcher, warn_if_padding_dependent
+from hlm12nli.modelling.encoder import Hlm12NliEncoder
+from hlm12nli.tokenisation import Hlm12NliTokeniser
+
+# Local Folders
+from .metrics import Hlm12NliServingMetrics, Hlm12NliServingStats
+
+_STOP = object()
+
+
+@dataclass
+class _Request:
+    texts: List[str] = field()
+    future: asyncio.Future = field()
+    submitted: float = field()
+
+
+class Hlm12NliEmbeddingService:
+    """
+    Asynchronous embedding service that coalesces concurrent requests into micro-batches, so that
+    many small requests share a single forward pass of the encoder.
+
+    A micro-batch is closed as soon as it holds `max_batch_size` texts, or `max_wait_ms` after its first
+    request was submitted (time spent queueing included), whichever comes first; a single request larger than `max_batch_size` forms a batch
+    on its own. Batches are tokenised and encoded, bucketed by length, in a pool of `n_workers` threads
+    (the encoder releases the GIL while computing), so the event loop keeps accepting requests meanwhile.
+    While every worker is busy, new requests keep queueing, so batches grow with the load.
+
+    Attributes:
+        tokeniser: Hlm12NliTokeniser
+            The tokeniser used to encode the texts.
+        encoder: Hlm12NliEncoder
+            The encoder producing the embeddings.
+        batcher: Hlm12NliBucketBatcher
+            The batcher grouping the texts of a micro-batch by length.
+        max_batch_size: int
+            The maximum number of texts per micro-batch.
+        max_wait_ms: float
+            The maximum time a request waits for others to share its micro-batch, in milliseconds.
+        n_workers: int
+            The number of micro-batches encoded concurrently.
+        metrics: Hlm12NliServingMetrics
+            The latency and batch size recorder.
+    """
+
+    tokeniser: Hlm12NliTokeniser
+    encoder: Hlm12NliEncoder
+    batcher: Hlm12NliBucketBatcher
+    max_batch_size: int
+    max_wait_ms: float
+    n_workers: int
+    metrics: Hlm12NliServingMetrics
+
+    def __init__(
+        self,
+        tokeniser: Hlm12NliTokeniser,
+        encoder: Hlm12NliEncoder,
+        max_batch_size: int = 64,
+        max_wait_ms: float = 5.0,
+        max_batch_tokens: int = 8192,
+        n_workers: int = 1,
+        latency_window: int = 10_000,
+    ) -> None:
+        """
+        Constructs a new Hlm12NliEmbeddingService, which must be started (or entered) within an event loop.
+
+        Args:
+            tokeniser: Hlm12NliTokeniser
+                The tokeniser used to encode the texts.
+            encoder: Hlm12NliEncoder
+                The encoder producing the embeddings, in evaluation mode.
+            max_batch_size: int
+                The maximum number of texts per micro-batch.
+            max_wait_ms: float
+                The maximum time a request waits for others to share its micro-batch, in milliseconds.
+            max_batch_tokens: int
+                The maximum number of padded tokens per forward pass within a micro-batch.
+            n_workers: int
+                The number of micro-batches encoded concurrently.
+            latency_window: int
+                The number of recent request latencies the percentiles are computed over.
+        """
+        if max_batch_size < 1 or n_workers < 1:
+            raise ValueError(f"max_batch_size and n_workers must be positive, got {max_batch_size} and {n_workers}.")
+        if max_wait_ms < 0:
+            raise ValueError(f"max_wait_ms must not be negative, got {max_wait_ms}.")
+        warn_if_padding_dependent(encoder)
+        self.tokeniser = tokeniser
+        self.encoder = encoder
+        self.batcher = Hlm12NliBucketBatcher(tokeniser, max_batch_tokens=max_batch_tokens)
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self.n_workers = n_workers
+        self.metrics = Hlm12NliServingMetrics(window=latency_window)
+        self._tokeniser_lock = threading.Lock()
+        self._queue: Optional[asyncio.Queue] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._collector: Optional[asyncio.Task] = None
+        self._in_flight: Set[asyncio.Task] = set()
+        self._carry: Optional[_Request] = None
+
+    async def __aenter__(self) -> "Hlm12NliEmbeddingService":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.stop()
+
+    @property
+    def is_running(self) -> bool:
+        """
+        Returns whether the service accepts requests.
+        """
+        return self._collector is not None
+
+    async def start(self) -> None:
+        """
+        Starts the worker pool and the task coalescing the requests into micro-batches.
+        """
+        if self.is_running:
+            return
+        self._queue = asyncio.Queue()
+        self._slots = asyncio.Semaphore(self.n_workers)
+        self._executor = ThreadPoolExecutor(max_workers=self.n_workers, thread_name_prefix="hlm12nli-serving")
+        self._collector = asyncio.get_running_loop().create_task(self._collect())
+
+    async def stop(self) -> None:
+        """
+        Stops accepting requests, answers those already submitted and shuts the worker pool down.
+        """
+        if not self.is_running:
+            return
+        collector, self._collector = self._collector, None
+        self._queue.put_nowait(_STOP)
+        await collector
+        if self._in_flight:
+            await asyncio.gather(*self._in_flight, return_exceptions=True)
+        self._executor.shutdown(wait=True)
+
+    async def embed(self, texts: List[str]) -> np.ndarray:
+        """
+        Returns the embeddings of the texts, encoded together with those of the concurrent requests.
+
+        Args:
+            texts: List[str]
+                The texts to embed.
+
+        Returns:
+            The embeddings, of shape [len(texts), output_dims].
+        """
+        if not self.is_running:
+            raise RuntimeError("The embedding service is not running, call `start` first.")
+        if not texts:
+            return np.empty((0, self.encoder.config.output_dims), dtype=np.float32)
+        loop = asyncio.get_running_loop()
+        request = _Request(texts=list(texts), future=loop.create_future(), submitted=loop.time())
+        self._queue.put_nowait(request)
+        return await request.future
+
+    def stats(self) -> Hlm12NliServingStats:
+        """
+        Returns a snapshot of the latency and batch size metrics.
+        """
+        queued = 0
+        if self._queue is not None:
+            queued = self._queue.qsize() + isinstance(self._carry, _Request)
+        return self.metrics.stats(queued=queued)
+
+    async def _collect(self) -> None:
+        loop = asyncio.get_running_loop()
+        max_wait = self.max_wait_ms / 1000.0
+        while True:
+            await self._slots.acquire()
+            first, self._carry = self._carry or await self._queue.get(), None
+            if first is _STOP:
+                return
+            batch, size = [first], len(first.texts)
+            deadline = first.submitted + max_wait
+            stopping = False
+            while size < self.max_batch_size:
+                try:
+                    item = self._queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        item = await asyncio.wait_for(self._queue.get(), timeout)
+                    except asyncio.TimeoutError:
+                        break
+                if item is _STOP:
+                    stopping = True
+                    break
+                if size + len(item.texts) > self.max_batch_size:
+                    self._carry = item
+                    break
+                batch.append(item)
+                size += len(item.texts)
+            task = loop.create_task(self._run(batch))
+            self._in_flight.add(task)
+            task.add_done_callback(self._in_flight.discard)
+            if stopping:
+                self._carry = _STOP
+
+    async def _run(self, batch: List[_Request]) -> None:
+        loop = asyncio.get_running_loop()
+        texts = [text for request in batch for text in request.texts]
+        try:
+            embeddings = await loop.run_in_executor(self._executor, self._encode, texts)
+        except Exception as e:
+            for request in batch:
+                if not request.future.done():
+                    request.future.set_exception(e)
+                self.metrics.record_request(loop.time() - request.submitted, failed=True)
+        else:
+            offset = 0
+            for request in batch:
+                end = offset + len(request.texts)
+                if not request.future.done():
+                    request.future.set_result(embeddings[offset:end])
+                self.metrics.record_request(loop.time() - request.submitted)
+                offset = end
+        finally:
+            self.metrics.record_batch(len(texts))
+            self._slots.release()
+
+    def _encode(self, texts: List[str]) -> np.ndarray:
+        with self._tokeniser_lock:
+            batches = list(self.batcher.batches(texts))
+        embeddings = np.empty((len(texts), self.encoder.config.output_dims), dtype=np.float32)
+        with torch.inference_mode():
+            for positions, x in batches:
+                embeddings[positions] = self.encoder(x).embeddings.float().cpu().numpy()
+        return embeddings
@@ -1,10 +1,11 @@
 # Local Folders
 from .config import Hlm12NliTextTokeniserConfig
-from .output import Hlm12NliTokeniserOutput
+from .output import Hlm12NliTokeniserIdsOutput, Hlm12NliTokeniserOutput
 from .tokeniser import Hlm12NliTokeniser
 
 __all__ = [
     "Hlm12NliTextTokeniserConfig",
     "Hlm12NliTokeniser",
+    "Hlm12NliTokeniserIdsOutput",
     "Hlm12NliTokeniserOutput",
 ]
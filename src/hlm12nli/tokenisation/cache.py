@@ -0,0 +1,146 @@
+# Python Built-in Modules
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Hashable, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class Hlm12NliWordCacheStats:
+    """
+    Snapshot of the counters of a `Hlm12NliWordCache`.
+
+    Attributes:
+        hits: int
+            The number of lookups that found the word in the cache.
+        misses: int
+            The number of lookups that did not find the word in the cache.
+        evictions: int
+            The number of entries removed to keep the cache within its capacity.
+        invalidations: int
+            The number of times the cache was cleared because the vocabulary or normalisation changed.
+        size: int
+            The number of entries currently in the cache.
+        capacity: int
+            The maximum number of entries the cache holds.
+    """
+
+    hits: int = field()
+    misses: int = field()
+    evictions: int = field()
+    invalidations: int = field()
+    size: int = field()
+    capacity: int = field()
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        Returns the ratio of lookups that were served from the cache.
+        """
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class Hlm12NliWordCache:
+    """
+    Bounded memoization of word segmentations (word -> (subtokens, subtoken ids)), so that
+    frequent words are only split by the wordpiece algorithm and looked up in the vocabulary once.
+
+    Attributes:
+        capacity: The maximum number of words kept, 0 disables the cache.
+        policy: The eviction policy, "lru" (least recently used) or "fifo" (first in, first out).
+        hits: The number of lookups that found the word in the cache.
+        misses: The number of lookups that did not find the word in the cache.
+        evictions: The number of entries removed to keep the cache within its capacity.
+        invalidations: The number of times the cache was cleared by `invalidate`.
+    """
+
+    capacity: int
+    policy: str
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+
+    def __init__(self, capacity: int, policy: str = "lru") -> None:
+        """
+        Constructs a new Hlm12NliWordCache.
+
+        Args:
+            capacity: The maximum number of words kept, 0 disables the cache.
+            policy: The eviction policy, "lru" (least recently used) or "fifo" (first in, first out).
+        """
+        if capacity < 0:
+            raise ValueError(f"The word cache capacity must not be negative, got {capacity}.")
+        if policy not in ("lru", "fifo"):
+            raise ValueError(f"Unknown word cache policy '{policy}', expected 'lru' or 'fifo'.")
+        self.capacity = capacity
+        self.policy = policy
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self._entries: "OrderedDict[Hashable, Tuple]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def enabled(self) -> bool:
+        """
+        Returns whether the cache stores any entries at all.
+        """
+        return self.capacity > 0
+
+    def get(self, key: Hashable) -> Optional[Tuple]:
+        """
+        Looks up a word, refreshing its recency when using the "lru" policy.
+
+        Args:
+            key: The word to look up.
+
+        Returns:
+            The cached value, or None when the word is not in the cache.
+        """
+        value = self._entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        if self.policy == "lru":
+            self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: Hashable, value: Tuple) -> None:
+        """
+        Stores the value of a word, evicting the oldest entry if the capacity is exceeded.
+
+        Args:
+            key: The word to store.
+            value: The segmentation of the word.
+        """
+        if self.capacity <= 0:
+            return
+        self._entries[key] = value
+        if len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self) -> None:
+        """
+        Removes every entry, keeping the counters.
+        """
+        self._entries.clear()
+        self.invalidations += 1
+
+    def stats(self) -> Hlm12NliWordCacheStats:
+        """
+        Returns a snapshot of the counters of the cache.
+        """
+        return Hlm12NliWordCacheStats(
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            invalidations=self.invalidations,
+            size=len(self._entries),
+            capacity=self.capacity,
+        )
@@ -32,12 +32,22 @@ class Hlm12NliTextTokeniserConfig(NestMLTextTokeniserConfigBase):
             The expression used to mark subwords.
         do_lowercase: bool
             Whether to lowercase the input.
+        wordpiece_engine: str
+            The wordpiece matching engine, "greedy" (longest-match-first) or "trie" (linear-time automaton).
+            Both produce the same tokens.
+        word_cache_capacity: int
+            The maximum number of word segmentations memoized by the tokeniser, 0 disables the cache.
+        word_cache_policy: str
+            The eviction policy of the word cache, "lru" or "fifo".
     """
 
     token_str: str = field(default="[STR]")
     token_end: str = field(default="[END]")
     expr_subword: str = field(default="##")
     do_lowercase: bool = field(default=True)
+    wordpiece_engine: str = field(default="greedy")
+    word_cache_capacity: int = field(default=65536)
+    word_cache_policy: str = field(default="lru")
 
     def __post_init__(self):
         self.special_tokens.add(self.token_str)
@@ -0,0 +1,38 @@
+# Python Built-in Modules
+import dataclasses
+import hashlib
+import json
+from collections.abc import Mapping
+from typing import Any
+
+
+def fingerprint(*objects: Any) -> str:
+    """
+    Computes a stable hash of configurations (dataclasses, dicts, lists, sets and scalars), used to tell
+    whether artifacts derived from them (caches, compiled vocabularies, shards) are still valid.
+
+    Args:
+        objects: The configurations to hash, in order.
+
+    Returns:
+        The hexadecimal sha256 digest of the canonical JSON representation of the objects.
+    """
+    payload = json.dumps([_canonical(obj) for obj in objects], sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _canonical(obj: Any) -> Any:
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return {
+            "__type__": type(obj).__name__,
+            **{f.name: _canonical(getattr(obj, f.name)) for f in dataclasses.fields(obj)},
+        }
+    if isinstance(obj, Mapping):
+        return {str(k): _canonical(v) for k, v in obj.items()}
+    if isinstance(obj, (set, frozenset)):
+        return sorted(_canonical(v) for v in obj)
+    if isinstance(obj, (list, tuple)):
+        return [_canonical(v) for v in obj]
+    if obj is None or isinstance(obj, (bool, int, float, str)):
+        return obj
+    return repr(obj)
@@ -1,51 +1,86 @@
 # Python Built-in Modules
-from copy import deepcopy
-from typing import List
+from typing import AbstractSet, Iterable, List, Optional, Sequence
+
+# Third-Party Libraries
+import numpy as np
 
 
 class Hlm12NliTokeniserJoiner:
     """
-    Joins subtokens to tokens and then joins tokens to a text.
+    Joins subtokens to tokens and then joins tokens to a text, in a single pass over each sequence.
     """
 
     expr_subword: str
+    special_tokens: AbstractSet[str]
 
-    def __init__(self, expr_subword: str) -> None:
+    def __init__(self, expr_subword: str, special_tokens: Optional[Iterable[str]] = None) -> None:
         """
         Constructs a new instance of Hlm12NliTokeniserJoiner.
 
         Args:
             expr_subword: The subword to join to the previous token.
+            special_tokens: The tokens (start, end, padding...) dropped when ignoring special tokens.
         """
         self.expr_subword = expr_subword
+        self.special_tokens = frozenset(special_tokens or ())
 
-    def __call__(self, x: List[List[str]]) -> List[str]:
+    def __call__(self, x: List[List[str]], ignore_special_tokens: bool = False) -> List[str]:
         """
-        First glue subtokens to their original tokens, the joins them separating
+        First glue subtokens to their original tokens, then joins them separating
         them by whitespace.
 
         Args:
             x: The subtokens to join.
+            ignore_special_tokens: Whether to drop the special tokens (including padding).
 
         Returns:
             The sentence representing the joined tokens, with or without special tokens.
         """
-        y = self._glue_subtokens_to_tokens(x)
-        y = self._join_tokens(y)
-        return y
-
-    def _glue_subtokens_to_tokens(self, x: List[List[str]]) -> List[str]:
-        expr_len = len(self.expr_subword)
-        y = deepcopy(x)
-        for y_index in range(len(y)):
-            seq = y[y_index]
-            for seq_index in range(len(seq)):
-                i = len(x) - seq_index - 1
-                token = seq[i]
-                if token.startswith(self.expr_subword):
-                    y[y_index][i - 1] += y[y_index][i][expr_len:]
-                    del y[y_index][i]
-            return y
-
-    def _join_tokens(self, x: List[List[str]]) -> List[str]:
-        return [" ".join(xi) for xi in x]
+        skip = self.special_tokens if ignore_special_tokens else frozenset()
+        return [self._join(seq, skip) for seq in x]
+
+    def join_ids(
+        self,
+        x: np.ndarray,
+        id_to_token: Sequence[Optional[str]],
+        lengths: Optional[np.ndarray] = None,
+        ignore_special_tokens: bool = True,
+    ) -> List[str]:
+        """
+        Decodes token ids straight into texts, without materialising the padded subtokens.
+
+        Args:
+            x: The token ids, of shape [batch_size, seq_len], or a list of sequences of ids.
+            id_to_token: The reverse vocabulary, the token at the index of each id.
+            lengths: The length of each sequence, so that the padding after it is never decoded.
+            ignore_special_tokens: Whether to drop the special tokens (including padding).
+
+        Returns:
+            The sentence representing each sequence of ids.
+        """
+        if isinstance(x, np.ndarray):
+            x = x.tolist()
+        if lengths is not None:
+            x = [seq[:n] for seq, n in zip(x, np.asarray(lengths).tolist())]
+        skip = self.special_tokens if ignore_special_tokens else frozenset()
+        try:
+            return [self._join([id_to_token[i] for i in seq], skip) for seq in x]
+        except IndexError as e:
+            raise ValueError(f"Token id out of the vocabulary of {len(id_to_token)} tokens.") from e
+
+    def _join(self, seq: Iterable[Optional[str]], skip: AbstractSet[str]) -> str:
+        expr_subword = self.expr_subword
+        expr_len = len(expr_subword)
+        parts: List[str] = []
+        for token in seq:
+            if token is None:
+                raise ValueError("Token id not in the vocabulary.")
+            if token in skip:
+                continue
+            if parts and token.startswith(expr_subword):
+                parts.append(token[expr_len:])
+            else:
+                if parts:
+                    parts.append(" ")
+                parts.append(token)
+        return "".join(parts)
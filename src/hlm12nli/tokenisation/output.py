@@ -1,40 +1,209 @@
 # Python Built-in Modules
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple, Union
 
 # Third-Party Libraries
-import torch
+import numpy as np
 from nest_ml.text.tokenisation import NestMLTextTokeniserOutputBase
 
+# My Packages and Modules
+from hlm12nli.profiling import stage
 
-@dataclass(frozen=True)
-class Hlm12NliTokeniserOutput(NestMLTextTokeniserOutputBase):
+if TYPE_CHECKING:
+    # Third-Party Libraries
+    import torch
+
+
+def _import_torch():
+    # Third-Party Libraries
+    import torch
+
+    return torch
+
+
+class Hlm12NliTensorConversionMixin:
     """
-    Represents the output of the Hlm12NliTokeniser, including
-    tokens, padded_tokens, encoded_tokens, and mask.
+    Converts the padded `encoded_tokens` and `mask` into tensors, going through a contiguous
+    NumPy buffer that `torch.from_numpy` shares without copying. The tensors are cached per
+    device, so repeated calls (e.g. once per forward pass) do not convert again.
+
+    `torch` is only imported on the first conversion, so that tokenising does not require it.
+
+    The cached tensors share memory with the buffers, which must therefore not be mutated.
     """
 
-    def encoded_tokens_to_tensor(self, device: torch.device = None) -> torch.LongTensor:
+    encoded_tokens: Union[List[List[int]], np.ndarray]
+    mask: Union[List[List[bool]], np.ndarray]
+
+    @cached_property
+    def encoded_tokens_array(self) -> np.ndarray:
+        """
+        Returns the padded encoded tokens as a contiguous int64 array, built once.
+        """
+        with stage("tokeniser.to_tensor", items=len(self.encoded_tokens)) as span:
+            array = np.ascontiguousarray(self.encoded_tokens, dtype=np.int64)
+            span.add(nbytes=array.nbytes)
+        return array
+
+    @cached_property
+    def mask_array(self) -> np.ndarray:
+        """
+        Returns the padded mask as a contiguous boolean array, built once.
+        """
+        with stage("tokeniser.to_tensor", items=len(self.mask)) as span:
+            array = np.ascontiguousarray(self.mask, dtype=np.bool_)
+            span.add(nbytes=array.nbytes)
+        return array
+
+    @cached_property
+    def _tensors(self) -> Dict[Tuple[str, "torch.device", bool], "torch.Tensor"]:
+        return {}
+
+    def encoded_tokens_to_tensor(
+        self,
+        device: Optional["torch.device"] = None,
+        non_blocking: bool = False,
+    ) -> "torch.LongTensor":
         """
         Requires encoded_tokens to be already padded and converts the encoded_tokens to a tensor.
 
         Args:
             device: torch.device
                 The device to move the tensor to.
+            non_blocking: bool
+                Whether to copy asynchronously to an accelerator, staging the tensor in pinned memory.
         """
-        tensor = torch.LongTensor(self.encoded_tokens)
-        if device is not None:
-            tensor = tensor.to(device)
-        return tensor
+        return self._to_tensor("encoded_tokens", self.encoded_tokens_array, device, non_blocking)
 
-    def mask_to_tensor(self, device: torch.device = None) -> torch.BoolTensor:
+    def mask_to_tensor(
+        self,
+        device: Optional["torch.device"] = None,
+        non_blocking: bool = False,
+    ) -> "torch.BoolTensor":
         """
         Requires mask to be already padded and converts the mask to a tensor.
 
         Args:
             device: torch.device
                 The device to move the tensor to.
+            non_blocking: bool
+                Whether to copy asynchronously to an accelerator, staging the tensor in pinned memory.
         """
-        tensor = torch.BoolTensor(self.mask)
-        if device is not None:
-            tensor = tensor.to(device)
+        return self._to_tensor("mask", self.mask_array, device, non_blocking)
+
+    def lengths_to_tensor(self) -> "torch.LongTensor":
+        """
+        Returns the number of non-padding positions of each sequence, as a CPU tensor
+        (as required by `torch.nn.utils.rnn.pack_padded_sequence`).
+        """
+        torch = _import_torch()
+        cpu = torch.device("cpu")
+        tensor = self._tensors.get(("lengths", cpu, False))
+        if tensor is None:
+            tensor = torch.from_numpy(self.mask_array.sum(axis=1, dtype=np.int64))
+            self._tensors[("lengths", cpu, False)] = tensor
         return tensor
+
+    def _to_tensor(
+        self,
+        name: str,
+        array: np.ndarray,
+        device: Optional["torch.device"],
+        non_blocking: bool,
+    ) -> "torch.Tensor":
+        torch = _import_torch()
+        cpu = torch.device("cpu")
+        device = cpu if device is None else torch.device(device)
+        key = (name, device, False)
+        tensor = self._tensors.get(key)
+        if tensor is not None:
+            return tensor
+        source = self._tensors.get((name, cpu, False))
+        if source is None:
+            source = torch.from_numpy(array)
+            self._tensors[(name, cpu, False)] = source
+        if device.type != "cpu":
+            if non_blocking and torch.cuda.is_available():
+                pinned = self._tensors.get((name, cpu, True))
+                if pinned is None:
+                    pinned = source.pin_memory()
+                    self._tensors[(name, cpu, True)] = pinned
+                source = pinned
+            with stage("tokeniser.to_device", items=len(array)) as span:
+                tensor = source.to(device, non_blocking=non_blocking)
+                span.add(nbytes=array.nbytes)
+            self._tensors[key] = tensor
+            return tensor
+        return source
+
+
+@dataclass(frozen=True)
+class Hlm12NliTokeniserOutput(Hlm12NliTensorConversionMixin, NestMLTextTokeniserOutputBase):
+    """
+    Represents the output of the Hlm12NliTokeniser, including
+    tokens, padded_tokens, encoded_tokens, and mask.
+
+    The `encoded_tokens` and `mask` may either be lists or arrays, in which case
+    the tensors are created from the arrays without copying.
+    """
+
+    pass
+
+
+@dataclass(frozen=True)
+class Hlm12NliTokeniserIdsOutput(Hlm12NliTensorConversionMixin):
+    """
+    Represents the output of `Hlm12NliTokeniser.tokenise_ids`, holding the padded token ids
+    in a preallocated array, from which tensors are created without copying. The string tokens
+    are only built, as a `Hlm12NliTokeniserOutput`, when they are first requested.
+
+    Attributes:
+        encoded_tokens: np.ndarray
+            The padded token ids, of shape [batch_size, seq_len].
+        mask: np.ndarray
+            The boolean mask of the non-padding positions, of shape [batch_size, seq_len].
+        lengths: np.ndarray
+            The number of non-padding positions of each sequence, of shape [batch_size].
+        id_to_token: Sequence[Optional[str]]
+            The reverse vocabulary, used to build the string tokens.
+        token_pad: str
+            The token used for padding.
+    """
+
+    encoded_tokens: np.ndarray = field()
+    mask: np.ndarray = field()
+    lengths: np.ndarray = field()
+    id_to_token: Sequence[Optional[str]] = field(repr=False)
+    token_pad: str = field()
+
+    def __len__(self) -> int:
+        return len(self.encoded_tokens)
+
+    @cached_property
+    def output(self) -> Hlm12NliTokeniserOutput:
+        """
+        Returns the equivalent `Hlm12NliTokeniserOutput`, built on first access.
+        """
+        tokens = [[self.id_to_token[i] for i in row[:n]] for row, n in zip(self.encoded_tokens.tolist(), self.lengths)]
+        seq_len = self.encoded_tokens.shape[1]
+        return Hlm12NliTokeniserOutput(
+            tokens=tokens,
+            padded_tokens=[t + [self.token_pad] * (seq_len - len(t)) for t in tokens],
+            encoded_tokens=self.encoded_tokens,
+            mask=self.mask,
+        )
+
+    @property
+    def tokens(self) -> List[List[str]]:
+        """
+        Returns the tokens of each sequence, without padding.
+        """
+        return self.output.tokens
+
+    @property
+    def padded_tokens(self) -> List[List[str]]:
+        """
+        Returns the tokens of each sequence, padded to the sequence length.
+        """
+        return self.output.padded_tokens
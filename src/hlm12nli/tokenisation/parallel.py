@@ -0,0 +1,213 @@
+# Python Built-in Modules
+import multiprocessing
+import os
+import sys
+import weakref
+from multiprocessing import shared_memory
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# Third-Party Libraries
+import numpy as np
+
+# Local Folders
+from .output import Hlm12NliTokeniserIdsOutput
+from .tokeniser import Hlm12NliTokeniser
+
+_WORKER: Dict[str, object] = {}
+
+
+class Hlm12NliParallelTokeniser:
+    """
+    Tokenises large batches of texts across a pool of processes, each writing the token ids of its
+    shard of texts straight into a buffer in shared memory, so that no ids are sent back through pipes.
+
+    The tokeniser (and its vocabulary) is handed to each worker once, when the worker starts (inherited
+    without pickling with the "fork" start method), rather than with every shard. Batches smaller than
+    `min_parallel_size` are tokenised in-process, where the pool overhead would dominate.
+
+    The shared buffer is allocated with `seq_len` (or `max_seq_len`) columns, since the longest sequence is only
+    known once the workers are done. Outputs padded to the full width are views of it; outputs trimmed to their
+    longest sequence are compacted into a contiguous copy once, so that their tensor conversions stay zero-copy.
+    The buffer's name is unlinked as soon as the workers are done, and its memory is released once every output
+    referencing it has been collected.
+
+    Attributes:
+        tokeniser: Hlm12NliTokeniser
+            The tokeniser to run in each worker.
+        processes: int
+            The number of worker processes.
+        shard_size: int
+            The number of texts tokenised by a worker per task.
+        min_parallel_size: int
+            The number of texts below which the batch is tokenised in-process.
+        dtype: np.dtype
+            The integer type of the token ids.
+    """
+
+    tokeniser: Hlm12NliTokeniser
+    processes: int
+    shard_size: int
+    min_parallel_size: int
+    dtype: np.dtype
+
+    def __init__(
+        self,
+        tokeniser: Hlm12NliTokeniser,
+        processes: Optional[int] = None,
+        shard_size: int = 1024,
+        min_parallel_size: int = 4096,
+        dtype: np.dtype = np.int32,
+        start_method: Optional[str] = None,
+    ) -> None:
+        """
+        Constructs a new Hlm12NliParallelTokeniser. The pool is only started on the first parallel batch.
+
+        Args:
+            tokeniser: Hlm12NliTokeniser
+                The tokeniser to run in each worker.
+            processes: int | None
+                The number of worker processes, defaults to the number of available cores.
+            shard_size: int
+                The number of texts tokenised by a worker per task.
+            min_parallel_size: int
+                The number of texts below which the batch is tokenised in-process.
+            dtype: np.dtype
+                The integer type of the token ids.
+            start_method: str | None
+                The multiprocessing start method, defaults to "fork" where available.
+        """
+        if shard_size < 1:
+            raise ValueError(f"shard_size must be positive, got {shard_size}.")
+        self.tokeniser = tokeniser
+        self.processes = processes or _available_cores()
+        self.shard_size = shard_size
+        self.min_parallel_size = min_parallel_size
+        self.dtype = np.dtype(dtype)
+        if start_method is None:
+            start_method = "fork" if "fork" in multiprocessing.get_all_start_methods() else "spawn"
+        self._context = multiprocessing.get_context(start_method)
+        self._pool = None
+
+    def __enter__(self) -> "Hlm12NliParallelTokeniser":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Terminates the worker processes.
+        """
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def tokenise_ids(self, x: List[str]) -> Hlm12NliTokeniserIdsOutput:
+        """
+        Tokenises the texts, equivalent to `Hlm12NliTokeniser.tokenise_ids`.
+
+        Args:
+            x: List[str]
+                The texts to tokenise.
+
+        Returns:
+            The padded token ids, their mask and the length of each sequence.
+        """
+        if not self._is_parallel(x):
+            return self.tokeniser.tokenise_ids(x, dtype=self.dtype)
+        buffers = self._buffers(len(x))
+        for _ in self._run(x, buffers):
+            pass
+        _, encoded, lengths = buffers
+        del buffers
+        seq_len = self.tokeniser.seq_len or int(lengths.max(initial=1))
+        return self.tokeniser.ids_output(np.ascontiguousarray(encoded[:, :seq_len]), lengths)
+
+    def iter_tokenise_ids(self, x: List[str]) -> Iterator[Hlm12NliTokeniserIdsOutput]:
+        """
+        Tokenises the texts, yielding the output of each shard, in order, as soon as it is ready.
+
+        Args:
+            x: List[str]
+                The texts to tokenise.
+
+        Returns:
+            An iterator over the outputs of consecutive shards of `shard_size` texts, each padded to its own longest
+            sequence (or to `seq_len`).
+        """
+        if not self._is_parallel(x):
+            for start in range(0, len(x), self.shard_size):
+                yield self.tokeniser.tokenise_ids(x[start : start + self.shard_size], dtype=self.dtype)
+            return
+        buffers = self._buffers(len(x))
+        _, encoded, lengths = buffers
+        for start, end, longest in self._run(x, buffers):
+            seq_len = self.tokeniser.seq_len or longest
+            yield self.tokeniser.ids_output(np.ascontiguousarray(encoded[start:end, :seq_len]), lengths[start:end])
+
+    def _is_parallel(self, x: List[str]) -> bool:
+        return self.processes > 1 and len(x) >= self.min_parallel_size
+
+    def _buffers(self, n: int) -> Tuple[shared_memory.SharedMemory, np.ndarray, np.ndarray]:
+        width = self.tokeniser.seq_len or self.tokeniser.max_seq_len
+        ids_size = n * width * self.dtype.itemsize
+        ids_size += -ids_size % 8
+        shm = shared_memory.SharedMemory(create=True, size=max(ids_size + n * 8, 1))
+        buffer = np.ndarray((shm.size,), dtype=np.uint8, buffer=shm.buf)
+        encoded = buffer[: n * width * self.dtype.itemsize].view(self.dtype).reshape(n, width)
+        lengths = buffer[ids_size : ids_size + n * 8].view(np.int64)
+        weakref.finalize(buffer, _release, shm)
+        return shm, encoded, lengths
+
+    def _run(
+        self,
+        x: List[str],
+        buffers: Tuple[shared_memory.SharedMemory, np.ndarray, np.ndarray],
+    ) -> Iterator[Tuple[int, int, int]]:
+        if self._pool is None:
+            self._pool = self._context.Pool(self.processes, initializer=_init_worker, initargs=(self.tokeniser,))
+        shm, encoded, lengths = buffers
+        layout = (shm.name, encoded.shape, self.dtype.str, lengths.ctypes.data - encoded.ctypes.data)
+        tasks = ((layout, start, x[start : start + self.shard_size]) for start in range(0, len(x), self.shard_size))
+        try:
+            yield from self._pool.imap(_tokenise_shard, tasks)
+        finally:
+            shm.unlink()
+
+
+def _available_cores() -> int:
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _release(shm: shared_memory.SharedMemory) -> None:
+    try:
+        shm.close()
+    except BufferError:
+        pass
+
+
+def _init_worker(tokeniser: Hlm12NliTokeniser) -> None:
+    _WORKER["tokeniser"] = tokeniser
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    return shared_memory.SharedMemory(name=name)
+
+
+def _tokenise_shard(task) -> Tuple[int, int, int]:
+    (name, shape, dtype, lengths_offset), start, texts = task
+    tokeniser: Hlm12NliTokeniser = _WORKER["tokeniser"]
+    shm = _attach(name)
+    end = start + len(texts)
+    encoded = np.ndarray(shape, dtype=dtype, buffer=shm.buf)[start:end]
+    lengths = np.ndarray((shape[0],), dtype=np.int64, buffer=shm.buf, offset=lengths_offset)[start:end]
+    tokeniser.write_ids(tokeniser.split_ids(texts), encoded, lengths)
+    longest = int(lengths.max(initial=1))
+    del encoded, lengths
+    shm.close()
+    return start, end, longest
@@ -1,5 +1,13 @@
 # Python Built-in Modules
-from typing import Dict, List
+from collections.abc import Mapping
+from typing import Dict, List, Optional, Tuple, Union
+
+# My Packages and Modules
+from hlm12nli.profiling import stage
+
+# Local Folders
+from .cache import Hlm12NliWordCache
+from .trie import Hlm12NliWordpieceTrie
 
 
 class Hlm12NliTokeniserSplitter:
@@ -9,6 +17,8 @@ class Hlm12NliTokeniserSplitter:
     Attributes:
         vocab: The vocabulary to use.
         expr_subtoken: The expression for the subtoken, default is "##".
+        engine: The wordpiece matching engine, either "greedy" or "trie".
+        cache: The optional memoization of word segmentations.
 
     References:
         [1] Yonghui Wu, Mike Schuster, Zhifeng Chen, Quoc V. Le, Mohammad Norouzi, Wolfgang Macherey, Maxim Krikun,
@@ -19,15 +29,19 @@ class Hlm12NliTokeniserSplitter:
         Translation. CoRR abs/1609.08144, (2016). Retrieved from http://arxiv.org/abs/1609.08144
     """
 
-    vocab: Dict[str, int]
+    vocab: Union[List[str], Dict[str, int]]
     expr_subword: str
     token_oov: str
+    engine: str
+    cache: Optional[Hlm12NliWordCache]
 
     def __init__(
         self,
-        vocab: Dict[str, int],
+        vocab: Union[List[str], Dict[str, int]],
         token_oov: str,
         expr_subword: str,
+        engine: str = "greedy",
+        cache: Optional[Hlm12NliWordCache] = None,
     ) -> None:
         """
         Constructs a new Hlm12NliTokeniserSplitter.
@@ -36,10 +50,24 @@ class Hlm12NliTokeniserSplitter:
             vocab: The vocabulary to use.
             expr_subword: The expression for the subtoken, default is "##".
             token_oov: The out-of-vocabulary token, default is "[OOV]".
+            engine: The wordpiece matching engine, either "greedy" (longest-match-first, quadratic
+                on the length of each word) or "trie" (precompiled automaton, linear on the length of each word).
+            cache: The optional memoization of word segmentations, shared across calls.
         """
+        if engine not in ("greedy", "trie"):
+            raise ValueError(f"Unknown wordpiece engine '{engine}', expected 'greedy' or 'trie'.")
         self.vocab = vocab
         self.expr_subword = expr_subword
         self.token_oov = token_oov
+        self.engine = engine
+        self.cache = cache if cache is not None and cache.enabled else None
+        self._token_ids = vocab if isinstance(vocab, Mapping) else {t: i for i, t in enumerate(vocab)}
+        self._token_id_oov = self._token_ids.get(token_oov)
+        self._trie: Optional[Hlm12NliWordpieceTrie] = None
+        self._wordpiece_fn = self._wordpiece
+        if engine == "trie":
+            self._trie = Hlm12NliWordpieceTrie(vocab=vocab, expr_subword=expr_subword)
+            self._wordpiece_fn = self._wordpiece_trie
 
     def __call__(self, x: List[str]) -> List[str]:
         """
@@ -51,8 +79,37 @@ class Hlm12NliTokeniserSplitter:
         Returns:
             The tokenized texts.
         """
-        y = [self._tokenize_by_whitespace(xi) for xi in x]
-        y = [self._wordpiece(yi) for yi in y]
+        with stage("tokeniser.whitespace", items=len(x)):
+            y = [self._tokenize_by_whitespace(xi) for xi in x]
+        with stage("tokeniser.wordpiece") as span:
+            span.add(items=sum(map(len, y)))
+            if self.cache is None:
+                y = [self._wordpiece_fn(yi) for yi in y]
+            else:
+                y = [self._wordpiece_cached(yi) for yi in y]
+        return y
+
+    def split_ids(self, x: List[str]) -> List[List[int]]:
+        """
+        Tokenizes the given texts straight into token ids, without materialising the subtoken strings
+        of words already in the cache.
+
+        Args:
+            x: The texts to tokenize.
+
+        Returns:
+            The token ids of the tokenized texts, unknown tokens mapped to the id of `token_oov`.
+        """
+        with stage("tokeniser.whitespace", items=len(x)):
+            words = [self._tokenize_by_whitespace(xi) for xi in x]
+        with stage("tokeniser.wordpiece") as span:
+            span.add(items=sum(map(len, words)))
+            y = []
+            for tokens in words:
+                ids = []
+                for token in tokens:
+                    ids.extend(self._segment(token)[1])
+                y.append(ids)
         return y
 
     def _tokenize_by_whitespace(self, text: str) -> List[str]:
@@ -87,3 +144,31 @@ class Hlm12NliTokeniserSplitter:
             else:
                 output_tokens.extend(sub_tokens)
         return output_tokens
+
+    def _wordpiece_trie(self, tokens: List[str]) -> List[str]:
+        output_tokens = []
+        for token in tokens:
+            sub_tokens = self._trie(token)
+            if sub_tokens is None:
+                output_tokens.append(self.token_oov)
+            else:
+                output_tokens.extend(sub_tokens)
+        return output_tokens
+
+    def _wordpiece_cached(self, tokens: List[str]) -> List[str]:
+        output_tokens = []
+        for token in tokens:
+            output_tokens.extend(self._segment(token)[0])
+        return output_tokens
+
+    def _segment(self, token: str) -> Tuple[Tuple[str, ...], Tuple[int, ...]]:
+        cache = self.cache
+        if cache is not None:
+            entry = cache.get(token)
+            if entry is not None:
+                return entry
+        sub_tokens = tuple(self._wordpiece_fn([token]))
+        entry = (sub_tokens, tuple(self._token_ids.get(t, self._token_id_oov) for t in sub_tokens))
+        if cache is not None:
+            cache.put(token, entry)
+        return entry
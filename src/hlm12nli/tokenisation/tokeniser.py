@@ -1,13 +1,19 @@
 # Python Built-in Modules
-from typing import List
+from typing import Dict, List, Optional, Tuple
 
 # Third-Party Libraries
+import numpy as np
 from nest_ml.text import NestMLTextTokeniserBase
 
+# My Packages and Modules
+from hlm12nli.profiling import stage
+
 # Local Folders
+from .cache import Hlm12NliWordCache, Hlm12NliWordCacheStats
 from .config import Hlm12NliTextTokeniserConfig
+from .fingerprint import fingerprint
 from .joining import Hlm12NliTokeniserJoiner
-from .output import Hlm12NliTokeniserOutput
+from .output import Hlm12NliTokeniserIdsOutput, Hlm12NliTokeniserOutput
 from .splitter import Hlm12NliTokeniserSplitter
 
 
@@ -25,7 +31,9 @@ class Hlm12NliTokeniser(NestMLTextTokeniserBase[Hlm12NliTextTokeniserConfig, Hlm
         special_tokens: Set[str]
             The set of special tokens.s
         vocab: Dict[str, int]
-            The vocabulary mapping tokens to indices.
+            The vocabulary mapping tokens to indices. Its content is hashed on assignment (or, for a read-only
+            `Hlm12NliMappedVocab`, the fingerprint recorded in its file is used), so a vocabulary edited in place
+            must be assigned again (e.g. `tokeniser.vocab = tokeniser.vocab`) for the change to apply.
         token_pad: str
             The token used for padding.
         token_oov: str
@@ -34,11 +42,23 @@ class Hlm12NliTokeniser(NestMLTextTokeniserBase[Hlm12NliTextTokeniserConfig, Hlm
             The token used to envelop the input, marking the start of each sentence.
         token_end: str
             The token used to mark the end of each sentence.
+        do_lowercase: bool
+            Whether to lowercase the input.
+        expr_subword: str
+            The expression used to mark subwords.
+        wordpiece_engine: str
+            The wordpiece matching engine, "greedy" or "trie".
+        word_cache: Hlm12NliWordCache
+            The memoization of word segmentations, invalidated whenever the content of `vocab` or `do_lowercase`
+            change.
     """
 
     token_str: str
     token_end: str
     do_lowercase: bool
+    expr_subword: str
+    wordpiece_engine: str
+    word_cache: Hlm12NliWordCache
 
     def __init__(self, config: Hlm12NliTextTokeniserConfig):
         """
@@ -52,21 +72,227 @@ class Hlm12NliTokeniser(NestMLTextTokeniserBase[Hlm12NliTextTokeniserConfig, Hlm
         self.token_str = config.token_str
         self.token_end = config.token_end
         self.do_lowercase = config.do_lowercase
-        self._splitter_fn = Hlm12NliTokeniserSplitter(
-            vocab=config.vocab,
-            token_oov=self.token_oov,
-            expr_subword=config.expr_subword,
+        self.expr_subword = config.expr_subword
+        self.wordpiece_engine = config.wordpiece_engine
+        self.word_cache = Hlm12NliWordCache(
+            capacity=config.word_cache_capacity,
+            policy=config.word_cache_policy,
         )
+        self._splitter_fn = self._build_splitter()
+        self._splitter_fingerprint = self._fingerprint()
+        self._id_to_token: Optional[List[Optional[str]]] = None
         self._joiner_fn = Hlm12NliTokeniserJoiner(
             expr_subword=config.expr_subword,
+            special_tokens=self.special_tokens,
+        )
+
+    @property
+    def vocab(self) -> Dict[str, int]:
+        return self._vocab
+
+    @vocab.setter
+    def vocab(self, vocab: Dict[str, int]) -> None:
+        self._vocab = vocab
+        recorded = getattr(vocab, "fingerprint", None)
+        self._vocab_fingerprint = recorded if isinstance(recorded, str) else fingerprint(vocab)
+
+    @property
+    def word_cache_stats(self) -> Hlm12NliWordCacheStats:
+        """
+        Returns the hit, miss and eviction counters of the word segmentation cache.
+        """
+        return self.word_cache.stats()
+
+    def fingerprint(self) -> str:
+        """
+        Returns a hash of every setting that affects the token ids produced by the tokeniser,
+        including the vocabulary, so that artifacts derived from them can be invalidated.
+        """
+        return fingerprint(
+            self.vocab,
+            self.max_seq_len,
+            self.seq_len,
+            self.special_tokens,
+            self.token_pad,
+            self.token_oov,
+            self.token_str,
+            self.token_end,
+            self.expr_subword,
+            self.do_lowercase,
         )
 
     def perform_splitting(self, x: List[str]) -> List[List[str]]:
+        if self._splitter_fingerprint != self._fingerprint():
+            self._refresh_splitter()
         if self.do_lowercase:
             x = [xi.lower() for xi in x]
         y = self._splitter_fn(x)
         y = [[self.token_str] + yi + [self.token_end] for yi in y]
         return y
 
+    def tokenise_ids(self, x: List[str], dtype: np.dtype = np.int64) -> Hlm12NliTokeniserIdsOutput:
+        """
+        Tokenises the texts straight into a preallocated, padded array of token ids, skipping the
+        intermediate lists of string tokens. Produces the same ids and mask as `tokenise`.
+
+        Args:
+            x: List[str]
+                The texts to tokenise.
+            dtype: np.dtype
+                The integer type of the token ids, e.g. `np.int32` or `np.int64`.
+
+        Returns:
+            The padded token ids, their mask and the length of each sequence.
+        """
+        return self.pad_ids(self.split_ids(x), dtype=dtype)
+
+    def split_ids(self, x: List[str]) -> List[List[int]]:
+        """
+        Splits the texts into the ids of their subtokens, without special tokens, truncation or padding.
+
+        Args:
+            x: List[str]
+                The texts to split.
+
+        Returns:
+            The subtoken ids of each text.
+        """
+        if self._splitter_fingerprint != self._fingerprint():
+            self._refresh_splitter()
+        if self.do_lowercase:
+            x = [xi.lower() for xi in x]
+        return self._splitter_fn.split_ids(x)
+
+    def sequence_length(self, n_ids: int) -> int:
+        """
+        Returns the length of a sequence of `n_ids` subtoken ids once enveloped by the
+        start and end tokens and truncated to `max_seq_len`.
+        """
+        return min(n_ids + 2, self.max_seq_len)
+
+    def pad_ids(self, rows: List[List[int]], dtype: np.dtype = np.int64) -> Hlm12NliTokeniserIdsOutput:
+        """
+        Envelops the subtoken ids produced by `split_ids` with the start and end tokens, then truncates and pads
+        them into a preallocated array.
+
+        Args:
+            rows: List[List[int]]
+                The subtoken ids of each text.
+            dtype: np.dtype
+                The integer type of the token ids, e.g. `np.int32` or `np.int64`.
+
+        Returns:
+            The padded token ids, their mask and the length of each sequence.
+        """
+        with stage("tokeniser.pad", items=len(rows)) as span:
+            longest = max((len(row) for row in rows), default=0)
+            seq_len = self.seq_len if self.seq_len is not None else self.sequence_length(longest)
+            encoded = np.empty((len(rows), seq_len), dtype=dtype)
+            lengths = np.empty(len(rows), dtype=np.int64)
+            self.write_ids(rows, encoded, lengths)
+            output = self.ids_output(encoded, lengths)
+            span.add(nbytes=encoded.nbytes + lengths.nbytes + output.mask.nbytes)
+        return output
+
+    def write_ids(self, rows: List[List[int]], encoded: np.ndarray, lengths: np.ndarray) -> None:
+        """
+        Envelops, truncates and pads the subtoken ids produced by `split_ids` into preallocated arrays,
+        e.g. a slice of a shared memory buffer.
+
+        Args:
+            rows: List[List[int]]
+                The subtoken ids of each text.
+            encoded: np.ndarray
+                The array receiving the padded token ids, of shape [len(rows), seq_len].
+            lengths: np.ndarray
+                The array receiving the length of each sequence, of shape [len(rows)].
+        """
+        seq_len = encoded.shape[1]
+        id_str, id_end, id_pad = self.vocab[self.token_str], self.vocab[self.token_end], self.vocab[self.token_pad]
+        encoded.fill(id_pad)
+        for i, row in enumerate(rows):
+            n = min(len(row), seq_len - 1)
+            encoded[i, 0] = id_str
+            encoded[i, 1 : n + 1] = row[:n]
+            if n + 1 < seq_len:
+                encoded[i, n + 1] = id_end
+                n += 1
+            lengths[i] = n + 1
+
+    def ids_output(self, encoded: np.ndarray, lengths: np.ndarray) -> Hlm12NliTokeniserIdsOutput:
+        """
+        Wraps padded token ids and their lengths, as written by `write_ids`, into a `Hlm12NliTokeniserIdsOutput`.
+
+        Args:
+            encoded: np.ndarray
+                The padded token ids, of shape [batch_size, seq_len].
+            lengths: np.ndarray
+                The length of each sequence, of shape [batch_size].
+        """
+        return Hlm12NliTokeniserIdsOutput(
+            encoded_tokens=encoded,
+            mask=np.arange(encoded.shape[1]) < lengths[:, None],
+            lengths=lengths,
+            id_to_token=self._reverse_vocab(),
+            token_pad=self.token_pad,
+        )
+
+    def reverse_ids(
+        self,
+        x: np.ndarray,
+        lengths: Optional[np.ndarray] = None,
+        ignore_special_tokens: bool = True,
+    ) -> List[str]:
+        """
+        Decodes token ids back into texts through the reverse vocabulary, equivalent to `reverse`
+        without mapping every id to a token first.
+
+        Args:
+            x: np.ndarray
+                The token ids, of shape [batch_size, seq_len], e.g. `Hlm12NliTokeniserIdsOutput.encoded_tokens`.
+            lengths: np.ndarray | None
+                The length of each sequence, so that the padding after it is skipped.
+            ignore_special_tokens: bool
+                Whether to drop the special tokens (including padding).
+
+        Returns:
+            The text of each sequence.
+        """
+        if self._splitter_fingerprint != self._fingerprint():
+            self._refresh_splitter()
+        with stage("tokeniser.join", items=len(x)):
+            return self._joiner_fn.join_ids(
+                x,
+                id_to_token=self._reverse_vocab(),
+                lengths=lengths,
+                ignore_special_tokens=ignore_special_tokens,
+            )
+
     def perform_joining(self, x: List[List[str]]) -> List[str]:
-        return self._joiner_fn(x)
+        with stage("tokeniser.join", items=len(x)):
+            return self._joiner_fn(x)
+
+    def _build_splitter(self) -> Hlm12NliTokeniserSplitter:
+        return Hlm12NliTokeniserSplitter(
+            vocab=self.vocab,
+            token_oov=self.token_oov,
+            expr_subword=self.expr_subword,
+            engine=self.wordpiece_engine,
+            cache=self.word_cache,
+        )
+
+    def _fingerprint(self) -> Tuple[str, bool]:
+        return self._vocab_fingerprint, self.do_lowercase
+
+    def _reverse_vocab(self) -> List[Optional[str]]:
+        if self._id_to_token is None:
+            self._id_to_token = [None] * (max(self.vocab.values(), default=-1) + 1)
+            for token, index in self.vocab.items():
+                self._id_to_token[index] = token
+        return self._id_to_token
+
+    def _refresh_splitter(self) -> None:
+        self._id_to_token = None
+        self.word_cache.invalidate()
+        self._splitter_fn = self._build_splitter()
+        self._splitter_fingerprint = self._fingerprint()
@@ -0,0 +1,118 @@
+# Python Built-in Modules
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+class Hlm12NliWordpieceTrie:
+    """
+    Precompiled wordpiece matcher that segments each word in a single left-to-right
+    pass, using the failure links and failure pops of the LinMaxMatch[1] algorithm.
+    Produces exactly the same segmentation as the greedy longest-match-first wordpiece.
+
+    The automaton is made of two tries sharing the same node arrays: the prefix trie,
+    rooted at `root`, holding every token of the vocabulary as-is (used at the start of
+    a word), and the suffix trie, rooted at `root_subword`, holding the subword tokens
+    stripped of `expr_subword` (used for every continuation).
+
+    Attributes:
+        expr_subword: The expression for the subtoken, default is "##".
+        root: The node where the matching of each word starts.
+        root_subword: The node reached after the last subtoken of a word has been popped.
+
+    References:
+        [1] Xinying Song, Alex Salcianu, Yang Song, Dave Dopson, and Denny Zhou. 2021. Fast WordPiece
+        Tokenization. In Proceedings of the 2021 Conference on Empirical Methods in Natural Language
+        Processing, 2089–2103. Retrieved from https://arxiv.org/abs/2012.15524
+    """
+
+    expr_subword: str
+    root: int
+    root_subword: int
+
+    def __init__(self, vocab: Iterable[str], expr_subword: str) -> None:
+        """
+        Constructs a new Hlm12NliWordpieceTrie, compiling the vocabulary into the automaton.
+
+        Args:
+            vocab: The vocabulary to use, any iterable of tokens (a dict is iterated by its keys).
+            expr_subword: The expression for the subtoken, default is "##".
+        """
+        self.expr_subword = expr_subword
+        self._goto: List[Dict[str, int]] = []
+        self._token: List[Optional[str]] = []
+        self._fail: List[int] = []
+        self._pops: List[Tuple[str, ...]] = []
+        self.root = self._new_node()
+        self.root_subword = self._new_node()
+        expr_len = len(expr_subword)
+        for token in vocab:
+            if not token:
+                continue
+            self._insert(self.root, token, token)
+            if token.startswith(expr_subword) and len(token) > expr_len:
+                self._insert(self.root_subword, token[expr_len:], token)
+        self._link()
+
+    def __call__(self, word: str) -> Optional[List[str]]:
+        """
+        Segments a single word into its subtokens.
+
+        Args:
+            word: The word to segment, without whitespace.
+
+        Returns:
+            The subtokens of the word, or None if the word cannot be segmented by the vocabulary.
+        """
+        goto, fail, pops = self._goto, self._fail, self._pops
+        output = []
+        node = self.root
+        for char in word:
+            target = goto[node].get(char)
+            while target is None:
+                if fail[node] < 0:
+                    return None
+                output.extend(pops[node])
+                node = fail[node]
+                target = goto[node].get(char)
+            node = target
+        while node != self.root_subword:
+            if fail[node] < 0:
+                return None
+            output.extend(pops[node])
+            node = fail[node]
+        return output
+
+    def _new_node(self) -> int:
+        self._goto.append({})
+        self._token.append(None)
+        self._fail.append(-1)
+        self._pops.append(())
+        return len(self._goto) - 1
+
+    def _insert(self, node: int, chars: str, token: str) -> None:
+        for char in chars:
+            child = self._goto[node].get(char)
+            if child is None:
+                child = self._new_node()
+                self._goto[node][char] = child
+            node = child
+        self._token[node] = token
+
+    def _link(self) -> None:
+        queue = deque([self.root, self.root_subword])
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                if self._token[child] is not None:
+                    self._fail[child] = self.root_subword
+                    self._pops[child] = (self._token[child],)
+                    continue
+                pops = self._pops[node]
+                target = self._fail[node]
+                while target >= 0 and char not in self._goto[target]:
+                    pops = pops + self._pops[target]
+                    target = self._fail[target]
+                if target >= 0:
+                    self._fail[child] = self._goto[target][char]
+                    self._pops[child] = pops
@@ -1,6 +1,7 @@
 # Python Built-in Modules
 import json
 import pathlib
+from operator import itemgetter
 from typing import Dict
 
 
@@ -9,6 +10,10 @@ class Hlm12NliTokeniserVocabReader:
     Reads the vocabulary from a JSON file, postprocessing it
     should it require lowercasing.
 
+    When several tokens lowercase to the same token, the one that was already lowercase keeps
+    its id, otherwise the one with the lowest id does, regardless of the order of the JSON file.
+    The vocabulary is returned in id order.
+
     Attributes:
         filepath: The path to the JSON file containing the vocabulary.
     """
@@ -39,11 +44,16 @@ class Hlm12NliTokeniserVocabReader:
 
     @staticmethod
     def _postprocess(raw: Dict[str, int], do_lowercase: bool) -> Dict[str, int]:
-        out = {}
-        if do_lowercase:
-            for token, index in raw.items():
-                lower_token = token.lower()
-                if lower_token not in out:
-                    out[lower_token] = index
+        if not do_lowercase:
+            return dict(sorted(raw.items(), key=itemgetter(1)))
+        out: Dict[str, int] = {}
+        exact = set()
+        for token, index in raw.items():
+            lower_token = token.lower()
+            is_exact = lower_token == token
+            current = out.get(lower_token)
+            if current is None or (is_exact, -index) > (lower_token in exact, -current):
                 out[lower_token] = index
-        return out
+                if is_exact:
+                    exact.add(lower_token)
+        return dict(sorted(out.items(), key=itemgetter(1)))
@@ -0,0 +1,299 @@
+# Python Built-in Modules
+import hashlib
+import mmap
+import os
+import pathlib
+import struct
+from bisect import bisect_left
+from collections.abc import Mapping
+from typing import Iterator, List, Optional
+
+# Local Folders
+from .fingerprint import fingerprint
+from .vocab import Hlm12NliTokeniserVocabReader
+
+_MAGIC = b"HLM12VOC"
+_VERSION = 2
+_HEADER = struct.Struct("<8sIIQQ")
+_FINGERPRINT = struct.Struct("<32s")
+_FLAG_LOWERCASE = 1
+
+
+class Hlm12NliMappedVocab(Mapping):
+    """
+    Read-only vocabulary (token -> id) backed by a memory-mapped binary vocab file, so that it is
+    loaded without parsing and its pages are shared by every process mapping the same file
+    (e.g. forked workers). Tokens are looked up by binary search over the sorted string table.
+
+    File layout (little-endian):
+        header: magic (8 bytes), version (u32), flags (u32), number of tokens n (u64), string table size (u64)
+        fingerprint: the sha256 digest (32 bytes) of what the vocab was compiled from, zeroes if unknown;
+            absent from version 1 files
+        ids: n x i64, the id of each token, in sorted token order
+        offsets: (n + 1) x u64, the start of each token in the string table, in sorted token order
+        by_id: n x u64, the sorted position of each token, in id order
+        strings: the utf-8 encoded tokens, sorted by their bytes and concatenated
+
+    Attributes:
+        filepath: The path to the binary vocab file.
+        do_lowercase: Whether the vocabulary was normalised for lowercased input.
+        fingerprint: The fingerprint of what the vocabulary was compiled from, if recorded.
+    """
+
+    filepath: pathlib.Path
+    do_lowercase: bool
+    fingerprint: Optional[str]
+
+    def __init__(self, filepath: pathlib.Path) -> None:
+        """
+        Maps a binary vocab file produced by `Hlm12NliTokeniserBinaryVocabWriter`.
+
+        Args:
+            filepath: The path to the binary vocab file.
+        """
+        self.filepath = pathlib.Path(filepath)
+        with open(self.filepath, "rb") as fh:
+            self._mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, flags, n, strings_len = _HEADER.unpack_from(self._mm, 0)
+        if magic != _MAGIC or version not in (1, _VERSION):
+            self._mm.close()
+            raise ValueError(f"{self.filepath} is not a binary vocab file of version {_VERSION} or earlier.")
+        self.do_lowercase = bool(flags & _FLAG_LOWERCASE)
+        self.fingerprint = None
+        self._n = n
+        buffer = memoryview(self._mm)
+        start = _HEADER.size
+        if version >= 2:
+            (digest,) = _FINGERPRINT.unpack_from(self._mm, start)
+            self.fingerprint = digest.hex() if any(digest) else None
+            start += _FINGERPRINT.size
+        self._ids = buffer[start : start + 8 * n].cast("q")
+        start += 8 * n
+        self._offsets = buffer[start : start + 8 * (n + 1)].cast("Q")
+        start += 8 * (n + 1)
+        self._by_id = buffer[start : start + 8 * n].cast("Q")
+        start += 8 * n
+        self._strings_start = start
+        self._keys = _SortedKeys(self)
+
+    def __reduce__(self):
+        return type(self), (self.filepath,)
+
+    def __len__(self) -> int:
+        return self._n
+
+    def __getitem__(self, token: str) -> int:
+        position = self._find(token)
+        if position < 0:
+            raise KeyError(token)
+        return self._ids[position]
+
+    def __contains__(self, token: object) -> bool:
+        return isinstance(token, str) and self._find(token) >= 0
+
+    def __iter__(self) -> Iterator[str]:
+        for position in self._by_id:
+            yield self._token_at(position)
+
+    def id_to_token(self) -> List[Optional[str]]:
+        """
+        Returns the reverse vocabulary, the token of each id (None for unused ids).
+        """
+        size = max(self._ids, default=-1) + 1
+        reverse: List[Optional[str]] = [None] * size
+        for position in range(self._n):
+            reverse[self._ids[position]] = self._token_at(position)
+        return reverse
+
+    def close(self) -> None:
+        """
+        Releases the memory map.
+        """
+        self._ids.release()
+        self._offsets.release()
+        self._by_id.release()
+        self._mm.close()
+
+    def _find(self, token: str) -> int:
+        key = token.encode("utf-8")
+        position = bisect_left(self._keys, key)
+        if position < self._n and self._keys[position] == key:
+            return position
+        return -1
+
+    def _key_at(self, position: int) -> bytes:
+        start = self._strings_start
+        return self._mm[start + self._offsets[position] : start + self._offsets[position + 1]]
+
+    def _token_at(self, position: int) -> str:
+        return self._key_at(position).decode("utf-8")
+
+
+class _SortedKeys:
+    def __init__(self, vocab: Hlm12NliMappedVocab) -> None:
+        self._vocab = vocab
+
+    def __len__(self) -> int:
+        return len(self._vocab)
+
+    def __getitem__(self, position: int) -> bytes:
+        return self._vocab._key_at(position)
+
+
+class Hlm12NliTokeniserBinaryVocabWriter:
+    """
+    Compiles a vocabulary into the binary vocab format read by `Hlm12NliMappedVocab`.
+
+    Attributes:
+        filepath: The path to the binary vocab file to write.
+    """
+
+    filepath: pathlib.Path
+
+    def __init__(self, filepath: pathlib.Path) -> None:
+        """
+        Constructs a new Hlm12NliTokeniserBinaryVocabWriter.
+
+        Args:
+            filepath: The path to the binary vocab file to write.
+        """
+        self.filepath = pathlib.Path(filepath)
+
+    def write(self, vocab: Mapping, do_lowercase: bool, fingerprint: Optional[str] = None) -> None:
+        """
+        Writes the vocabulary, atomically replacing the file.
+
+        Args:
+            vocab: The vocabulary mapping tokens to ids, already normalised.
+            do_lowercase: Whether the vocabulary was normalised for lowercased input.
+            fingerprint: The hexadecimal sha256 fingerprint of what the vocabulary was compiled from, if any.
+        """
+        entries = sorted((token.encode("utf-8"), index) for token, index in vocab.items())
+        n = len(entries)
+        offsets = [0]
+        for key, _ in entries:
+            offsets.append(offsets[-1] + len(key))
+        by_id = sorted(range(n), key=lambda position: entries[position][1])
+        tmp = self.filepath.with_name(self.filepath.name + ".tmp")
+        with open(tmp, "wb") as fh:
+            fh.write(_HEADER.pack(_MAGIC, _VERSION, _FLAG_LOWERCASE if do_lowercase else 0, n, offsets[-1]))
+            fh.write(_FINGERPRINT.pack(bytes.fromhex(fingerprint) if fingerprint else b""))
+            fh.write(struct.pack(f"<{n}q", *(index for _, index in entries)))
+            fh.write(struct.pack(f"<{n + 1}Q", *offsets))
+            fh.write(struct.pack(f"<{n}Q", *by_id))
+            for key, _ in entries:
+                fh.write(key)
+        os.replace(tmp, self.filepath)
+
+    def convert(self, json_filepath: pathlib.Path, do_lowercase: bool, fingerprint: Optional[str] = None) -> None:
+        """
+        Converts a JSON vocab file, normalising it exactly as `Hlm12NliTokeniserVocabReader.read` does.
+
+        Args:
+            json_filepath: The path to the JSON file containing the vocabulary.
+            do_lowercase: Whether to normalise the vocabulary for lowercased input.
+            fingerprint: The hexadecimal sha256 fingerprint of the JSON file and the normalisation, if any.
+        """
+        vocab = Hlm12NliTokeniserVocabReader(json_filepath).read(do_lowercase=do_lowercase)
+        self.write(vocab, do_lowercase=do_lowercase, fingerprint=fingerprint)
+
+
+class Hlm12NliTokeniserBinaryVocabReader:
+    """
+    Drop-in replacement of `Hlm12NliTokeniserVocabReader` for binary vocab files, returning a
+    memory-mapped vocabulary instead of parsing and rebuilding a dict.
+
+    Attributes:
+        filepath: The path to the binary vocab file.
+    """
+
+    filepath: pathlib.Path
+
+    def __init__(self, filepath: pathlib.Path) -> None:
+        """
+        Constructs a new Hlm12NliTokeniserBinaryVocabReader.
+
+        Args:
+            filepath: The path to the binary vocab file.
+        """
+        self.filepath = pathlib.Path(filepath)
+
+    def read(self, do_lowercase: bool) -> Hlm12NliMappedVocab:
+        """
+        Maps the binary vocab file, checking it was compiled with the same normalisation.
+        """
+        vocab = Hlm12NliMappedVocab(self.filepath)
+        if vocab.do_lowercase != do_lowercase:
+            vocab.close()
+            raise ValueError(f"{self.filepath} was compiled with do_lowercase={not do_lowercase}.")
+        return vocab
+
+
+class Hlm12NliTokeniserCompiledVocabReader:
+    """
+    Drop-in replacement of `Hlm12NliTokeniserVocabReader` that compiles the JSON vocabulary, normalised,
+    into the binary vocab format on first use, and maps the compiled file on subsequent loads, skipping the
+    JSON parse and the normalisation. The compiled file records the fingerprint of the JSON file contents and
+    of the normalisation, and is recompiled whenever it no longer matches.
+
+    `NORMALISATION_REVISION` is part of the fingerprint, to be bumped whenever the normalisation of
+    `Hlm12NliTokeniserVocabReader` changes so that previously compiled files are rebuilt.
+
+    Attributes:
+        filepath: The path to the JSON file containing the vocabulary.
+        compiled_filepath: The path to the compiled binary vocab file.
+    """
+
+    NORMALISATION_REVISION = 1
+
+    filepath: pathlib.Path
+    compiled_filepath: pathlib.Path
+
+    def __init__(self, filepath: pathlib.Path, compiled_filepath: Optional[pathlib.Path] = None) -> None:
+        """
+        Constructs a new Hlm12NliTokeniserCompiledVocabReader.
+
+        Args:
+            filepath: The path to the JSON file containing the vocabulary.
+            compiled_filepath: The path to the compiled binary vocab file, next to the JSON file by default.
+        """
+        self.filepath = pathlib.Path(filepath)
+        if compiled_filepath is None:
+            compiled_filepath = self.filepath.with_suffix(".bin")
+        self.compiled_filepath = pathlib.Path(compiled_filepath)
+
+    def read(self, do_lowercase: bool) -> Hlm12NliMappedVocab:
+        """
+        Maps the compiled vocabulary, compiling it first if it is missing or stale.
+        """
+        expected = self.fingerprint(do_lowercase=do_lowercase)
+        try:
+            vocab = Hlm12NliMappedVocab(self.compiled_filepath)
+        except (FileNotFoundError, ValueError):
+            vocab = None
+        if vocab is not None:
+            if vocab.fingerprint == expected:
+                return vocab
+            vocab.close()
+        self.compile(do_lowercase=do_lowercase)
+        return Hlm12NliMappedVocab(self.compiled_filepath)
+
+    def compile(self, do_lowercase: bool) -> None:
+        """
+        Compiles the JSON vocabulary, replacing the compiled file.
+        """
+        Hlm12NliTokeniserBinaryVocabWriter(self.compiled_filepath).convert(
+            self.filepath,
+            do_lowercase=do_lowercase,
+            fingerprint=self.fingerprint(do_lowercase=do_lowercase),
+        )
+
+    def fingerprint(self, do_lowercase: bool) -> str:
+        """
+        Returns the fingerprint of the JSON file contents and of the normalisation, read without parsing the JSON.
+        """
+        digest = hashlib.sha256()
+        with open(self.filepath, "rb") as fh:
+            for chunk in iter(lambda: fh.read(1 << 20), b""):
+                digest.update(chunk)
+        return fingerprint(digest.hexdigest(), do_lowercase, self.NORMALISATION_REVISION)
@@ -0,0 +1,208 @@
+# Python Built-in Modules
+import pathlib
+from typing import Iterator, List, Sequence, Tuple
+
+# Third-Party Libraries
+import numpy as np
+from torch.utils.data import DataLoader, Dataset, Sampler
+
+# My Packages and Modules
+from hlm12nli.etl.shards import Hlm12NliTripletShard
+from hlm12nli.tokenisation import Hlm12NliTokeniser, Hlm12NliTokeniserIdsOutput
+
+Hlm12NliTripletBatch = Tuple[Hlm12NliTokeniserIdsOutput, Hlm12NliTokeniserIdsOutput, Hlm12NliTokeniserIdsOutput]
+
+
+class Hlm12NliTripletDataset(Dataset):
+    """
+    Map-style dataset over the pre-tokenised triplet shards of a directory, memory-mapped so that
+    the token ids are read from disk on demand rather than held in memory.
+
+    Batches are gathered and padded at once (padded to the longest sequence of the batch, or to `seq_len`),
+    producing the same ids and masks as `Hlm12NliTokeniser.tokenise_ids` on the original sentences.
+    The shards must have been tokenised with the same tokeniser configuration.
+
+    Attributes:
+        dirpath: pathlib.Path
+            The directory holding the `shard-XXXXX.bin` files.
+        tokeniser: Hlm12NliTokeniser
+            The tokeniser the shards were tokenised with, providing the padding and special tokens.
+        shards: List[Hlm12NliTripletShard]
+            The shards, in order.
+        dtype: np.dtype
+            The integer type of the padded token ids.
+    """
+
+    dirpath: pathlib.Path
+    tokeniser: Hlm12NliTokeniser
+    shards: List[Hlm12NliTripletShard]
+    dtype: np.dtype
+
+    def __init__(self, dirpath: pathlib.Path, tokeniser: Hlm12NliTokeniser, dtype: np.dtype = np.int64) -> None:
+        """
+        Constructs a new Hlm12NliTripletDataset.
+
+        Args:
+            dirpath: pathlib.Path
+                The directory holding the shards written by `Hlm12NliTripletShardWriter`.
+            tokeniser: Hlm12NliTokeniser
+                The tokeniser the shards were tokenised with.
+            dtype: np.dtype
+                The integer type of the padded token ids.
+        """
+        self.dirpath = pathlib.Path(dirpath)
+        self.tokeniser = tokeniser
+        self.dtype = np.dtype(dtype)
+        self.shards = [Hlm12NliTripletShard(filepath) for filepath in sorted(self.dirpath.glob("shard-*.bin"))]
+        if not self.shards:
+            raise FileNotFoundError(f"No triplet shards found in {self.dirpath}.")
+        expected = tokeniser.fingerprint()
+        for shard in self.shards:
+            if shard.fingerprint != expected:
+                raise ValueError(
+                    f"{shard.filepath} was tokenised with another tokeniser configuration, "
+                    "the shards must be written again."
+                )
+        self._ends = np.cumsum([len(shard) for shard in self.shards])
+
+    def __len__(self) -> int:
+        return int(self._ends[-1])
+
+    def __getitem__(self, index: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Returns the token ids of the anchor, positive and negative sentences of a triplet, unpadded.
+        """
+        if not -len(self) <= index < len(self):
+            raise IndexError(f"Triplet {index} is out of range for {len(self)} triplets.")
+        shard, local = self._locate(np.asarray([index % len(self)]))
+        triplet = self.shards[shard[0]].triplets[local[0]]
+        return tuple(self.shards[shard[0]].sentence(sentence) for sentence in triplet)
+
+    def __getitems__(self, indices: Sequence[int]) -> Hlm12NliTripletBatch:
+        return self.batch(indices)
+
+    def batch(self, indices: Sequence[int]) -> Hlm12NliTripletBatch:
+        """
+        Gathers and pads the triplets at once.
+
+        Args:
+            indices: Sequence[int]
+                The indices of the triplets.
+
+        Returns:
+            The padded token ids of the anchors, the positives and the negatives.
+        """
+        indices = np.asarray(indices, dtype=np.int64)
+        shards, local = self._locate(indices)
+        gathered = []
+        for shard in np.unique(shards):
+            rows = np.flatnonzero(shards == shard)
+            sentences = self.shards[shard].triplets[local[rows]]
+            gathered.append((rows, [self.shards[shard].gather(sentences[:, role]) for role in range(3)]))
+        return tuple(self._pad(len(indices), [(rows, roles[role]) for rows, roles in gathered]) for role in range(3))
+
+    def loader(
+        self,
+        batch_size: int,
+        shuffle: bool = True,
+        seed: int = 0,
+        drop_last: bool = False,
+        num_workers: int = 0,
+    ) -> DataLoader:
+        """
+        Returns a data loader over the triplets, yielding `Hlm12NliTripletBatch` tuples.
+
+        Batches are gathered and padded by `batch`, which is vectorised, so worker processes are seldom
+        worth their cost: each batch they produce is pickled back with the reverse vocabulary of its outputs.
+
+        Args:
+            batch_size: int
+                The number of triplets per batch.
+            shuffle: bool
+                Whether to shuffle the triplets, with a `Hlm12NliShardShuffleSampler`.
+            seed: int
+                The seed of the shuffling.
+            drop_last: bool
+                Whether to drop the last, incomplete batch.
+            num_workers: int
+                The number of worker processes.
+        """
+        sampler = Hlm12NliShardShuffleSampler(self, seed=seed) if shuffle else None
+        return DataLoader(
+            self,
+            batch_size=batch_size,
+            sampler=sampler,
+            drop_last=drop_last,
+            num_workers=num_workers,
+            collate_fn=_collate_batch,
+        )
+
+    def _locate(self, indices: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        shards = np.searchsorted(self._ends, indices, side="right")
+        starts = np.concatenate([[0], self._ends[:-1]])
+        return shards, indices - starts[shards]
+
+    def _pad(
+        self, n: int, gathered: List[Tuple[np.ndarray, Tuple[np.ndarray, np.ndarray]]]
+    ) -> Hlm12NliTokeniserIdsOutput:
+        lengths = np.empty(n, dtype=np.int64)
+        for rows, (_, shard_lengths) in gathered:
+            lengths[rows] = shard_lengths
+        seq_len = self.tokeniser.seq_len or int(lengths.max(initial=1))
+        encoded = np.full((n, seq_len), self.tokeniser.vocab[self.tokeniser.token_pad], dtype=self.dtype)
+        for rows, (tokens, shard_lengths) in gathered:
+            columns = np.arange(len(tokens)) - np.repeat(np.cumsum(shard_lengths) - shard_lengths, shard_lengths)
+            encoded[np.repeat(rows, shard_lengths), columns] = tokens
+        return self.tokeniser.ids_output(encoded, lengths)
+
+
+class Hlm12NliShardShuffleSampler(Sampler):
+    """
+    Shuffles the triplets of a `Hlm12NliTripletDataset` shard by shard: the shards are visited in a random
+    order and the triplets of each shard in a random order, so that only one shard is read at a time (keeping
+    its pages in the page cache) and only the permutation of one shard is held in memory.
+
+    The order changes with every epoch, see `set_epoch` (called by Lightning at the start of each epoch).
+
+    Attributes:
+        seed: int
+            The seed of the shuffling.
+        epoch: int
+            The epoch whose order is produced.
+    """
+
+    seed: int
+    epoch: int
+
+    def __init__(self, dataset: Hlm12NliTripletDataset, seed: int = 0) -> None:
+        """
+        Constructs a new Hlm12NliShardShuffleSampler.
+
+        Args:
+            dataset: Hlm12NliTripletDataset
+                The dataset to sample.
+            seed: int
+                The seed of the shuffling.
+        """
+        self.seed = seed
+        self.epoch = 0
+        self._sizes = [len(shard) for shard in dataset.shards]
+
+    def __len__(self) -> int:
+        return sum(self._sizes)
+
+    def __iter__(self) -> Iterator[int]:
+        rng = np.random.default_rng((self.seed, self.epoch))
+        starts = np.concatenate([[0], np.cumsum(self._sizes)[:-1]])
+        for shard in rng.permutation(len(self._sizes)):
+            yield from (starts[shard] + rng.permutation(self._sizes[shard])).tolist()
+
+    def set_epoch(self, epoch: int) -> None:
+        """
+        Sets the epoch whose order is produced next.
+        """
+        self.epoch = epoch
+
+
+def _collate_batch(batch: Hlm12NliTripletBatch) -> Hlm12NliTripletBatch:
+    return batch
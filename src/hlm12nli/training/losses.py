@@ -0,0 +1,229 @@
+# Python Built-in Modules
+from dataclasses import dataclass, field
+from typing import Optional, Tuple
+
+# Third-Party Libraries
+import torch
+
+
+@dataclass(frozen=True)
+class Hlm12NliTripletLossOutput:
+    """
+    Output of `Hlm12NliTripletLoss`.
+
+    Attributes:
+        loss: torch.Tensor
+            The mean triplet loss over the anchors that have at least one candidate negative.
+        active: torch.Tensor
+            The ratio of those anchors whose mined triplet violates the margin, i.e. still contributes a gradient.
+        positive_distance: torch.Tensor
+            The mean distance between the anchors and their positives.
+        negative_distance: torch.Tensor
+            The mean distance between the anchors and their mined negatives.
+    """
+
+    loss: torch.Tensor = field()
+    active: torch.Tensor = field()
+    positive_distance: torch.Tensor = field()
+    negative_distance: torch.Tensor = field()
+
+
+class Hlm12NliTripletLoss(torch.nn.Module):
+    """
+    Triplet margin loss, `max(d(a, p) - d(a, n) + margin, 0)`, with the negative of each anchor mined
+    among every candidate of the batch rather than taken from its own triplet.
+
+    The candidates are the positives and negatives of every triplet of the batch (and, optionally, embeddings
+    kept from previous batches), scored against all the anchors at once with a single distance matrix.
+    Candidates sharing the group of an anchor (e.g. the entailed hypotheses of the same premise) are masked out,
+    the negatives of the batch are always valid candidates. Mining strategies:
+        "batch_hard": the closest candidate to the anchor.
+        "semi_hard": the closest candidate farther from the anchor than its positive, or the farthest candidate
+            if there is none (as in FaceNet), which avoids the collapse batch-hard mining can cause early on.
+
+    Attributes:
+        margin: float
+            The margin between the positive and the negative distances.
+        mining: str
+            The mining strategy, "batch_hard" or "semi_hard".
+        distance: str
+            The distance between embeddings, "cosine" (1 - cosine similarity) or "euclidean".
+    """
+
+    MINING_STRATEGIES = ("batch_hard", "semi_hard")
+    DISTANCES = ("cosine", "euclidean")
+
+    margin: float
+    mining: str
+    distance: str
+
+    def __init__(self, margin: float = 0.2, mining: str = "batch_hard", distance: str = "cosine") -> None:
+        """
+        Constructs a new Hlm12NliTripletLoss.
+
+        Args:
+            margin: float
+                The margin between the positive and the negative distances.
+            mining: str
+                The mining strategy, "batch_hard" or "semi_hard".
+            distance: str
+                The distance between embeddings, "cosine" or "euclidean".
+        """
+        super().__init__()
+        if mining not in self.MINING_STRATEGIES:
+            raise ValueError(f"Unknown mining strategy '{mining}', expected one of {self.MINING_STRATEGIES}.")
+        if distance not in self.DISTANCES:
+            raise ValueError(f"Unknown distance '{distance}', expected one of {self.DISTANCES}.")
+        self.margin = margin
+        self.mining = mining
+        self.distance = distance
+
+    def forward(
+        self,
+        anchors: torch.Tensor,
+        positives: torch.Tensor,
+        negatives: torch.Tensor,
+        groups: Optional[torch.Tensor] = None,
+        memory: Optional[torch.Tensor] = None,
+        memory_groups: Optional[torch.Tensor] = None,
+    ) -> Hlm12NliTripletLossOutput:
+        """
+        Computes the loss of a batch of triplets.
+
+        Args:
+            anchors: torch.Tensor
+                The embeddings of the anchors, of shape [batch_size, dims].
+            positives: torch.Tensor
+                The embeddings of the positive of each anchor, of shape [batch_size, dims].
+            negatives: torch.Tensor
+                The embeddings of the negative of each anchor, of shape [batch_size, dims].
+            groups: torch.Tensor | None
+                The group of each anchor, of shape [batch_size]; the positives of anchors of the same group are
+                not used as negatives of each other. Every anchor is its own group if None.
+            memory: torch.Tensor | None
+                Additional candidates, e.g. the embeddings of previous batches, of shape [memory_size, dims].
+            memory_groups: torch.Tensor | None
+                The group of each additional candidate, -1 for those that are negatives of every anchor.
+        """
+        if groups is None:
+            groups = torch.arange(len(anchors), device=anchors.device)
+        candidates = [positives, negatives]
+        candidate_groups = [groups, torch.full_like(groups, -1)]
+        if memory is not None and len(memory):
+            candidates.append(memory.to(anchors.dtype))
+            candidate_groups.append(memory_groups)
+        candidates = torch.cat(candidates)
+        valid = torch.cat(candidate_groups)[None, :] != groups[:, None]
+        d_ap = self.paired_distances(anchors, positives)
+        d_an = self._mine(d_ap, self.pairwise_distances(anchors, candidates), valid)
+        has_negative = valid.any(dim=1)
+        losses = torch.relu(d_ap - d_an + self.margin)[has_negative]
+        loss = losses.mean() if len(losses) else anchors.sum() * 0.0
+        return Hlm12NliTripletLossOutput(
+            loss=loss,
+            active=(losses > 0).float().mean() if len(losses) else loss.detach(),
+            positive_distance=d_ap.detach().mean(),
+            negative_distance=d_an[has_negative].detach().mean() if len(losses) else loss.detach(),
+        )
+
+    def paired_distances(self, x: torch.Tensor, y: torch.Tensor) -> torch.Tensor:
+        """
+        Returns the distance between each row of `x` and the same row of `y`, of shape [len(x)].
+        """
+        if self.distance == "cosine":
+            return 1.0 - torch.nn.functional.cosine_similarity(x, y, dim=1)
+        return torch.linalg.vector_norm(x - y, dim=1)
+
+    def pairwise_distances(self, x: torch.Tensor, y: torch.Tensor) -> torch.Tensor:
+        """
+        Returns the distance between every row of `x` and every row of `y`, of shape [len(x), len(y)].
+        """
+        if self.distance == "cosine":
+            x = torch.nn.functional.normalize(x, dim=1)
+            y = torch.nn.functional.normalize(y, dim=1)
+            return 1.0 - x @ y.T
+        return torch.cdist(x, y)
+
+    def _mine(self, d_ap: torch.Tensor, d_an: torch.Tensor, valid: torch.Tensor) -> torch.Tensor:
+        inf = torch.finfo(d_an.dtype).max
+        hardest = d_an.masked_fill(~valid, inf).amin(dim=1)
+        if self.mining == "batch_hard":
+            return hardest
+        semi_hard = valid & (d_an > d_ap.detach()[:, None])
+        closest_farther = d_an.masked_fill(~semi_hard, inf).amin(dim=1)
+        farthest = d_an.masked_fill(~valid, -inf).amax(dim=1)
+        return torch.where(semi_hard.any(dim=1), closest_farther, farthest)
+
+
+class Hlm12NliEmbeddingMemory(torch.nn.Module):
+    """
+    First-in, first-out memory of the candidate embeddings of recent batches (cross-batch memory), adding
+    negatives to the mining of `Hlm12NliTripletLoss` without encoding them again. The embeddings are kept
+    detached, so they are slightly stale: the memory is best kept small relative to the rate the encoder drifts
+    (e.g. a few batches), and enabled once the loss has settled.
+
+    Attributes:
+        size: int
+            The maximum number of embeddings kept.
+        embeddings: torch.Tensor
+            The ring buffer of embeddings, of shape [size, dims].
+        groups: torch.Tensor
+            The group of each embedding, of shape [size].
+    """
+
+    size: int
+    embeddings: torch.Tensor
+    groups: torch.Tensor
+
+    def __init__(self, size: int, dims: int) -> None:
+        """
+        Constructs a new, empty Hlm12NliEmbeddingMemory.
+
+        Args:
+            size: int
+                The maximum number of embeddings kept.
+            dims: int
+                The number of dimensions of the embeddings.
+        """
+        super().__init__()
+        if size < 1:
+            raise ValueError(f"The memory size must be positive, got {size}.")
+        self.size = size
+        self.register_buffer("embeddings", torch.zeros(size, dims), persistent=False)
+        self.register_buffer("groups", torch.full((size,), -1, dtype=torch.long), persistent=False)
+        self._position = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def contents(self) -> Tuple[torch.Tensor, torch.Tensor]:
+        """
+        Returns the embeddings kept and their groups (in no particular order).
+        """
+        return self.embeddings[: self._count], self.groups[: self._count]
+
+    @torch.no_grad()
+    def enqueue(self, embeddings: torch.Tensor, groups: torch.Tensor) -> None:
+        """
+        Adds embeddings, replacing the oldest ones once full.
+
+        Args:
+            embeddings: torch.Tensor
+                The embeddings to keep, of shape [n, dims].
+            groups: torch.Tensor
+                The group of each embedding, of shape [n].
+        """
+        embeddings, groups = embeddings[-self.size :], groups[-self.size :]
+        slots = (self._position + torch.arange(len(embeddings), device=self.embeddings.device)) % self.size
+        self.embeddings[slots] = embeddings.detach().to(self.embeddings.dtype)
+        self.groups[slots] = groups.to(self.groups.device)
+        self._position = (self._position + len(embeddings)) % self.size
+        self._count = min(self._count + len(embeddings), self.size)
+
+    def reset(self) -> None:
+        """
+        Forgets every embedding.
+        """
+        self._position = 0
+        self._count = 0
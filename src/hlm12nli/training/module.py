@@ -0,0 +1,160 @@
+# Python Built-in Modules
+from typing import Optional, Tuple
+
+# Third-Party Libraries
+import lightning.pytorch as pl
+import numpy as np
+import torch
+
+# My Packages and Modules
+from hlm12nli.modelling.encoder import Hlm12NliEncoder
+from hlm12nli.modelling.output import Hlm12NliOutput
+from hlm12nli.tokenisation import Hlm12NliTokeniserIdsOutput, Hlm12NliTokeniserOutput
+
+# Local Folders
+from .data import Hlm12NliTripletBatch
+from .losses import Hlm12NliEmbeddingMemory, Hlm12NliTripletLoss, Hlm12NliTripletLossOutput
+
+_GROUP_WEIGHTS = np.random.default_rng(0).integers(1, 2**62, size=4096, dtype=np.int64)
+
+
+class Hlm12NliTripletModule(pl.LightningModule):
+    """
+    Lightning module training a `Hlm12NliEncoder` with a triplet loss over batches of
+    `(anchor, positive, negative)` token ids, as produced by `Hlm12NliTripletDataset.loader`.
+
+    The three sentences of every triplet are encoded in a single forward pass, and the negative of each
+    anchor is mined among every positive and negative of the batch (see `Hlm12NliTripletLoss`), plus the
+    embeddings of recent batches when `memory_size` is set. Anchors are grouped by their token ids, so that
+    triplets sharing a premise never use each other's positives as negatives, across batches as well.
+
+    Attributes:
+        encoder: Hlm12NliEncoder
+            The encoder being trained.
+        loss: Hlm12NliTripletLoss
+            The triplet loss and its mining strategy.
+        memory: Hlm12NliEmbeddingMemory | None
+            The cross-batch memory of candidate embeddings, if enabled.
+        learning_rate: float
+            The learning rate of the AdamW optimiser.
+        weight_decay: float
+            The weight decay of the AdamW optimiser.
+    """
+
+    encoder: Hlm12NliEncoder
+    loss: Hlm12NliTripletLoss
+    memory: Optional[Hlm12NliEmbeddingMemory]
+    learning_rate: float
+    weight_decay: float
+
+    def __init__(
+        self,
+        encoder: Hlm12NliEncoder,
+        margin: float = 0.2,
+        mining: str = "batch_hard",
+        distance: str = "cosine",
+        memory_size: int = 0,
+        learning_rate: float = 1e-3,
+        weight_decay: float = 0.01,
+    ) -> None:
+        """
+        Constructs a new Hlm12NliTripletModule.
+
+        Args:
+            encoder: Hlm12NliEncoder
+                The encoder to train.
+            margin: float
+                The margin of the triplet loss.
+            mining: str
+                The mining strategy, "batch_hard" or "semi_hard".
+            distance: str
+                The distance between embeddings, "cosine" or "euclidean".
+            memory_size: int
+                The number of candidate embeddings kept from previous batches, 0 to disable the memory.
+            learning_rate: float
+                The learning rate of the AdamW optimiser.
+            weight_decay: float
+                The weight decay of the AdamW optimiser.
+        """
+        super().__init__()
+        self.save_hyperparameters(ignore=["encoder"])
+        self.encoder = encoder
+        self.loss = Hlm12NliTripletLoss(margin=margin, mining=mining, distance=distance)
+        self.memory = Hlm12NliEmbeddingMemory(memory_size, encoder.config.output_dims) if memory_size else None
+        self.learning_rate = learning_rate
+        self.weight_decay = weight_decay
+
+    def forward(self, x: Hlm12NliTokeniserOutput) -> Hlm12NliOutput:
+        return self.encoder(x)
+
+    def embed(self, batch: Hlm12NliTripletBatch) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+        """
+        Encodes the anchors, positives and negatives of a batch in a single forward pass. Unless the encoder
+        packs its sequences, the three are padded to the same width, so their embeddings may differ slightly
+        from those of separate forward passes.
+
+        Returns:
+            The embeddings of the anchors, the positives and the negatives, each of shape [batch_size, output_dims].
+        """
+        width = max(x.encoded_tokens.shape[1] for x in batch)
+        ids = torch.cat([self._pad(x.encoded_tokens_to_tensor(device=self.device), width) for x in batch])
+        mask = torch.cat([self._pad(x.mask_to_tensor(device=self.device), width) for x in batch])
+        lengths = torch.cat([x.lengths_to_tensor() for x in batch]) if self.encoder.config.pack_sequences else None
+        embeddings, _ = self.encoder.forward_tensors(ids, mask, lengths)
+        return embeddings.chunk(3)
+
+    def training_step(self, batch: Hlm12NliTripletBatch, batch_idx: int) -> torch.Tensor:
+        anchors, positives, negatives = self.embed(batch)
+        groups = self.groups(batch[0])
+        memory, memory_groups = self.memory.contents() if self.memory is not None else (None, None)
+        output = self.loss(anchors, positives, negatives, groups, memory, memory_groups)
+        if self.memory is not None:
+            self.memory.enqueue(torch.cat([positives, negatives]), torch.cat([groups, torch.full_like(groups, -1)]))
+        self._log("train", output, len(anchors))
+        return output.loss
+
+    def validation_step(self, batch: Hlm12NliTripletBatch, batch_idx: int) -> torch.Tensor:
+        anchors, positives, negatives = self.embed(batch)
+        output = self.loss(anchors, positives, negatives, self.groups(batch[0]))
+        accuracy = self.loss.paired_distances(anchors, positives) < self.loss.paired_distances(anchors, negatives)
+        self._log("val", output, len(anchors))
+        self.log("val_accuracy", accuracy.float().mean(), batch_size=len(anchors))
+        return output.loss
+
+    def transfer_batch_to_device(
+        self, batch: Hlm12NliTripletBatch, device: torch.device, dataloader_idx: int
+    ) -> Hlm12NliTripletBatch:
+        """
+        Moves the token ids and masks of the three roles to the device, through each output's own tensor cache,
+        rather than through Lightning's default, which cannot rebuild the frozen outputs. The sequence lengths
+        stay on the CPU, as required to pack the sequences.
+        """
+        for x in batch:
+            x.encoded_tokens_to_tensor(device=device, non_blocking=True)
+            x.mask_to_tensor(device=device, non_blocking=True)
+        return batch
+
+    def on_train_epoch_start(self) -> None:
+        if self.memory is not None:
+            self.memory.reset()
+
+    def configure_optimizers(self) -> torch.optim.Optimizer:
+        return torch.optim.AdamW(self.encoder.parameters(), lr=self.learning_rate, weight_decay=self.weight_decay)
+
+    def groups(self, anchors: Hlm12NliTokeniserIdsOutput) -> torch.Tensor:
+        """
+        Returns the group of each anchor, a non-negative hash of its token ids, stable across batches.
+        """
+        ids = np.where(anchors.mask, anchors.encoded_tokens.astype(np.int64) + 1, 0)
+        hashes = (ids * np.resize(_GROUP_WEIGHTS, ids.shape[1])).sum(axis=1) & np.int64(2**62 - 1)
+        return torch.from_numpy(hashes).to(self.device)
+
+    def _pad(self, x: torch.Tensor, width: int) -> torch.Tensor:
+        value = self.encoder.config.token_id_pad if x.dtype != torch.bool else False
+        return torch.nn.functional.pad(x, (0, width - x.shape[1]), value=value)
+
+    def _log(self, prefix: str, output: Hlm12NliTripletLossOutput, batch_size: int) -> None:
+        self.log(f"{prefix}_loss", output.loss, prog_bar=True, batch_size=batch_size)
+        self.log(f"{prefix}_active", output.active, batch_size=batch_size)
+        self.log(f"{prefix}_positive_distance", output.positive_distance, batch_size=batch_size)
+        self.log(f"{prefix}_negative_distance", output.negative_distance, batch_size=batch_size)
@@ -0,0 +1,77 @@
+# Python Built-in Modules
+import pathlib
+import tempfile
+import unittest
+
+# My Packages and Modules
+from hlm12nli.etl.shards import Hlm12NliTripletShard, Hlm12NliTripletShardWriter
+from hlm12nli.tokenisation.config import Hlm12NliTextTokeniserConfig
+from hlm12nli.tokenisation.tokeniser import Hlm12NliTokeniser
+
+
+class IntegrationTestHlm12NliTripletShardWriter(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.dirpath = pathlib.Path(self.tmpdir.name)
+        self.vocab = ["[PAD]", "[OOV]", "[STR]", "[END]", "a", "test", "sentence", "##.", "hudson", "##'s"]
+        self.tokeniser = Hlm12NliTokeniser(Hlm12NliTextTokeniserConfig(vocab=self.vocab))
+        self.triplets = [
+            ("a test", "a sentence.", "hudson's test"),
+            ("a test", "test", "not_in_vocab"),
+            ("hudson's sentence.", "a test", "test " * 12),
+        ]
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_sentences_round_trip_as_tokenised(self):
+        writer = Hlm12NliTripletShardWriter(self.dirpath, self.tokeniser)
+        (filepath,) = writer.write(self.triplets)
+        shard = Hlm12NliTripletShard(filepath)
+        self.assertEqual(len(shard), 3)
+        for triplet, sentences in zip(self.triplets, shard.triplets):
+            expected = self.tokeniser.tokenise_ids(list(triplet))
+            for row, sentence in enumerate(sentences):
+                actual = shard.sentence(sentence).tolist()
+                self.assertEqual(actual, expected.encoded_tokens[row, : expected.lengths[row]].tolist())
+
+    def test_sentences_are_stored_once_per_shard(self):
+        writer = Hlm12NliTripletShardWriter(self.dirpath, self.tokeniser)
+        (filepath,) = writer.write(self.triplets)
+        shard = Hlm12NliTripletShard(filepath)
+        self.assertEqual(shard.n_sentences, 7)
+        self.assertEqual(shard.triplets[0, 0], shard.triplets[1, 0])
+
+    def test_gather_concatenates_sentences(self):
+        writer = Hlm12NliTripletShardWriter(self.dirpath, self.tokeniser)
+        (filepath,) = writer.write(self.triplets)
+        shard = Hlm12NliTripletShard(filepath)
+        tokens, lengths = shard.gather(shard.triplets[:, 2])
+        expected = [token for sentence in shard.triplets[:, 2] for token in shard.sentence(sentence).tolist()]
+        self.assertEqual(tokens.tolist(), expected)
+        self.assertEqual(lengths.tolist(), [len(shard.sentence(sentence)) for sentence in shard.triplets[:, 2]])
+
+    def test_shards_roll_over_and_record_the_fingerprint(self):
+        writer = Hlm12NliTripletShardWriter(self.dirpath, self.tokeniser, shard_size=2)
+        filepaths = writer.write(self.triplets)
+        shards = [Hlm12NliTripletShard(filepath) for filepath in filepaths]
+        self.assertEqual([len(shard) for shard in shards], [2, 1])
+        self.assertEqual({shard.fingerprint for shard in shards}, {self.tokeniser.fingerprint()})
+
+    def test_previous_shards_are_removed(self):
+        Hlm12NliTripletShardWriter(self.dirpath, self.tokeniser, shard_size=1).write(self.triplets)
+        Hlm12NliTripletShardWriter(self.dirpath, self.tokeniser).write(self.triplets)
+        self.assertEqual(len(list(self.dirpath.glob("shard-*.bin"))), 1)
+
+    def test_parallel_tokenisation_matches_in_process(self):
+        triplets = self.triplets * 10
+        expected = Hlm12NliTripletShardWriter(self.dirpath / "serial", self.tokeniser).write(triplets)
+        writer = Hlm12NliTripletShardWriter(self.dirpath / "parallel", self.tokeniser, chunk_size=2, processes=2)
+        actual = writer.write(triplets)
+        self.assertEqual(actual[0].read_bytes(), expected[0].read_bytes())
+
+    def test_rejects_other_files(self):
+        filepath = self.dirpath / "shard-00000.bin"
+        filepath.write_bytes(b"not a shard" * 10)
+        with self.assertRaises(ValueError):
+            Hlm12NliTripletShard(filepath)
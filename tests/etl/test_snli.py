@@ -0,0 +1,39 @@
+# Python Built-in Modules
+import json
+import pathlib
+import tempfile
+import unittest
+
+# My Packages and Modules
+from hlm12nli.etl.snli import Hlm12NliSnliTripletReader
+
+
+class UnitTestHlm12NliSnliTripletReader(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.filepath = pathlib.Path(self.tmpdir.name) / "snli.jsonl"
+        pairs = [
+            ("a test", "entailment", "a sentence"),
+            ("a test", "neutral", "hudson's test"),
+            ("a test", "contradiction", "no test"),
+            ("a test", "contradiction", "no sentence"),
+            ("another test", "entailment", "a test"),
+            ("another test", "-", "unlabelled"),
+            ("a third test", "entailment", "test"),
+            ("a third test", "contradiction", "not a test"),
+        ]
+        with open(self.filepath, "w", encoding="utf-8") as fh:
+            for premise, label, hypothesis in pairs:
+                fh.write(json.dumps({"gold_label": label, "sentence1": premise, "sentence2": hypothesis}) + "\n")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_pairs_entailed_and_contradicted_hypotheses_of_each_premise(self):
+        actual = list(Hlm12NliSnliTripletReader(self.filepath))
+        expected = [
+            ("a test", "a sentence", "no test"),
+            ("a test", "a sentence", "no sentence"),
+            ("a third test", "test", "not a test"),
+        ]
+        self.assertEqual(actual, expected)
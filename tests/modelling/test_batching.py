@@ -0,0 +1,71 @@
+# Python Built-in Modules
+import dataclasses
+import unittest
+import warnings
+
+# Third-Party Libraries
+import torch
+
+# My Packages and Modules
+from hlm12nli.modelling.batching import Hlm12NliBucketBatcher
+from hlm12nli.modelling.config import Hlm12NliConfig
+from hlm12nli.modelling.encoder import Hlm12NliEncoder
+from hlm12nli.tokenisation.config import Hlm12NliTextTokeniserConfig
+from hlm12nli.tokenisation.tokeniser import Hlm12NliTokeniser
+
+
+class IntegrationTestHlm12NliBucketBatcher(unittest.TestCase):
+    def setUp(self):
+        self.vocab = ["[PAD]", "[OOV]", "[STR]", "[END]", "a", "test", "sentence", "##.", "hudson", "##'s"]
+        self.tokeniser = Hlm12NliTokeniser(Hlm12NliTextTokeniserConfig(vocab=self.vocab))
+        self.encoder = Hlm12NliEncoder(
+            config=Hlm12NliConfig(
+                model_name="integration_test",
+                vocab_size=len(self.vocab),
+                token_vec_dims=16,
+                token_id_pad=0,
+                hidden_state_dims=16,
+                hidden_state_bidirectional=False,
+                attn_heads=2,
+                attn_dropout=0.1,
+                output_dims=2,
+                pack_sequences=True,
+            )
+        )
+        self.encoder.eval()
+        self.texts = ["a test", "a test sentence . " * 6, "test", "Hudson's test sentence.", "a"]
+
+    def test_plan_respects_token_budget(self):
+        batcher = Hlm12NliBucketBatcher(self.tokeniser, max_batch_tokens=10)
+        lengths = [3, 9, 2, 5, 4, 3]
+        batches = batcher.plan(lengths)
+        self.assertEqual(sorted(i for b in batches for i in b), list(range(len(lengths))))
+        for batch in batches:
+            self.assertLessEqual(len(batch) * max(lengths[i] for i in batch), 10)
+
+    def test_plan_respects_max_batch_size(self):
+        batcher = Hlm12NliBucketBatcher(self.tokeniser, max_batch_tokens=1000, max_batch_size=2)
+        self.assertEqual([len(b) for b in batcher.plan([3, 3, 3, 3, 3])], [2, 2, 1])
+
+    def test_batches_group_similar_lengths(self):
+        batcher = Hlm12NliBucketBatcher(self.tokeniser, max_batch_tokens=12)
+        widths = [x.encoded_tokens.shape[1] for _, x in batcher.batches(self.texts)]
+        self.assertEqual(widths, sorted(widths))
+
+    def test_encode_restores_input_order(self):
+        batcher = Hlm12NliBucketBatcher(self.tokeniser, max_batch_tokens=12, window_size=3)
+        actual = torch.stack(list(batcher.encode(self.encoder, self.texts)))
+        with torch.inference_mode():
+            expected = torch.cat([self.encoder(self.tokeniser.tokenise_ids([t])).embeddings for t in self.texts])
+        self.assertEqual(actual.shape, (len(self.texts), self.encoder.config.output_dims))
+        self.assertTrue(torch.allclose(actual, expected, atol=1e-5))
+
+    def test_encode_warns_without_packing_a_bidirectional_encoder(self):
+        batcher = Hlm12NliBucketBatcher(self.tokeniser, max_batch_tokens=12)
+        config = dataclasses.replace(self.encoder.config, hidden_state_bidirectional=True, pack_sequences=False)
+        with self.assertWarnsRegex(UserWarning, "pack_sequences"):
+            list(batcher.encode(Hlm12NliEncoder(config=config).eval(), self.texts))
+        packed = dataclasses.replace(config, pack_sequences=True)
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            list(batcher.encode(Hlm12NliEncoder(config=packed).eval(), self.texts))
@@ -0,0 +1,73 @@
+# Python Built-in Modules
+import unittest
+
+# Third-Party Libraries
+import numpy as np
+import torch
+
+# My Packages and Modules
+from hlm12nli.modelling.config import Hlm12NliConfig
+from hlm12nli.modelling.dedupe import Hlm12NliDedupingEncoder
+from hlm12nli.modelling.encoder import Hlm12NliEncoder
+from hlm12nli.tokenisation.config import Hlm12NliTextTokeniserConfig
+from hlm12nli.tokenisation.tokeniser import Hlm12NliTokeniser
+
+
+class IntegrationTestHlm12NliDedupingEncoder(unittest.TestCase):
+    def setUp(self):
+        self.vocab = ["[PAD]", "[OOV]", "[STR]", "[END]", "a", "test", "sentence", "##.", "hudson", "##'s"]
+        self.tokeniser = Hlm12NliTokeniser(Hlm12NliTextTokeniserConfig(vocab=self.vocab))
+        self.encoder = Hlm12NliEncoder(config=self._config()).eval()
+        self.dedupe = Hlm12NliDedupingEncoder(self.tokeniser, self.encoder)
+
+    def test_encodes_each_normalised_text_once(self):
+        texts = ["a test", "hudson's sentence.", "A  test", "a test", "test"]
+        distinct, inverse = self.dedupe.deduplicate(texts)
+        self.assertEqual(distinct, ["a test", "hudson's sentence.", "test"])
+        self.assertEqual(inverse.tolist(), [0, 1, 0, 0, 2])
+
+    def test_scatters_embeddings_back_to_every_position(self):
+        texts = ["a test", "hudson's sentence.", "A  test", "test"]
+        actual = self.dedupe(texts)
+        with torch.inference_mode():
+            expected = self.encoder(self.tokeniser.tokenise_ids(texts)).embeddings.numpy()
+        self.assertEqual(actual.shape, (4, 4))
+        np.testing.assert_allclose(actual, expected, atol=1e-5)
+        np.testing.assert_array_equal(actual[0], actual[2])
+
+    def test_pairs_share_texts_across_sides(self):
+        premises = ["a test", "a test", "a test"]
+        hypotheses = ["test", "a sentence.", "a test"]
+        left, right = self.dedupe.encode_pairs(premises, hypotheses)
+        np.testing.assert_array_equal(left[0], right[2])
+        self.assertEqual(self.dedupe.stats().unique, 3)
+        scores = self.dedupe.score_pairs(premises, hypotheses)
+        expected = (left * right).sum(axis=1) / np.linalg.norm(left, axis=1) / np.linalg.norm(right, axis=1)
+        np.testing.assert_allclose(scores, expected, atol=1e-5)
+        self.assertAlmostEqual(float(scores[2]), 1.0, places=5)
+
+    def test_reports_the_dedupe_ratio(self):
+        self.dedupe.encode_pairs(["a test"] * 4, ["test", "a", "sentence", "test"])
+        stats = self.dedupe.stats()
+        self.assertEqual((stats.texts, stats.unique), (8, 4))
+        self.assertEqual(stats.dedupe_ratio, 2.0)
+        self.assertEqual(stats.saved, 0.5)
+
+    def test_empty_and_mismatched_inputs(self):
+        self.assertEqual(self.dedupe([]).shape, (0, 4))
+        with self.assertRaises(ValueError):
+            self.dedupe.score_pairs(["a test"], [])
+
+    def _config(self):
+        return Hlm12NliConfig(
+            model_name="integration_test",
+            vocab_size=len(self.vocab),
+            token_vec_dims=8,
+            token_id_pad=0,
+            hidden_state_dims=8,
+            hidden_state_bidirectional=False,
+            attn_heads=2,
+            attn_dropout=0.0,
+            output_dims=4,
+            pack_sequences=True,
+        )
@@ -0,0 +1,116 @@
+# Python Built-in Modules
+import dataclasses
+import unittest
+
+# Third-Party Libraries
+import numpy as np
+import torch
+
+# My Packages and Modules
+from hlm12nli.modelling.config import Hlm12NliConfig
+from hlm12nli.modelling.document import Hlm12NliDocumentEncoder
+from hlm12nli.modelling.encoder import Hlm12NliEncoder
+from hlm12nli.tokenisation.config import Hlm12NliTextTokeniserConfig
+from hlm12nli.tokenisation.tokeniser import Hlm12NliTokeniser
+
+
+class UnitTestHlm12NliDocumentEncoderWindows(unittest.TestCase):
+    def setUp(self):
+        vocab = ["[PAD]", "[OOV]", "[STR]", "[END]", "a", "test", "sentence", "##."]
+        self.tokeniser = Hlm12NliTokeniser(Hlm12NliTextTokeniserConfig(vocab=vocab, max_seq_len=12))
+
+    def test_windows_overlap_and_cover_the_stream(self):
+        documents = Hlm12NliDocumentEncoder(self.tokeniser, encoder=None, overlap=3)
+        (ids,) = self.tokeniser.split_ids([self._document(25)])
+        windows = list(documents.windows(self._document(25)))
+        self.assertEqual([start for start, _, _ in windows], [0, 7, 14, 15])
+        self.assertEqual([row for _, row, _ in windows], [ids[start : start + 10] for start in (0, 7, 14, 15)])
+        self.assertEqual([weight for _, _, weight in windows], [10, 7, 7, 1])
+
+    def test_streamed_chunks_match_the_whole_document(self):
+        documents = Hlm12NliDocumentEncoder(self.tokeniser, encoder=None, overlap=2)
+        expected = list(documents.windows(self._document(100)))
+        documents.CHUNK_CHARS = 7
+        self.assertEqual(list(documents.windows(self._document(100))), expected)
+
+    def test_short_documents_fit_a_single_window(self):
+        documents = Hlm12NliDocumentEncoder(self.tokeniser, encoder=None)
+        self.assertEqual([weight for _, _, weight in documents.windows(self._document(10))], [10])
+        self.assertEqual(list(documents.windows("")), [(0, [], 1)])
+
+    def test_rejects_invalid_windows(self):
+        with self.assertRaises(ValueError):
+            Hlm12NliDocumentEncoder(self.tokeniser, encoder=None, window_size=13)
+        with self.assertRaises(ValueError):
+            Hlm12NliDocumentEncoder(self.tokeniser, encoder=None, window_size=8, overlap=6)
+        with self.assertRaises(ValueError):
+            Hlm12NliDocumentEncoder(self.tokeniser, encoder=None, combine="max")
+
+    @staticmethod
+    def _document(n_ids):
+        words = ["a", "test", "sentence", "a\n\n", "test"]
+        return " ".join(words[i % len(words)] for i in range(n_ids))
+
+
+class IntegrationTestHlm12NliDocumentEncoder(unittest.TestCase):
+    def setUp(self):
+        self.vocab = ["[PAD]", "[OOV]", "[STR]", "[END]", "a", "test", "sentence", "##.", "hudson", "##'s"]
+        self.tokeniser = Hlm12NliTokeniser(Hlm12NliTextTokeniserConfig(vocab=self.vocab, max_seq_len=8))
+        self.encoder = Hlm12NliEncoder(config=self._config()).eval()
+        self.long = "hudson's test sentence. a test " * 5
+        self.short = "a test sentence."
+
+    def test_short_documents_match_the_encoder(self):
+        actual = Hlm12NliDocumentEncoder(self.tokeniser, self.encoder)([self.short, ""])
+        with torch.inference_mode():
+            expected = self.encoder(self.tokeniser.tokenise_ids([self.short, ""])).embeddings.numpy()
+        np.testing.assert_allclose(actual, expected, atol=1e-5)
+
+    def test_mean_weights_the_windows_by_new_tokens(self):
+        documents = Hlm12NliDocumentEncoder(self.tokeniser, self.encoder, overlap=2)
+        windows = list(documents.windows(self.long))
+        self.assertGreater(len(windows), 2)
+        with torch.inference_mode():
+            windows, weights = self.encoder(self.tokeniser.pad_ids([row for _, row, _ in windows])), [
+                weight for _, _, weight in windows
+            ]
+        weights = np.asarray(weights, dtype=np.float32)
+        expected = weights @ windows.embeddings.numpy() / weights.sum()
+        np.testing.assert_allclose(documents([self.long])[0], expected, atol=1e-5)
+
+    def test_attention_is_a_convex_combination_of_the_windows(self):
+        documents = Hlm12NliDocumentEncoder(self.tokeniser, self.encoder, combine="attention", temperature=0.05)
+        with torch.inference_mode():
+            rows = [row for _, row, _ in documents.windows(self.long)]
+            windows = self.encoder(self.tokeniser.pad_ids(rows)).embeddings.numpy()
+        actual = documents([self.long])[0]
+        self.assertTrue(np.all(actual <= windows.max(axis=0) + 1e-5))
+        self.assertTrue(np.all(actual >= windows.min(axis=0) - 1e-5))
+        mean = Hlm12NliDocumentEncoder(self.tokeniser, self.encoder)([self.long])[0]
+        self.assertFalse(np.allclose(actual, mean))
+
+    def test_batching_of_windows_does_not_change_the_embeddings(self):
+        documents = [self.long, self.short, self.long[:40]]
+        expected = Hlm12NliDocumentEncoder(self.tokeniser, self.encoder, max_batch_windows=64)(documents)
+        actual = Hlm12NliDocumentEncoder(self.tokeniser, self.encoder, max_batch_windows=1)(documents)
+        np.testing.assert_allclose(actual, expected, atol=1e-5)
+
+    def test_warns_without_packing_a_bidirectional_encoder(self):
+        config = dataclasses.replace(self._config(), hidden_state_bidirectional=True, pack_sequences=False)
+        documents = Hlm12NliDocumentEncoder(self.tokeniser, Hlm12NliEncoder(config=config).eval())
+        with self.assertWarnsRegex(UserWarning, "pack_sequences"):
+            documents([self.long, self.short])
+
+    def _config(self):
+        return Hlm12NliConfig(
+            model_name="integration_test",
+            vocab_size=len(self.vocab),
+            token_vec_dims=8,
+            token_id_pad=0,
+            hidden_state_dims=8,
+            hidden_state_bidirectional=False,
+            attn_heads=2,
+            attn_dropout=0.0,
+            output_dims=4,
+            pack_sequences=True,
+        )
@@ -1,6 +1,10 @@
 # Python Built-in Modules
+import dataclasses
 import unittest
 
+# Third-Party Libraries
+import torch
+
 # My Packages and Modules
 from hlm12nli.modelling.config import Hlm12NliConfig
 from hlm12nli.modelling.encoder import Hlm12NliEncoder
@@ -27,7 +31,28 @@ class IntegrationTestHlm12NliEncoder(unittest.TestCase):
         x = self._x()
         y = self.encoder.forward(x=x)
         self.assertEqual(len(y.embeddings), len(x))
-        self.assertEqual(len(y.embeddings[0], self.encoder.config.output_dims))
+        self.assertEqual(len(y.embeddings[0]), self.encoder.config.output_dims)
+
+    def test_attention_ignores_padding(self):
+        torch.manual_seed(0)
+        config = dataclasses.replace(self.encoder.config, hidden_state_bidirectional=False)
+        encoder = Hlm12NliEncoder(config=config).eval()
+        narrow = Hlm12NliTokeniserOutput(
+            tokens=[["a", "test"]],
+            padded_tokens=[["[STR]", "a", "test", "[END]"]],
+            encoded_tokens=[[1, 5, 6, 2]],
+            mask=[[True, True, True, True]],
+        )
+        wide = Hlm12NliTokeniserOutput(
+            tokens=[["a", "test"]],
+            padded_tokens=[["[STR]", "a", "test", "[END]", "[PAD]", "[PAD]", "[PAD]"]],
+            encoded_tokens=[[1, 5, 6, 2, 0, 0, 0]],
+            mask=[[True, True, True, True, False, False, False]],
+        )
+        with torch.inference_mode():
+            y_narrow = encoder.forward(x=narrow)
+            y_wide = encoder.forward(x=wide)
+        self.assertTrue(torch.allclose(y_narrow.embeddings, y_wide.embeddings, atol=1e-6))
 
     def _x(self):
         return Hlm12NliTokeniserOutput(
@@ -36,3 +61,42 @@ class IntegrationTestHlm12NliEncoder(unittest.TestCase):
             encoded_tokens=[[1, 3, 4, 5, 6, 2], [1, 6, 2, 0, 0, 0]],
             mask=[[True, True, True, True, True, True], [True, True, True, False, False, False]],
         )
+
+
+class IntegrationTestHlm12NliEncoderPacked(unittest.TestCase):
+    def setUp(self):
+        torch.manual_seed(0)
+        self.encoder = Hlm12NliEncoder(
+            config=Hlm12NliConfig(
+                model_name="integration_test",
+                vocab_size=10,
+                token_vec_dims=16,
+                token_id_pad=0,
+                hidden_state_dims=16,
+                hidden_state_bidirectional=True,
+                attn_heads=2,
+                attn_dropout=0.1,
+                output_dims=2,
+                pack_sequences=True,
+            )
+        )
+        self.encoder.eval()
+
+    def test_forward_is_independent_of_padded_width(self):
+        narrow = Hlm12NliTokeniserOutput(
+            tokens=[["test"]],
+            padded_tokens=[["[STR]", "test", "[END]"]],
+            encoded_tokens=[[1, 6, 2]],
+            mask=[[True, True, True]],
+        )
+        wide = Hlm12NliTokeniserOutput(
+            tokens=[["test"]],
+            padded_tokens=[["[STR]", "test", "[END]", "[PAD]", "[PAD]", "[PAD]"]],
+            encoded_tokens=[[1, 6, 2, 0, 0, 0]],
+            mask=[[True, True, True, False, False, False]],
+        )
+        with torch.inference_mode():
+            y_narrow = self.encoder.forward(x=narrow)
+            y_wide = self.encoder.forward(x=wide)
+        self.assertTrue(torch.allclose(y_narrow.last_hidden_state[0], y_wide.last_hidden_state[0, :3], atol=1e-6))
+        self.assertTrue(torch.allclose(y_narrow.embeddings, y_wide.embeddings, atol=1e-6))
@@ -0,0 +1,78 @@
+# Python Built-in Modules
+import pathlib
+import subprocess
+import sys
+import tempfile
+import unittest
+
+# Third-Party Libraries
+import torch
+
+# My Packages and Modules
+from hlm12nli.modelling.config import Hlm12NliConfig
+from hlm12nli.modelling.encoder import Hlm12NliEncoder
+from hlm12nli.modelling.export import Hlm12NliEncoderExporter
+from hlm12nli.modelling.runtime import Hlm12NliExportedEncoder
+from hlm12nli.tokenisation.config import Hlm12NliTextTokeniserConfig
+from hlm12nli.tokenisation.tokeniser import Hlm12NliTokeniser
+
+
+class IntegrationTestHlm12NliEncoderExporter(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.filepath = pathlib.Path(self.tmpdir.name) / "encoder.pt"
+        self.vocab = ["[PAD]", "[OOV]", "[STR]", "[END]", "a", "test", "sentence", "##.", "hudson", "##'s"]
+        self.tokeniser = Hlm12NliTokeniser(Hlm12NliTextTokeniserConfig(vocab=self.vocab))
+        self.texts = ["a test", "a test sentence . " * 6, "test", "Hudson's test sentence."]
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def encoder(self, **kwargs) -> Hlm12NliEncoder:
+        return Hlm12NliEncoder(
+            config=Hlm12NliConfig(
+                model_name="integration_test",
+                vocab_size=len(self.vocab),
+                token_vec_dims=16,
+                token_id_pad=0,
+                hidden_state_dims=16,
+                attn_heads=2,
+                attn_dropout=0.1,
+                output_dims=2,
+                **kwargs,
+            )
+        )
+
+    def assert_matches_eager(self, encoder: Hlm12NliEncoder) -> None:
+        encoder.eval()
+        Hlm12NliEncoderExporter(encoder).export(self.filepath)
+        exported = Hlm12NliExportedEncoder(self.filepath)
+        for texts in (self.texts, self.texts[:1], self.texts * 5):
+            x = self.tokeniser.tokenise_ids(texts)
+            with torch.inference_mode():
+                expected = encoder(x).embeddings
+            actual = exported(x.encoded_tokens, x.mask)
+            self.assertTrue(torch.allclose(actual, expected, atol=1e-5))
+
+    def test_exported_matches_eager(self):
+        self.assert_matches_eager(self.encoder(hidden_state_bidirectional=False))
+
+    def test_exported_packed_bidirectional_matches_eager(self):
+        encoder = self.encoder(hidden_state_bidirectional=True, pack_sequences=True, pooling="attention")
+        self.assert_matches_eager(encoder)
+
+    def test_export_restores_training_mode(self):
+        encoder = self.encoder(hidden_state_bidirectional=False)
+        encoder.train()
+        Hlm12NliEncoderExporter(encoder).trace()
+        self.assertTrue(encoder.training)
+
+    def test_exported_config_is_saved(self):
+        encoder = self.encoder(hidden_state_bidirectional=False)
+        Hlm12NliEncoderExporter(encoder).export(self.filepath)
+        self.assertEqual(Hlm12NliExportedEncoder(self.filepath).config["output_dims"], 2)
+
+    def test_runtime_does_not_import_nest_ml(self):
+        probe = "import sys, hlm12nli.modelling.runtime; print('nest_ml' in sys.modules)"
+        result = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, check=True)
+        self.assertEqual(result.stdout.strip(), "False")
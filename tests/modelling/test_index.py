@@ -0,0 +1,76 @@
+# Python Built-in Modules
+import pathlib
+import tempfile
+import unittest
+
+# Third-Party Libraries
+import numpy as np
+import torch
+
+# My Packages and Modules
+from hlm12nli.modelling.index import Hlm12NliVectorIndex
+
+
+class UnitTestHlm12NliVectorIndex(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.dirpath = pathlib.Path(self.tmpdir.name) / "index"
+        rng = np.random.default_rng(0)
+        centres = rng.normal(size=(16, 8))
+        self.vectors = (centres[rng.integers(0, 16, 3000)] + rng.normal(scale=0.3, size=(3000, 8))).astype(np.float32)
+        self.queries = self.vectors[rng.choice(3000, 50, replace=False)] + rng.normal(scale=0.1, size=(50, 8))
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def exact(self, k: int = 10) -> np.ndarray:
+        vectors = self.vectors / np.linalg.norm(self.vectors, axis=1, keepdims=True)
+        queries = self.queries / np.linalg.norm(self.queries, axis=1, keepdims=True)
+        return np.argsort(-(queries @ vectors.T), axis=1)[:, :k]
+
+    def recall(self, ids: np.ndarray) -> float:
+        expected = self.exact(ids.shape[1])
+        return np.mean([len(set(a) & set(b)) / len(a) for a, b in zip(ids, expected)])
+
+    def test_untrained_index_is_exact(self):
+        index = Hlm12NliVectorIndex(self.dirpath, dims=8, n_lists=16, train_size=10_000)
+        index.add(self.vectors)
+        self.assertFalse(index.is_trained)
+        scores, ids = index.search(self.queries, k=10)
+        np.testing.assert_array_equal(ids, self.exact())
+        self.assertTrue(np.all(np.diff(scores, axis=1) <= 0))
+
+    def test_n_probe_trades_recall(self):
+        index = Hlm12NliVectorIndex(self.dirpath, dims=8, n_lists=16)
+        for start in range(0, len(self.vectors), 500):
+            index.add(torch.from_numpy(self.vectors[start : start + 500]))
+        self.assertTrue(index.is_trained)
+        low = self.recall(index.search(self.queries, k=10, n_probe=1)[1])
+        high = self.recall(index.search(self.queries, k=10, n_probe=4)[1])
+        self.assertLessEqual(low, high)
+        self.assertGreater(high, 0.9)
+        np.testing.assert_array_equal(index.search(self.queries, k=10, n_probe=16)[1], self.exact())
+
+    def test_reopens_from_disk(self):
+        with Hlm12NliVectorIndex(self.dirpath, dims=8, n_lists=16) as index:
+            index.add(self.vectors, ids=np.arange(len(self.vectors)) + 100)
+            expected = index.search(self.queries, k=5)
+        reopened = Hlm12NliVectorIndex(self.dirpath, dims=8, n_lists=16)
+        self.assertEqual(len(reopened), len(self.vectors))
+        self.assertTrue(reopened.is_trained)
+        actual = reopened.search(self.queries, k=5)
+        np.testing.assert_array_equal(actual[1], expected[1])
+        self.assertGreaterEqual(actual[1].min(), 100)
+        reopened.close()
+
+    def test_pads_when_fewer_than_k(self):
+        index = Hlm12NliVectorIndex(self.dirpath, dims=8, n_lists=16)
+        index.add(self.vectors[:3])
+        scores, ids = index.search(self.queries[:2], k=5)
+        self.assertEqual(ids[:, 3:].tolist(), [[-1, -1], [-1, -1]])
+        self.assertTrue(np.all(np.isneginf(scores[:, 3:])))
+
+    def test_mismatched_layout_raises(self):
+        Hlm12NliVectorIndex(self.dirpath, dims=8, n_lists=16).close()
+        with self.assertRaises(ValueError):
+            Hlm12NliVectorIndex(self.dirpath, dims=4, n_lists=16)
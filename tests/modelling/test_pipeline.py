@@ -0,0 +1,88 @@
+# Python Built-in Modules
+import dataclasses
+import json
+import pathlib
+import tempfile
+import unittest
+
+# Third-Party Libraries
+import numpy as np
+import torch
+
+# My Packages and Modules
+from hlm12nli.modelling.config import Hlm12NliConfig
+from hlm12nli.modelling.encoder import Hlm12NliEncoder
+from hlm12nli.modelling.pipeline import Hlm12NliEmbeddingPipeline, Hlm12NliNpyWriter, Hlm12NliTextReader
+from hlm12nli.tokenisation.config import Hlm12NliTextTokeniserConfig
+from hlm12nli.tokenisation.tokeniser import Hlm12NliTokeniser
+
+
+class IntegrationTestHlm12NliEmbeddingPipeline(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.dirpath = pathlib.Path(self.tmpdir.name)
+        self.vocab = ["[PAD]", "[OOV]", "[STR]", "[END]", "a", "test", "sentence", "##.", "hudson", "##'s"]
+        self.tokeniser = Hlm12NliTokeniser(Hlm12NliTextTokeniserConfig(vocab=self.vocab))
+        self.encoder = Hlm12NliEncoder(
+            config=Hlm12NliConfig(
+                model_name="integration_test",
+                vocab_size=len(self.vocab),
+                token_vec_dims=16,
+                token_id_pad=0,
+                hidden_state_dims=16,
+                hidden_state_bidirectional=False,
+                attn_heads=2,
+                attn_dropout=0.1,
+                output_dims=2,
+                pack_sequences=True,
+            )
+        )
+        self.encoder.eval()
+        self.texts = ["a test", "a test sentence . " * 6, "test", "Hudson's test sentence.", "a"] * 7
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def expected(self) -> np.ndarray:
+        with torch.inference_mode():
+            return torch.cat([self.encoder(self.tokeniser.tokenise_ids([t])).embeddings for t in self.texts]).numpy()
+
+    def test_reads_jsonl_and_tsv(self):
+        jsonl_filepath = self.dirpath / "texts.jsonl"
+        tsv_filepath = self.dirpath / "texts.tsv"
+        with open(jsonl_filepath, "w", encoding="utf-8") as fh:
+            fh.writelines(json.dumps({"id": i, "sentence1": t}) + "\n" for i, t in enumerate(self.texts))
+        with open(tsv_filepath, "w", encoding="utf-8") as fh:
+            fh.write("id\tsentence1\n")
+            fh.writelines(f"{i}\t{t}\n" for i, t in enumerate(self.texts))
+        self.assertEqual(list(Hlm12NliTextReader(jsonl_filepath, field="sentence1")), self.texts)
+        self.assertEqual(list(Hlm12NliTextReader(tsv_filepath, field="sentence1")), self.texts)
+
+    def test_streams_embeddings_in_input_order(self):
+        pipeline = Hlm12NliEmbeddingPipeline(self.tokeniser, self.encoder, max_batch_tokens=24, window_size=8)
+        chunks = list(pipeline(iter(self.texts)))
+        self.assertGreater(len(chunks), 1)
+        np.testing.assert_allclose(np.concatenate(chunks), self.expected(), atol=1e-5)
+
+    def test_writes_memory_mappable_npy(self):
+        filepath = self.dirpath / "embeddings.npy"
+        pipeline = Hlm12NliEmbeddingPipeline(self.tokeniser, self.encoder, max_batch_tokens=24, queue_size=1)
+        with Hlm12NliNpyWriter(filepath, dims=self.encoder.config.output_dims) as writer:
+            self.assertEqual(pipeline.run(self.texts, writer), len(self.texts))
+        actual = np.load(filepath, mmap_mode="r")
+        self.assertEqual(actual.shape, (len(self.texts), self.encoder.config.output_dims))
+        np.testing.assert_allclose(actual, self.expected(), atol=1e-5)
+
+    def test_warns_without_packing_a_bidirectional_encoder(self):
+        config = dataclasses.replace(self.encoder.config, hidden_state_bidirectional=True, pack_sequences=False)
+        with self.assertWarnsRegex(UserWarning, "pack_sequences"):
+            Hlm12NliEmbeddingPipeline(self.tokeniser, Hlm12NliEncoder(config=config))
+
+    def test_reader_errors_are_raised(self):
+        def texts():
+            yield "a test"
+            raise RuntimeError("broken reader")
+
+        pipeline = Hlm12NliEmbeddingPipeline(self.tokeniser, self.encoder)
+        with self.assertRaisesRegex(RuntimeError, "broken reader"):
+            list(pipeline(texts()))
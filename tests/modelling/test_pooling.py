@@ -0,0 +1,36 @@
+# Python Built-in Modules
+import unittest
+
+# Third-Party Libraries
+import torch
+
+# My Packages and Modules
+from hlm12nli.modelling.pooling import Hlm12NliPooling
+
+
+class UnitTestHlm12NliPooling(unittest.TestCase):
+    def setUp(self):
+        self.y = torch.tensor([[[1.0, 2.0], [3.0, -4.0], [100.0, 100.0]]])
+        self.mask = torch.tensor([[True, True, False]])
+
+    def test_mean_ignores_padding(self):
+        actual = Hlm12NliPooling("mean", dims=2)(self.y, self.mask)
+        self.assertEqual(actual.tolist(), [[2.0, -1.0]])
+
+    def test_max_ignores_padding(self):
+        actual = Hlm12NliPooling("max", dims=2)(self.y, self.mask)
+        self.assertEqual(actual.tolist(), [[3.0, 2.0]])
+
+    def test_first_takes_start_token(self):
+        actual = Hlm12NliPooling("first", dims=2)(self.y, self.mask)
+        self.assertEqual(actual.tolist(), [[1.0, 2.0]])
+
+    def test_attention_ignores_padding(self):
+        pooling = Hlm12NliPooling("attention", dims=2)
+        padded = pooling(self.y, self.mask)
+        unpadded = pooling(self.y[:, :2], self.mask[:, :2])
+        self.assertTrue(torch.allclose(padded, unpadded))
+
+    def test_unknown_strategy_raises(self):
+        with self.assertRaises(ValueError):
+            Hlm12NliPooling("median", dims=2)
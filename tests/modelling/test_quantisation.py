@@ -0,0 +1,69 @@
+# Python Built-in Modules
+import unittest
+
+# Third-Party Libraries
+import torch
+
+# My Packages and Modules
+from hlm12nli.modelling.config import Hlm12NliConfig
+from hlm12nli.modelling.encoder import Hlm12NliEncoder
+from hlm12nli.modelling.quantisation import Hlm12NliEncoderQuantiser, Hlm12NliHalfEmbedding
+from hlm12nli.tokenisation.config import Hlm12NliTextTokeniserConfig
+from hlm12nli.tokenisation.tokeniser import Hlm12NliTokeniser
+
+
+class IntegrationTestHlm12NliEncoderQuantiser(unittest.TestCase):
+    def setUp(self):
+        self.vocab = ["[PAD]", "[OOV]", "[STR]", "[END]", "a", "test", "sentence", "##.", "hudson", "##'s"]
+        self.tokeniser = Hlm12NliTokeniser(Hlm12NliTextTokeniserConfig(vocab=self.vocab))
+        self.encoder = Hlm12NliEncoder(
+            config=Hlm12NliConfig(
+                model_name="integration_test",
+                vocab_size=len(self.vocab),
+                token_vec_dims=32,
+                token_id_pad=0,
+                hidden_state_dims=32,
+                hidden_state_bidirectional=True,
+                attn_heads=2,
+                attn_dropout=0.1,
+                output_dims=8,
+                pack_sequences=True,
+            )
+        )
+        self.encoder.eval()
+        self.texts = ["a test", "a test sentence . " * 6, "test", "Hudson's test sentence.", "a"]
+
+    def test_quantises_lstm_and_linear_layers(self):
+        quantised = Hlm12NliEncoderQuantiser().quantise(self.encoder)
+        self.assertIsInstance(quantised.lstm, torch.ao.nn.quantized.dynamic.LSTM)
+        self.assertIsInstance(quantised.linear, torch.ao.nn.quantized.dynamic.Linear)
+        self.assertIsInstance(self.encoder.lstm, torch.nn.LSTM)
+
+    def test_half_embedding_table(self):
+        quantised = Hlm12NliEncoderQuantiser(embeddings_dtype="bfloat16").quantise(self.encoder)
+        self.assertIsInstance(quantised.embeddings, Hlm12NliHalfEmbedding)
+        self.assertEqual(quantised.embeddings.weight.dtype, torch.bfloat16)
+        with torch.inference_mode():
+            y = quantised(self.tokeniser.tokenise_ids(self.texts))
+        self.assertEqual(y.embeddings.dtype, torch.float32)
+
+    def test_validate_reports_small_drift(self):
+        quantiser = Hlm12NliEncoderQuantiser(embeddings_dtype="float16")
+        report = quantiser.validate(self.encoder, quantiser.quantise(self.encoder), self.tokeniser, self.texts)
+        self.assertEqual(report.n_texts, len(self.texts))
+        self.assertGreater(report.cosine_min, 0.95)
+        self.assertLessEqual(report.cosine_min, report.cosine_mean)
+        self.assertLess(report.quantised_bytes, report.reference_bytes)
+
+    def test_validate_restores_training_mode(self):
+        quantiser = Hlm12NliEncoderQuantiser()
+        quantised = quantiser.quantise(self.encoder).train()
+        self.encoder.train()
+        self.encoder.pooling.eval()
+        quantiser.validate(self.encoder, quantised, self.tokeniser, self.texts)
+        self.assertTrue(self.encoder.training and self.encoder.lstm.training and quantised.training)
+        self.assertFalse(self.encoder.pooling.training)
+
+    def test_unknown_embeddings_dtype_raises(self):
+        with self.assertRaises(ValueError):
+            Hlm12NliEncoderQuantiser(embeddings_dtype="int4")
@@ -0,0 +1,94 @@
+# Python Built-in Modules
+import tempfile
+import unittest
+
+# Third-Party Libraries
+import numpy as np
+import torch
+
+# My Packages and Modules
+from hlm12nli.modelling.config import Hlm12NliConfig
+from hlm12nli.modelling.encoder import Hlm12NliEncoder
+from hlm12nli.modelling.store import Hlm12NliEmbeddingStore
+from hlm12nli.tokenisation.config import Hlm12NliTextTokeniserConfig
+from hlm12nli.tokenisation.tokeniser import Hlm12NliTokeniser
+
+
+class IntegrationTestHlm12NliEmbeddingStore(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.vocab = ["[PAD]", "[OOV]", "[STR]", "[END]", "a", "test", "sentence", "##.", "hudson", "##'s"]
+        self.tokeniser = Hlm12NliTokeniser(Hlm12NliTextTokeniserConfig(vocab=self.vocab))
+        self.encoder = Hlm12NliEncoder(config=self._config(output_dims=4)).eval()
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_second_lookup_is_a_hit(self):
+        with self._store() as store:
+            first = store(["a test", "A  test", "hudson's sentence."])
+            second = store(["a test"])
+            self.assertEqual(store.stats().misses, 3)
+            self.assertEqual(store.stats().hits, 1)
+            self.assertEqual(len(store), 2)
+            np.testing.assert_array_equal(first[0], first[1])
+            np.testing.assert_array_equal(first[0], second[0])
+
+    def test_embeddings_survive_reopening(self):
+        with self._store() as store:
+            expected = store(["a test sentence."])
+        with self._store() as store:
+            np.testing.assert_array_equal(store.lookup("a test sentence."), expected[0])
+            store(["a test sentence."])
+            self.assertEqual(store.stats().misses, 0)
+
+    def test_stale_index_never_serves_another_text(self):
+        store = self._store(capacity=2)
+        store(["a test", "sentence"])
+        store.flush()
+        expected = store(["hudson's", "a"])
+        with self._store(capacity=2) as reopened:
+            self.assertIsNone(reopened.lookup("a test"))
+            self.assertIsNone(reopened.lookup("sentence"))
+            np.testing.assert_array_equal(reopened(["hudson's", "a"]), expected)
+
+    def test_config_change_invalidates_the_store(self):
+        with self._store() as store:
+            store(["a test"])
+        self.encoder = Hlm12NliEncoder(config=self._config(output_dims=4, pooling="max")).eval()
+        with self._store() as store:
+            self.assertIsNone(store.lookup("a test"))
+
+    def test_weights_change_invalidates_the_store(self):
+        with self._store() as store:
+            store(["a test"])
+        with torch.no_grad():
+            self.encoder.linear.bias.add_(1.0)
+        with self._store() as store:
+            self.assertIsNone(store.lookup("a test"))
+
+    def test_least_recently_used_is_evicted(self):
+        with self._store(capacity=2) as store:
+            store(["a", "test"])
+            store(["a"])
+            store(["sentence"])
+            self.assertIsNotNone(store.lookup("a"))
+            self.assertIsNone(store.lookup("test"))
+            self.assertEqual(store.stats().evictions, 1)
+
+    def _store(self, capacity=16):
+        return Hlm12NliEmbeddingStore(self.tmpdir.name, self.tokeniser, self.encoder, capacity=capacity)
+
+    def _config(self, **kwargs):
+        return Hlm12NliConfig(
+            model_name="integration_test",
+            vocab_size=len(self.vocab),
+            token_vec_dims=8,
+            token_id_pad=0,
+            hidden_state_dims=8,
+            hidden_state_bidirectional=False,
+            attn_heads=2,
+            attn_dropout=0.0,
+            pack_sequences=True,
+            **kwargs,
+        )
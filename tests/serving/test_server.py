@@ -0,0 +1,66 @@
+# Python Built-in Modules
+import asyncio
+import unittest
+
+# Third-Party Libraries
+import numpy as np
+
+# My Packages and Modules
+from hlm12nli.modelling.config import Hlm12NliConfig
+from hlm12nli.modelling.encoder import Hlm12NliEncoder
+from hlm12nli.serving import Hlm12NliEmbeddingClient, Hlm12NliEmbeddingServer, Hlm12NliEmbeddingService
+from hlm12nli.tokenisation.config import Hlm12NliTextTokeniserConfig
+from hlm12nli.tokenisation.tokeniser import Hlm12NliTokeniser
+
+
+class IntegrationTestHlm12NliEmbeddingServer(unittest.TestCase):
+    def setUp(self):
+        self.vocab = ["[PAD]", "[OOV]", "[STR]", "[END]", "a", "test", "sentence", "##.", "hudson", "##'s"]
+        self.tokeniser = Hlm12NliTokeniser(Hlm12NliTextTokeniserConfig(vocab=self.vocab))
+        self.encoder = Hlm12NliEncoder(
+            config=Hlm12NliConfig(
+                model_name="integration_test",
+                vocab_size=len(self.vocab),
+                token_vec_dims=8,
+                token_id_pad=0,
+                hidden_state_dims=8,
+                hidden_state_bidirectional=False,
+                attn_heads=2,
+                attn_dropout=0.0,
+                output_dims=4,
+                pack_sequences=True,
+            )
+        ).eval()
+        self.service = Hlm12NliEmbeddingService(self.tokeniser, self.encoder, max_batch_size=8, max_wait_ms=20)
+
+    def serve(self, client_fn):
+        async def run():
+            async with Hlm12NliEmbeddingServer(self.service, port=0) as server:
+                return await client_fn(Hlm12NliEmbeddingClient(*server.address))
+
+        return asyncio.run(run())
+
+    def test_embeds_through_http(self):
+        texts = ["a test", "hudson's sentence.", "test"] * 4
+
+        async def client_fn(client):
+            direct = await self.service.embed(texts)
+            results = await asyncio.gather(*(client.embed([text]) for text in texts))
+            return direct, np.concatenate(results), await client.stats()
+
+        direct, embeddings, stats = self.serve(client_fn)
+        np.testing.assert_allclose(embeddings, direct, atol=1e-5)
+        self.assertEqual(stats["requests"], len(texts) + 1)
+        self.assertIn("latency_p99_ms", stats)
+
+    def test_rejects_malformed_requests(self):
+        async def client_fn(client):
+            with self.assertRaisesRegex(RuntimeError, "400"):
+                await client.request("POST", "/embed", {"text": "a test"})
+            with self.assertRaisesRegex(RuntimeError, "405"):
+                await client.request("GET", "/embed")
+            with self.assertRaisesRegex(RuntimeError, "404"):
+                await client.request("GET", "/unknown")
+            return await client.request("GET", "/health")
+
+        self.assertEqual(self.serve(client_fn), {"status": "ok"})
@@ -0,0 +1,109 @@
+# Python Built-in Modules
+import asyncio
+import dataclasses
+import time
+import unittest
+
+# Third-Party Libraries
+import numpy as np
+import torch
+
+# My Packages and Modules
+from hlm12nli.modelling.config import Hlm12NliConfig
+from hlm12nli.modelling.encoder import Hlm12NliEncoder
+from hlm12nli.serving.service import Hlm12NliEmbeddingService
+from hlm12nli.tokenisation.config import Hlm12NliTextTokeniserConfig
+from hlm12nli.tokenisation.tokeniser import Hlm12NliTokeniser
+
+
+class IntegrationTestHlm12NliEmbeddingService(unittest.TestCase):
+    def setUp(self):
+        self.vocab = ["[PAD]", "[OOV]", "[STR]", "[END]", "a", "test", "sentence", "##.", "hudson", "##'s"]
+        self.tokeniser = Hlm12NliTokeniser(Hlm12NliTextTokeniserConfig(vocab=self.vocab))
+        self.encoder = Hlm12NliEncoder(
+            config=Hlm12NliConfig(
+                model_name="integration_test",
+                vocab_size=len(self.vocab),
+                token_vec_dims=8,
+                token_id_pad=0,
+                hidden_state_dims=8,
+                hidden_state_bidirectional=False,
+                attn_heads=2,
+                attn_dropout=0.0,
+                output_dims=4,
+                pack_sequences=True,
+            )
+        ).eval()
+        self.texts = ["a test", "a test sentence . " * 4, "test", "Hudson's test sentence.", "a"] * 8
+
+    def expected(self, texts) -> np.ndarray:
+        with torch.inference_mode():
+            return torch.cat([self.encoder(self.tokeniser.tokenise_ids([t])).embeddings for t in texts]).numpy()
+
+    def test_concurrent_requests_are_coalesced(self):
+        async def run():
+            async with Hlm12NliEmbeddingService(self.tokeniser, self.encoder, max_batch_size=16, max_wait_ms=50) as s:
+                results = await asyncio.gather(*(s.embed([text]) for text in self.texts))
+                return np.concatenate(results), s.stats()
+
+        embeddings, stats = asyncio.run(run())
+        np.testing.assert_allclose(embeddings, self.expected(self.texts), atol=1e-5)
+        self.assertEqual(stats.requests, len(self.texts))
+        self.assertEqual(stats.texts, len(self.texts))
+        self.assertLess(stats.batches, len(self.texts))
+        self.assertLessEqual(max(stats.batch_sizes), 16)
+        self.assertEqual(sum(size * n for size, n in stats.batch_sizes.items()), len(self.texts))
+        self.assertGreater(stats.latency_p99_ms, 0.0)
+        self.assertGreaterEqual(stats.latency_p99_ms, stats.latency_p50_ms)
+
+    def test_queueing_counts_towards_the_wait(self):
+        async def run():
+            async with Hlm12NliEmbeddingService(self.tokeniser, self.encoder, n_workers=1, max_wait_ms=500) as s:
+                await s._slots.acquire()
+                pending = asyncio.ensure_future(s.embed(["a test"]))
+                await asyncio.sleep(0.6)
+                start = time.perf_counter()
+                s._slots.release()
+                await pending
+                return time.perf_counter() - start
+
+        self.assertLess(asyncio.run(run()), 0.25)
+
+    def test_warns_without_packing_a_bidirectional_encoder(self):
+        config = dataclasses.replace(self.encoder.config, hidden_state_bidirectional=True, pack_sequences=False)
+        with self.assertWarnsRegex(UserWarning, "pack_sequences"):
+            Hlm12NliEmbeddingService(self.tokeniser, Hlm12NliEncoder(config=config))
+
+    def test_requests_larger_than_a_batch_are_not_split(self):
+        async def run():
+            async with Hlm12NliEmbeddingService(self.tokeniser, self.encoder, max_batch_size=4, n_workers=2) as s:
+                first, second = await asyncio.gather(s.embed(self.texts[:10]), s.embed(self.texts[10:12]))
+                return first, second, s.stats()
+
+        first, second, stats = asyncio.run(run())
+        np.testing.assert_allclose(first, self.expected(self.texts[:10]), atol=1e-5)
+        np.testing.assert_allclose(second, self.expected(self.texts[10:12]), atol=1e-5)
+        self.assertEqual(stats.batch_sizes, {2: 1, 10: 1})
+
+    def test_stop_answers_pending_requests(self):
+        async def run():
+            service = Hlm12NliEmbeddingService(self.tokeniser, self.encoder, max_wait_ms=1000)
+            await service.start()
+            pending = asyncio.ensure_future(service.embed(["a test"]))
+            await asyncio.sleep(0)
+            await service.stop()
+            with self.assertRaises(RuntimeError):
+                await service.embed(["a test"])
+            return await pending
+
+        self.assertEqual(asyncio.run(run()).shape, (1, 4))
+
+    def test_encoder_errors_fail_the_batch(self):
+        async def run():
+            async with Hlm12NliEmbeddingService(self.tokeniser, self.encoder) as service:
+                service.encoder = None
+                with self.assertRaises(AttributeError):
+                    await service.embed(["a test"])
+                return service.stats()
+
+        self.assertEqual(asyncio.run(run()).errors, 1)
@@ -0,0 +1,118 @@
+# Python Built-in Modules
+import logging
+import unittest
+
+# Third-Party Libraries
+import torch
+
+# My Packages and Modules
+from hlm12nli import profiling
+from hlm12nli.modelling.config import Hlm12NliConfig
+from hlm12nli.modelling.encoder import Hlm12NliEncoder
+from hlm12nli.profiling import (
+    Hlm12NliLoggingSink,
+    Hlm12NliMemorySink,
+    Hlm12NliPrometheusSink,
+    Hlm12NliStageEvent,
+    profile,
+    stage,
+)
+from hlm12nli.tokenisation.config import Hlm12NliTextTokeniserConfig
+from hlm12nli.tokenisation.tokeniser import Hlm12NliTokeniser
+
+
+class UnitTestHlm12NliProfiling(unittest.TestCase):
+    def test_disabled_stages_are_not_recorded(self):
+        sink = Hlm12NliMemorySink()
+        with stage("disabled") as span:
+            span.add(items=1)
+        with profile(sink):
+            with stage("enabled", items=2) as span:
+                span.add(items=1, nbytes=8)
+        self.assertEqual(list(sink.summary()), ["enabled"])
+        self.assertEqual(sink.summary()["enabled"].items, 3)
+        self.assertEqual(sink.summary()["enabled"].nbytes, 8)
+        self.assertIsNone(profiling.active_sink())
+
+    def test_memory_sink_aggregates(self):
+        sink = Hlm12NliMemorySink()
+        for seconds in (0.1, 0.3):
+            sink.record(Hlm12NliStageEvent(stage="a", seconds=seconds, items=2, nbytes=4))
+        stats = sink.summary()["a"]
+        self.assertEqual((stats.calls, stats.items, stats.nbytes), (2, 4, 8))
+        self.assertAlmostEqual(stats.mean_seconds, 0.2)
+        self.assertEqual((stats.min_seconds, stats.max_seconds), (0.1, 0.3))
+        sink.reset()
+        self.assertEqual(sink.summary(), {})
+
+    def test_enable_records_outside_profile_blocks(self):
+        sink = Hlm12NliMemorySink()
+        profiling.enable(sink)
+        try:
+            with stage("global"):
+                pass
+        finally:
+            profiling.disable()
+        with stage("disabled"):
+            pass
+        self.assertEqual(list(sink.summary()), ["global"])
+
+    def test_prometheus_sink_renders_counters(self):
+        sink = Hlm12NliPrometheusSink()
+        sink.record(Hlm12NliStageEvent(stage="encoder.lstm", seconds=0.5, items=3, nbytes=16))
+        text = sink.render()
+        self.assertIn("# TYPE hlm12nli_stage_seconds_total counter", text)
+        self.assertIn('hlm12nli_stage_calls_total{stage="encoder.lstm"} 1', text)
+        self.assertIn('hlm12nli_stage_bytes_total{stage="encoder.lstm"} 16', text)
+
+    def test_logging_sink_logs_events(self):
+        with self.assertLogs("hlm12nli.profiling", level=logging.DEBUG) as logs:
+            with profile(Hlm12NliLoggingSink()):
+                with stage("logged", items=5):
+                    pass
+        self.assertIn("logged took", logs.output[0])
+
+
+class IntegrationTestHlm12NliProfiling(unittest.TestCase):
+    def setUp(self):
+        self.vocab = ["[PAD]", "[OOV]", "[STR]", "[END]", "a", "test", "sentence", "##.", "hudson", "##'s"]
+        self.tokeniser = Hlm12NliTokeniser(Hlm12NliTextTokeniserConfig(vocab=self.vocab))
+        self.encoder = Hlm12NliEncoder(
+            config=Hlm12NliConfig(
+                model_name="integration_test",
+                vocab_size=len(self.vocab),
+                token_vec_dims=8,
+                token_id_pad=0,
+                hidden_state_dims=8,
+                hidden_state_bidirectional=False,
+                attn_heads=2,
+                attn_dropout=0.0,
+                output_dims=4,
+                pack_sequences=True,
+            )
+        ).eval()
+
+    def test_profile_captures_every_stage_of_a_batch(self):
+        texts = ["a test sentence.", "hudson's test"]
+        with profile() as sink, torch.inference_mode():
+            self.encoder(self.tokeniser.tokenise_ids(texts))
+        summary = sink.summary()
+        self.assertEqual(
+            list(summary),
+            [
+                "tokeniser.whitespace",
+                "tokeniser.wordpiece",
+                "tokeniser.pad",
+                "tokeniser.to_tensor",
+                "encoder.embeddings",
+                "encoder.lstm",
+                "encoder.attention",
+                "encoder.pooling",
+                "encoder.projection",
+                "encoder.forward",
+            ],
+        )
+        self.assertEqual(summary["tokeniser.whitespace"].items, 2)
+        self.assertEqual(summary["tokeniser.wordpiece"].items, 5)
+        self.assertEqual(summary["encoder.projection"].nbytes, 2 * 4 * 4)
+        self.assertGreaterEqual(summary["encoder.forward"].seconds, summary["encoder.lstm"].seconds)
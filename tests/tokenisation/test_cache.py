@@ -0,0 +1,93 @@
+# Python Built-in Modules
+import unittest
+
+# My Packages and Modules
+from hlm12nli.tokenisation.cache import Hlm12NliWordCache
+from hlm12nli.tokenisation.config import Hlm12NliTextTokeniserConfig
+from hlm12nli.tokenisation.tokeniser import Hlm12NliTokeniser
+
+
+class UnitTestHlm12NliWordCache(unittest.TestCase):
+    def test_lru_evicts_least_recently_used(self):
+        cache = Hlm12NliWordCache(capacity=2, policy="lru")
+        cache.put("a", ("a",))
+        cache.put("b", ("b",))
+        cache.get("a")
+        cache.put("c", ("c",))
+        self.assertEqual(cache.get("a"), ("a",))
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.evictions, 1)
+
+    def test_fifo_evicts_first_inserted(self):
+        cache = Hlm12NliWordCache(capacity=2, policy="fifo")
+        cache.put("a", ("a",))
+        cache.put("b", ("b",))
+        cache.get("a")
+        cache.put("c", ("c",))
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.get("b"), ("b",))
+
+    def test_zero_capacity_stores_nothing(self):
+        cache = Hlm12NliWordCache(capacity=0)
+        cache.put("a", ("a",))
+        self.assertEqual(len(cache), 0)
+        self.assertFalse(cache.enabled)
+
+    def test_unknown_policy_raises(self):
+        with self.assertRaises(ValueError):
+            Hlm12NliWordCache(capacity=1, policy="random")
+
+
+class IntegrationTestHlm12NliTokeniserWordCache(unittest.TestCase):
+    def setUp(self):
+        self.vocab = ["[PAD]", "[OOV]", "[STR]", "[END]", "A", "test", "sentence", "##.", "Hudson", "##'s"]
+        self.tokeniser = Hlm12NliTokeniser(Hlm12NliTextTokeniserConfig(vocab=self.vocab, do_lowercase=False))
+
+    def test_repeated_words_hit_the_cache(self):
+        self.tokeniser.tokenise(["A test sentence", "test test"])
+        stats = self.tokeniser.word_cache_stats
+        self.assertEqual(stats.misses, 3)
+        self.assertEqual(stats.hits, 2)
+        self.assertEqual(stats.size, 3)
+
+    def test_cached_tokens_match_uncached_tokens(self):
+        test_input = ["A Hudson's test sentence.", "Hudson's test"]
+        uncached = Hlm12NliTokeniser(
+            Hlm12NliTextTokeniserConfig(vocab=self.vocab, do_lowercase=False, word_cache_capacity=0)
+        )
+        self.tokeniser.tokenise(test_input)
+        self.assertEqual(
+            self.tokeniser.tokenise(test_input).encoded_tokens, uncached.tokenise(test_input).encoded_tokens
+        )
+
+    def test_changing_lowercase_invalidates_the_cache(self):
+        self.tokeniser.tokenise(["A test"])
+        self.tokeniser.do_lowercase = True
+        self.tokeniser.tokenise(["A test"])
+        stats = self.tokeniser.word_cache_stats
+        self.assertEqual(stats.invalidations, 1)
+        self.assertEqual(stats.hits, 0)
+
+    def test_changing_vocab_invalidates_the_cache(self):
+        self.tokeniser.tokenise(["A test"])
+        self.tokeniser.vocab = {**self.tokeniser.vocab, "##s": len(self.tokeniser.vocab)}
+        actual = self.tokeniser.tokenise(["tests"]).encoded_tokens
+        expected = [self.tokeniser.vocab.get(t) for t in ["[STR]", "test", "##s", "[END]"]]
+        self.assertEqual(self.tokeniser.word_cache_stats.invalidations, 1)
+        self.assertEqual(actual[0], expected)
+
+    def test_editing_the_vocab_in_place_invalidates_the_cache_on_reassignment(self):
+        self.tokeniser.tokenise(["A test"])
+        vocab = self.tokeniser.vocab
+        vocab["tests"] = vocab.pop("sentence")
+        self.tokeniser.vocab = vocab
+        actual = self.tokeniser.tokenise(["tests"]).encoded_tokens
+        self.assertEqual(self.tokeniser.word_cache_stats.invalidations, 1)
+        self.assertEqual(actual[0], [vocab[t] for t in ["[STR]", "tests", "[END]"]])
+
+    def test_reassigning_an_equal_vocab_keeps_the_cache(self):
+        self.tokeniser.tokenise(["A test"])
+        self.tokeniser.vocab = dict(self.tokeniser.vocab)
+        self.tokeniser.tokenise(["A test"])
+        self.assertEqual(self.tokeniser.word_cache_stats.invalidations, 0)
+        self.assertEqual(self.tokeniser.word_cache_stats.hits, 2)
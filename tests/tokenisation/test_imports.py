@@ -0,0 +1,26 @@
+# Python Built-in Modules
+import subprocess
+import sys
+import unittest
+
+
+class IntegrationTestHlm12NliTokenisationImports(unittest.TestCase):
+    def probe(self, code: str) -> str:
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        return result.stdout.strip()
+
+    def test_tokenisation_does_not_import_torch(self):
+        if self.probe("import sys, nest_ml.text, nest_ml.text.tokenisation; print('torch' in sys.modules)") == "True":
+            self.skipTest("nest_ml imports torch itself.")
+        probe = (
+            "import sys\n"
+            "import hlm12nli.tokenisation, hlm12nli.tokenisation.parallel, hlm12nli.tokenisation.vocab_binary\n"
+            "from hlm12nli.tokenisation import Hlm12NliTextTokeniserConfig, Hlm12NliTokeniser\n"
+            "tokeniser = Hlm12NliTokeniser(Hlm12NliTextTokeniserConfig(vocab=['[PAD]', '[OOV]', '[STR]', '[END]', 'a']))\n"
+            "x = tokeniser.tokenise_ids(['a a', 'a'])\n"
+            "tokeniser.reverse_ids(x.encoded_tokens, x.lengths)\n"
+            "before = 'torch' in sys.modules\n"
+            "x.encoded_tokens_to_tensor()\n"
+            "print(before, 'torch' in sys.modules)"
+        )
+        self.assertEqual(self.probe(probe), "False True")
@@ -0,0 +1,71 @@
+# Python Built-in Modules
+import unittest
+
+# Third-Party Libraries
+import numpy as np
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+# My Packages and Modules
+from hlm12nli.tokenisation.config import Hlm12NliTextTokeniserConfig
+from hlm12nli.tokenisation.joining import Hlm12NliTokeniserJoiner
+from hlm12nli.tokenisation.splitter import Hlm12NliTokeniserSplitter
+from hlm12nli.tokenisation.tokeniser import Hlm12NliTokeniser
+
+_ALPHABET = "abc'."
+_PIECES = ["ab", "abc", "ca", "ba"]
+
+
+class UnitTestHlm12NliTokeniserJoiner(unittest.TestCase):
+    def setUp(self):
+        self.joiner = Hlm12NliTokeniserJoiner(expr_subword="##", special_tokens={"[PAD]", "[STR]", "[END]"})
+
+    def test_joins_every_sequence_of_the_batch(self):
+        x = [["hudson", "##'s", "test", "##."], ["un", "##aff", "##able"], []]
+        self.assertEqual(self.joiner(x), ["hudson's test.", "unaffable", ""])
+
+    def test_does_not_mutate_input(self):
+        x = [["hudson", "##'s"]]
+        self.joiner(x)
+        self.assertEqual(x, [["hudson", "##'s"]])
+
+    def test_ignores_special_tokens(self):
+        x = [["[STR]", "a", "##b", "[END]", "[PAD]"]]
+        self.assertEqual(self.joiner(x), ["[STR] ab [END] [PAD]"])
+        self.assertEqual(self.joiner(x, ignore_special_tokens=True), ["ab"])
+
+    def test_join_ids_stops_at_lengths(self):
+        id_to_token = ["[PAD]", "[OOV]", "[STR]", "[END]", "a", "##b"]
+        x = np.array([[2, 4, 5, 3, 0], [2, 4, 3, 0, 0]])
+        self.assertEqual(self.joiner.join_ids(x, id_to_token), ["ab", "a"])
+        actual = self.joiner.join_ids(x, id_to_token, lengths=np.array([4, 3]), ignore_special_tokens=False)
+        self.assertEqual(actual, ["[STR] ab [END]", "[STR] a [END]"])
+
+    def test_join_ids_rejects_unknown_ids(self):
+        with self.assertRaises(ValueError):
+            self.joiner.join_ids([[7]], ["[PAD]"])
+        with self.assertRaises(ValueError):
+            self.joiner.join_ids([[1]], ["[PAD]", None])
+
+
+class UnitTestHlm12NliTokeniserJoinerRoundTrip(unittest.TestCase):
+    def setUp(self):
+        self.vocab = ["[PAD]", "[OOV]", "[STR]", "[END]"]
+        self.vocab += list(_ALPHABET) + [f"##{c}" for c in _ALPHABET] + _PIECES + [f"##{p}" for p in _PIECES]
+        self.tokeniser = Hlm12NliTokeniser(Hlm12NliTextTokeniserConfig(vocab=self.vocab, max_seq_len=4096))
+        self.splitter = Hlm12NliTokeniserSplitter(vocab=self.vocab, token_oov="[OOV]", expr_subword="##")
+        self.joiner = Hlm12NliTokeniserJoiner(expr_subword="##")
+
+    @settings(max_examples=200, deadline=None)
+    @given(st.lists(st.text(alphabet=_ALPHABET, min_size=1, max_size=12), max_size=8))
+    def test_join_split_round_trips(self, words):
+        texts = [" ".join(words), " ".join(reversed(words))]
+        self.assertEqual(self.joiner(self.splitter(texts)), texts)
+
+    @settings(max_examples=200, deadline=None)
+    @given(st.lists(st.text(alphabet=_ALPHABET, min_size=1, max_size=12), max_size=8))
+    def test_reverse_ids_round_trips(self, words):
+        texts = [" ".join(words), "a"]
+        y = self.tokeniser.tokenise_ids(texts)
+        self.assertEqual(self.tokeniser.reverse_ids(y.encoded_tokens), texts)
+        self.assertEqual(self.tokeniser.reverse_ids(y.encoded_tokens, lengths=y.lengths), texts)
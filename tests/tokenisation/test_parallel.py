@@ -0,0 +1,55 @@
+# Python Built-in Modules
+import gc
+import unittest
+
+# My Packages and Modules
+from hlm12nli.tokenisation.config import Hlm12NliTextTokeniserConfig
+from hlm12nli.tokenisation.parallel import Hlm12NliParallelTokeniser
+from hlm12nli.tokenisation.tokeniser import Hlm12NliTokeniser
+
+
+class IntegrationTestHlm12NliParallelTokeniser(unittest.TestCase):
+    def setUp(self):
+        self.vocab = ["[PAD]", "[OOV]", "[STR]", "[END]", "a", "test", "sentence", "##.", "hudson", "##'s"]
+        self.tokeniser = Hlm12NliTokeniser(Hlm12NliTextTokeniserConfig(vocab=self.vocab))
+        self.texts = ["a test", "Hudson's test sentence.", "not_in_vocab"] * 20 + ["test " * 12]
+        self.parallel = Hlm12NliParallelTokeniser(self.tokeniser, processes=2, shard_size=8, min_parallel_size=16)
+
+    def tearDown(self):
+        self.parallel.close()
+
+    def test_parallel_matches_in_process(self):
+        expected = self.tokeniser.tokenise_ids(self.texts)
+        actual = self.parallel.tokenise_ids(self.texts)
+        self.assertEqual(actual.encoded_tokens.tolist(), expected.encoded_tokens.tolist())
+        self.assertEqual(actual.mask.tolist(), expected.mask.tolist())
+        self.assertEqual(actual.lengths.tolist(), expected.lengths.tolist())
+
+    def test_streamed_shards_are_in_order(self):
+        shards = list(self.parallel.iter_tokenise_ids(self.texts))
+        actual = [n for shard in shards for n in shard.lengths.tolist()]
+        self.assertEqual(len(shards), 8)
+        self.assertEqual(actual, self.tokeniser.tokenise_ids(self.texts).lengths.tolist())
+
+    def test_small_batches_run_in_process(self):
+        actual = self.parallel.tokenise_ids(self.texts[:3])
+        self.assertIsNone(self.parallel._pool)
+        self.assertEqual(
+            actual.encoded_tokens.tolist(), self.tokeniser.tokenise_ids(self.texts[:3]).encoded_tokens.tolist()
+        )
+
+    def test_outputs_are_contiguous(self):
+        actual = self.parallel.tokenise_ids(self.texts)
+        self.assertLess(actual.encoded_tokens.shape[1], self.tokeniser.max_seq_len)
+        self.assertTrue(actual.encoded_tokens.flags.c_contiguous)
+        for shard in self.parallel.iter_tokenise_ids(self.texts):
+            self.assertTrue(shard.encoded_tokens.flags.c_contiguous)
+
+    def test_lengths_outlive_the_token_ids(self):
+        tokeniser = Hlm12NliTokeniser(Hlm12NliTextTokeniserConfig(vocab=self.vocab, max_seq_len=16, seq_len=16))
+        with Hlm12NliParallelTokeniser(tokeniser, processes=2, shard_size=8, min_parallel_size=16) as parallel:
+            actual = parallel.tokenise_ids(self.texts)
+        lengths = actual.lengths
+        del actual
+        gc.collect()
+        self.assertEqual(lengths.tolist(), tokeniser.tokenise_ids(self.texts).lengths.tolist())
@@ -0,0 +1,57 @@
+# Python Built-in Modules
+import unittest
+
+# Third-Party Libraries
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+# My Packages and Modules
+from hlm12nli.tokenisation.splitter import Hlm12NliTokeniserSplitter
+
+_ALPHABET = "ab#c"
+
+
+class UnitTestHlm12NliTokeniserSplitterTrieParity(unittest.TestCase):
+    def setUp(self):
+        self.vocab = {
+            t: i
+            for i, t in enumerate(
+                ["[PAD]", "[OOV]", "A", "test", "sentence", "##.", "Hudson", "##'s", "un", "##aff", "##able", "##a"]
+            )
+        }
+
+    def test_trie_matches_greedy_on_known_words(self):
+        texts = ["A test sentence.", "Hudson's unaffable test", "unable unaffablea", "", "  ", "xyz Hudson"]
+        self.assertEqual(self._split(texts, "trie"), self._split(texts, "greedy"))
+
+    def test_trie_backtracks_to_longest_match(self):
+        vocab = {"a": 0, "abcd": 1, "##b": 2, "##c": 3, "##d": 4, "##bc": 5, "[OOV]": 6}
+        texts = ["abce abcd abc ab a"]
+        self.assertEqual(self._split(texts, "trie", vocab), self._split(texts, "greedy", vocab))
+
+    def test_trie_supports_list_vocab(self):
+        vocab = list(self.vocab.keys())
+        texts = ["Hudson's unaffable test."]
+        self.assertEqual(self._split(texts, "trie", vocab), self._split(texts, "greedy", vocab))
+
+    def test_unknown_engine_raises(self):
+        with self.assertRaises(ValueError):
+            Hlm12NliTokeniserSplitter(vocab=self.vocab, token_oov="[OOV]", expr_subword="##", engine="unknown")
+
+    @settings(max_examples=300, deadline=None)
+    @given(
+        vocab=st.sets(st.text(alphabet=_ALPHABET, min_size=1, max_size=5), max_size=30),
+        texts=st.lists(st.text(alphabet=_ALPHABET + " ", max_size=30), min_size=1, max_size=4),
+    )
+    def test_trie_matches_greedy_on_random_vocab(self, vocab, texts):
+        vocab = {t: i for i, t in enumerate(sorted(vocab))}
+        self.assertEqual(self._split(texts, "trie", vocab), self._split(texts, "greedy", vocab))
+
+    def _split(self, texts, engine, vocab=None):
+        splitter = Hlm12NliTokeniserSplitter(
+            vocab=vocab if vocab is not None else self.vocab,
+            token_oov="[OOV]",
+            expr_subword="##",
+            engine=engine,
+        )
+        return splitter(texts)
@@ -1,6 +1,10 @@
 # Python Built-in Modules
 import unittest
 
+# Third-Party Libraries
+import numpy as np
+import torch
+
 # My Packages and Modules
 from hlm12nli.tokenisation.config import Hlm12NliTextTokeniserConfig
 from hlm12nli.tokenisation.tokeniser import Hlm12NliTokeniser
@@ -74,3 +78,35 @@ class IntegrationTestHlm12NliTokeniser(unittest.TestCase):
         ]
         actual = self.tokeniser(test_input).mask
         self.assertEqual(actual, expected)
+
+    def test_tokenise_ids_matches_tokenise(self):
+        test_input = ["A Hudson's test sentence.", "test", "not_in_vocab test"]
+        expected = self.tokeniser.tokenise(test_input)
+        actual = self.tokeniser.tokenise_ids(test_input)
+        self.assertEqual(actual.encoded_tokens.tolist(), expected.encoded_tokens)
+        self.assertEqual(actual.mask.tolist(), expected.mask)
+        self.assertEqual(actual.lengths.tolist(), [8, 3, 4])
+
+    def test_tokenise_ids_uses_requested_dtype(self):
+        actual = self.tokeniser.tokenise_ids(["A test sentence"], dtype=np.int32)
+        self.assertEqual(actual.encoded_tokens.dtype, np.int32)
+
+    def test_tokenise_ids_builds_string_tokens_lazily(self):
+        test_input = ["A Hudson's test sentence.", "test"]
+        expected = self.tokeniser.tokenise(test_input)
+        actual = self.tokeniser.tokenise_ids(test_input)
+        self.assertNotIn("output", actual.__dict__)
+        self.assertEqual(actual.padded_tokens, expected.padded_tokens)
+
+    def test_tensors_are_cached_per_device(self):
+        output = self.tokeniser.tokenise(["A Hudson's test sentence.", "test"])
+        tensor = output.encoded_tokens_to_tensor()
+        self.assertIs(output.encoded_tokens_to_tensor(device="cpu"), tensor)
+        self.assertEqual(tensor.tolist(), output.encoded_tokens)
+        self.assertEqual(output.mask_to_tensor().tolist(), output.mask)
+
+    def test_tokenise_ids_tensors_share_memory_with_arrays(self):
+        output = self.tokeniser.tokenise_ids(["A Hudson's test sentence.", "test"])
+        tensor = output.encoded_tokens_to_tensor()
+        self.assertEqual(tensor.data_ptr(), output.encoded_tokens.__array_interface__["data"][0])
+        self.assertEqual(output.mask_to_tensor().dtype, torch.bool)
@@ -0,0 +1,123 @@
+# Python Built-in Modules
+import json
+import pathlib
+import pickle
+import tempfile
+import unittest
+from unittest import mock
+
+# My Packages and Modules
+from hlm12nli.tokenisation import tokeniser as tokeniser_module
+from hlm12nli.tokenisation.config import Hlm12NliTextTokeniserConfig
+from hlm12nli.tokenisation.splitter import Hlm12NliTokeniserSplitter
+from hlm12nli.tokenisation.vocab import Hlm12NliTokeniserVocabReader
+from hlm12nli.tokenisation.vocab_binary import (
+    Hlm12NliTokeniserBinaryVocabReader,
+    Hlm12NliTokeniserBinaryVocabWriter,
+    Hlm12NliTokeniserCompiledVocabReader,
+)
+
+
+class UnitTestHlm12NliTokeniserVocabReader(unittest.TestCase):
+    def test_lowercase_collisions_are_deterministic(self):
+        raw = {"HUDSON": 3, "The": 5, "Hudson": 7, "the": 10, "THE": 2}
+        expected = {"hudson": 3, "the": 10}
+        self.assertEqual(Hlm12NliTokeniserVocabReader._postprocess(raw, do_lowercase=True), expected)
+        reordered = dict(reversed(list(raw.items())))
+        self.assertEqual(Hlm12NliTokeniserVocabReader._postprocess(reordered, do_lowercase=True), expected)
+
+    def test_vocab_is_kept_without_lowercasing(self):
+        raw = {"The": 1, "the": 0}
+        self.assertEqual(
+            list(Hlm12NliTokeniserVocabReader._postprocess(raw, do_lowercase=False).items()), [("the", 0), ("The", 1)]
+        )
+
+
+class IntegrationTestHlm12NliTokeniserBinaryVocab(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.json_filepath = pathlib.Path(self.tmpdir.name) / "vocab.json"
+        self.bin_filepath = pathlib.Path(self.tmpdir.name) / "vocab.bin"
+        raw = ["[PAD]", "[OOV]", "[STR]", "[END]", "a", "test", "sentence", "##.", "hudson", "##'s", "café", "日本"]
+        with open(self.json_filepath, "w", encoding="utf-8") as fh:
+            json.dump({token: index for index, token in enumerate(raw)}, fh)
+        Hlm12NliTokeniserBinaryVocabWriter(self.bin_filepath).convert(self.json_filepath, do_lowercase=True)
+        self.vocab = Hlm12NliTokeniserBinaryVocabReader(self.bin_filepath).read(do_lowercase=True)
+
+    def tearDown(self):
+        self.vocab.close()
+        self.tmpdir.cleanup()
+
+    def test_binary_vocab_matches_json_vocab(self):
+        expected = Hlm12NliTokeniserVocabReader(self.json_filepath).read(do_lowercase=True)
+        self.assertEqual(dict(self.vocab), expected)
+        self.assertEqual(list(self.vocab), list(expected))
+
+    def test_missing_tokens_are_not_found(self):
+        self.assertNotIn("missing", self.vocab)
+        self.assertNotIn("", self.vocab)
+        self.assertIsNone(self.vocab.get("zzz"))
+        with self.assertRaises(KeyError):
+            self.vocab["aa"]
+
+    def test_reverse_vocab(self):
+        self.assertEqual(self.vocab.id_to_token()[10], "café")
+
+    def test_mismatched_lowercasing_raises(self):
+        with self.assertRaises(ValueError):
+            Hlm12NliTokeniserBinaryVocabReader(self.bin_filepath).read(do_lowercase=False)
+
+    def test_pickles_by_path(self):
+        unpickled = pickle.loads(pickle.dumps(self.vocab))
+        self.assertEqual(unpickled["hudson"], self.vocab["hudson"])
+        unpickled.close()
+
+    def test_splitter_accepts_mapped_vocab(self):
+        splitter = Hlm12NliTokeniserSplitter(vocab=self.vocab, token_oov="[oov]", expr_subword="##")
+        self.assertEqual(splitter.split_ids(["hudson's test."]), [[8, 9, 5, 7]])
+
+
+class IntegrationTestHlm12NliTokeniserCompiledVocabReader(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.json_filepath = pathlib.Path(self.tmpdir.name) / "vocab.json"
+        self._write_json(["[PAD]", "[OOV]", "[STR]", "[END]", "The", "the", "Test"])
+        self.reader = Hlm12NliTokeniserCompiledVocabReader(self.json_filepath)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_compiles_once_and_reuses(self):
+        vocab = self.reader.read(do_lowercase=True)
+        self.assertEqual(dict(vocab), Hlm12NliTokeniserVocabReader(self.json_filepath).read(do_lowercase=True))
+        self.assertEqual(vocab.fingerprint, self.reader.fingerprint(do_lowercase=True))
+        vocab.close()
+        mtime = self.reader.compiled_filepath.stat().st_mtime_ns
+        self.reader.read(do_lowercase=True).close()
+        self.assertEqual(self.reader.compiled_filepath.stat().st_mtime_ns, mtime)
+
+    def test_tokeniser_reuses_the_recorded_fingerprint(self):
+        tokeniser = tokeniser_module.Hlm12NliTokeniser(
+            Hlm12NliTextTokeniserConfig(vocab=["[PAD]", "[OOV]", "[STR]", "[END]"])
+        )
+        vocab = self.reader.read(do_lowercase=True)
+        with mock.patch.object(tokeniser_module, "fingerprint", wraps=tokeniser_module.fingerprint) as hashed:
+            tokeniser.vocab = vocab
+        hashed.assert_not_called()
+        self.assertEqual(tokeniser.split_ids(["the test"]), [[vocab["the"], vocab["test"]]])
+        vocab.close()
+
+    def test_recompiles_when_stale(self):
+        self.reader.read(do_lowercase=True).close()
+        self._write_json(["[PAD]", "[OOV]", "[STR]", "[END]", "sentence"])
+        vocab = self.reader.read(do_lowercase=True)
+        self.assertIn("sentence", vocab)
+        vocab.close()
+        vocab = self.reader.read(do_lowercase=False)
+        self.assertIn("[PAD]", vocab)
+        self.assertFalse(vocab.do_lowercase)
+        vocab.close()
+
+    def _write_json(self, tokens):
+        with open(self.json_filepath, "w", encoding="utf-8") as fh:
+            json.dump({token: index for index, token in enumerate(tokens)}, fh)
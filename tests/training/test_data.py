@@ -0,0 +1,97 @@
+# Python Built-in Modules
+import pathlib
+import tempfile
+import unittest
+
+# My Packages and Modules
+from hlm12nli.etl.shards import Hlm12NliTripletShardWriter
+from hlm12nli.tokenisation.config import Hlm12NliTextTokeniserConfig
+from hlm12nli.tokenisation.tokeniser import Hlm12NliTokeniser
+from hlm12nli.training.data import Hlm12NliShardShuffleSampler, Hlm12NliTripletDataset
+
+
+class IntegrationTestHlm12NliTripletDataset(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.dirpath = pathlib.Path(self.tmpdir.name)
+        self.vocab = ["[PAD]", "[OOV]", "[STR]", "[END]", "a", "test", "sentence", "##.", "hudson", "##'s"]
+        self.tokeniser = Hlm12NliTokeniser(Hlm12NliTextTokeniserConfig(vocab=self.vocab))
+        self.triplets = [
+            ("a test", "a sentence.", "hudson's test"),
+            ("a test", "test", "not_in_vocab"),
+            ("hudson's sentence.", "a test", "test " * 12),
+            ("sentence", "hudson's", "a"),
+            ("test", "a test", "hudson's sentence."),
+        ]
+        Hlm12NliTripletShardWriter(self.dirpath, self.tokeniser, shard_size=2).write(self.triplets)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_batches_match_tokenise_ids(self):
+        dataset = Hlm12NliTripletDataset(self.dirpath, self.tokeniser)
+        indices = [4, 0, 3, 2]
+        batch = dataset.batch(indices)
+        for role, actual in enumerate(batch):
+            expected = self.tokeniser.tokenise_ids([self.triplets[i][role] for i in indices])
+            self.assertEqual(actual.encoded_tokens.tolist(), expected.encoded_tokens.tolist())
+            self.assertEqual(actual.mask.tolist(), expected.mask.tolist())
+            self.assertEqual(actual.lengths.tolist(), expected.lengths.tolist())
+
+    def test_batches_pad_to_seq_len(self):
+        tokeniser = Hlm12NliTokeniser(Hlm12NliTextTokeniserConfig(vocab=self.vocab, seq_len=6))
+        Hlm12NliTripletShardWriter(self.dirpath, tokeniser).write(self.triplets)
+        anchors, _, negatives = Hlm12NliTripletDataset(self.dirpath, tokeniser).batch([2, 1])
+        expected = tokeniser.tokenise_ids([self.triplets[2][2], self.triplets[1][2]])
+        self.assertEqual(negatives.encoded_tokens.tolist(), expected.encoded_tokens.tolist())
+        self.assertEqual(anchors.encoded_tokens.shape, (2, 6))
+
+    def test_item_is_the_unpadded_triplet(self):
+        dataset = Hlm12NliTripletDataset(self.dirpath, self.tokeniser)
+        anchor, positive, negative = dataset[3]
+        self.assertEqual(len(dataset), 5)
+        self.assertEqual(positive.tolist(), self.tokeniser.tokenise_ids(["hudson's"]).encoded_tokens[0].tolist())
+        self.assertEqual(anchor.tolist(), dataset[-2][0].tolist())
+        with self.assertRaises(IndexError):
+            dataset[5]
+
+    def test_rejects_shards_of_another_tokeniser(self):
+        tokeniser = Hlm12NliTokeniser(Hlm12NliTextTokeniserConfig(vocab=self.vocab, do_lowercase=False))
+        with self.assertRaises(ValueError):
+            Hlm12NliTripletDataset(self.dirpath, tokeniser)
+
+    def test_loader_yields_every_triplet_once(self):
+        dataset = Hlm12NliTripletDataset(self.dirpath, self.tokeniser)
+        batches = list(dataset.loader(batch_size=2, seed=1))
+        self.assertEqual([len(anchors.lengths) for anchors, _, _ in batches], [2, 2, 1])
+        actual = sorted(tuple(row) for anchors, _, _ in batches for row in anchors.encoded_tokens[:, :3].tolist())
+        expected = sorted(tuple(row) for row in dataset.batch(range(5))[0].encoded_tokens[:, :3].tolist())
+        self.assertEqual(actual, expected)
+
+
+class UnitTestHlm12NliShardShuffleSampler(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.dirpath = pathlib.Path(self.tmpdir.name)
+        vocab = ["[PAD]", "[OOV]", "[STR]", "[END]", "a", "test"]
+        self.tokeniser = Hlm12NliTokeniser(Hlm12NliTextTokeniserConfig(vocab=vocab))
+        triplets = [(f"a {i}", "test", "a") for i in range(10)]
+        Hlm12NliTripletShardWriter(self.dirpath, self.tokeniser, shard_size=4).write(triplets)
+        self.dataset = Hlm12NliTripletDataset(self.dirpath, self.tokeniser)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_visits_each_shard_contiguously(self):
+        sampler = Hlm12NliShardShuffleSampler(self.dataset, seed=3)
+        order = list(sampler)
+        self.assertEqual(sorted(order), list(range(10)))
+        shards = [index // 4 for index in order]
+        self.assertEqual(len([i for i in range(1, 10) if shards[i] != shards[i - 1]]), 2)
+
+    def test_order_changes_with_the_epoch(self):
+        sampler = Hlm12NliShardShuffleSampler(self.dataset, seed=3)
+        first = list(sampler)
+        self.assertEqual(list(sampler), first)
+        sampler.set_epoch(1)
+        self.assertNotEqual(list(sampler), first)
@@ -0,0 +1,91 @@
+# Python Built-in Modules
+import unittest
+
+# Third-Party Libraries
+import torch
+
+# My Packages and Modules
+from hlm12nli.training.losses import Hlm12NliEmbeddingMemory, Hlm12NliTripletLoss
+
+
+def _reference_loss(loss, anchors, positives, negatives, groups, memory=None, memory_groups=None):
+    candidates = [(c, g) for c, g in zip(positives, groups)] + [(c, -1) for c in negatives]
+    if memory is not None:
+        candidates += [(c, int(g)) for c, g in zip(memory, memory_groups)]
+    losses = []
+    for anchor, positive, group in zip(anchors, positives, groups):
+        d_ap = float(loss.paired_distances(anchor[None], positive[None]))
+        d_ans = [float(loss.paired_distances(anchor[None], c[None])) for c, g in candidates if g != group]
+        if not d_ans:
+            continue
+        if loss.mining == "batch_hard":
+            d_an = min(d_ans)
+        else:
+            farther = [d for d in d_ans if d > d_ap]
+            d_an = min(farther) if farther else max(d_ans)
+        losses.append(max(d_ap - d_an + loss.margin, 0.0))
+    return sum(losses) / len(losses)
+
+
+class UnitTestHlm12NliTripletLoss(unittest.TestCase):
+    def setUp(self):
+        generator = torch.Generator().manual_seed(0)
+        self.anchors, self.positives, self.negatives = torch.randn(3, 8, 4, generator=generator)
+        self.groups = torch.tensor([0, 0, 1, 2, 3, 3, 4, 5])
+        self.memory = torch.randn(5, 4, generator=generator)
+        self.memory_groups = torch.tensor([0, -1, 4, -1, 7])
+
+    def test_matches_per_anchor_reference(self):
+        for mining in Hlm12NliTripletLoss.MINING_STRATEGIES:
+            for distance in Hlm12NliTripletLoss.DISTANCES:
+                with self.subTest(mining=mining, distance=distance):
+                    loss = Hlm12NliTripletLoss(margin=0.5, mining=mining, distance=distance)
+                    actual = loss(self.anchors, self.positives, self.negatives, self.groups).loss
+                    expected = _reference_loss(loss, self.anchors, self.positives, self.negatives, self.groups)
+                    self.assertAlmostEqual(float(actual), expected, places=5)
+
+    def test_memory_adds_candidates(self):
+        for mining in Hlm12NliTripletLoss.MINING_STRATEGIES:
+            with self.subTest(mining=mining):
+                loss = Hlm12NliTripletLoss(margin=0.5, mining=mining)
+                args = (self.anchors, self.positives, self.negatives, self.groups, self.memory, self.memory_groups)
+                expected = _reference_loss(loss, *args)
+                self.assertAlmostEqual(float(loss(*args).loss), expected, places=5)
+
+    def test_positives_of_the_same_group_are_not_negatives(self):
+        anchors = torch.tensor([[1.0, 0.0], [1.0, 0.0]])
+        positives = torch.tensor([[1.0, 0.1], [1.0, -0.1]])
+        negatives = torch.tensor([[-1.0, 0.0], [-1.0, 0.0]])
+        loss = Hlm12NliTripletLoss(margin=0.2)
+        self.assertEqual(float(loss(anchors, positives, negatives, torch.tensor([0, 0])).loss), 0.0)
+        self.assertGreater(float(loss(anchors, positives, negatives, torch.tensor([0, 1])).loss), 0.0)
+
+    def test_gradients_reach_the_mined_negatives(self):
+        negatives = self.negatives.clone().requires_grad_()
+        Hlm12NliTripletLoss(margin=10.0)(self.anchors, self.positives, negatives, self.groups).loss.backward()
+        self.assertTrue(torch.isfinite(negatives.grad).all())
+        self.assertGreater(int((negatives.grad.abs().sum(dim=1) > 0).sum()), 0)
+
+    def test_rejects_unknown_mining(self):
+        with self.assertRaises(ValueError):
+            Hlm12NliTripletLoss(mining="random")
+
+
+class UnitTestHlm12NliEmbeddingMemory(unittest.TestCase):
+    def test_keeps_the_most_recent_embeddings(self):
+        memory = Hlm12NliEmbeddingMemory(size=4, dims=2)
+        memory.enqueue(torch.arange(6.0).reshape(3, 2), torch.tensor([0, 1, 2]))
+        memory.enqueue(torch.arange(6.0, 12.0).reshape(3, 2), torch.tensor([3, 4, 5]))
+        embeddings, groups = memory.contents()
+        self.assertEqual(len(memory), 4)
+        self.assertEqual(sorted(groups.tolist()), [2, 3, 4, 5])
+        self.assertEqual(sorted(embeddings[:, 0].tolist()), [4.0, 6.0, 8.0, 10.0])
+
+    def test_keeps_detached_embeddings(self):
+        memory = Hlm12NliEmbeddingMemory(size=2, dims=2)
+        memory.enqueue(torch.ones(5, 2, requires_grad=True), torch.arange(5))
+        embeddings, groups = memory.contents()
+        self.assertFalse(embeddings.requires_grad)
+        self.assertEqual(groups.tolist(), [3, 4])
+        memory.reset()
+        self.assertEqual(len(memory), 0)
@@ -0,0 +1,82 @@
+# Python Built-in Modules
+import importlib.util
+import pathlib
+import tempfile
+import unittest
+
+# Third-Party Libraries
+import torch
+
+# My Packages and Modules
+from hlm12nli.etl.shards import Hlm12NliTripletShardWriter
+from hlm12nli.modelling.config import Hlm12NliConfig
+from hlm12nli.modelling.encoder import Hlm12NliEncoder
+from hlm12nli.tokenisation.config import Hlm12NliTextTokeniserConfig
+from hlm12nli.tokenisation.tokeniser import Hlm12NliTokeniser
+from hlm12nli.training.data import Hlm12NliTripletDataset
+
+
+@unittest.skipUnless(importlib.util.find_spec("lightning"), "requires the `training` extra")
+class IntegrationTestHlm12NliTripletModule(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.dirpath = pathlib.Path(self.tmpdir.name)
+        self.vocab = ["[PAD]", "[OOV]", "[STR]", "[END]", "a", "test", "sentence", "##.", "hudson", "##'s"]
+        self.tokeniser = Hlm12NliTokeniser(Hlm12NliTextTokeniserConfig(vocab=self.vocab))
+        triplets = [
+            ("a test", "a sentence.", "hudson's test"),
+            ("a test", "test", "hudson's"),
+            ("hudson's sentence.", "a test", "test " * 12),
+            ("sentence", "hudson's", "a"),
+        ]
+        Hlm12NliTripletShardWriter(self.dirpath, self.tokeniser).write(triplets)
+        self.dataset = Hlm12NliTripletDataset(self.dirpath, self.tokeniser)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_embeds_the_three_roles_in_one_pass(self):
+        module = self._module()
+        anchors, positives, negatives = module.embed(self.dataset.batch(range(4)))
+        self.assertEqual(anchors.shape, (4, 4))
+        expected = module.encoder(self.dataset.batch(range(4))[2]).embeddings
+        self.assertTrue(torch.allclose(negatives, expected, atol=1e-5))
+
+    def test_anchors_of_the_same_premise_share_a_group(self):
+        groups = self._module().groups(self.dataset.batch(range(4))[0]).tolist()
+        self.assertEqual(groups[0], groups[1])
+        self.assertEqual(len(set(groups)), 3)
+        self.assertTrue(all(group >= 0 for group in groups))
+
+    def test_training_step_fills_the_memory(self):
+        module = self._module(memory_size=6, mining="semi_hard")
+        loss = module.training_step(self.dataset.batch(range(4)), 0)
+        loss.backward()
+        self.assertTrue(torch.isfinite(loss))
+        self.assertEqual(len(module.memory), 6)
+
+    def test_fits_with_a_trainer(self):
+        # Third-Party Libraries
+        import lightning.pytorch as pl
+
+        trainer = pl.Trainer(max_steps=2, logger=False, enable_checkpointing=False, enable_progress_bar=False)
+        trainer.fit(self._module(memory_size=8), self.dataset.loader(batch_size=2))
+        self.assertEqual(trainer.global_step, 2)
+
+    def _module(self, **kwargs):
+        # My Packages and Modules
+        from hlm12nli.training.module import Hlm12NliTripletModule
+
+        config = Hlm12NliConfig(
+            model_name="integration_test",
+            vocab_size=len(self.vocab),
+            token_vec_dims=8,
+            token_id_pad=0,
+            hidden_state_dims=8,
+            hidden_state_bidirectional=False,
+            attn_heads=2,
+            attn_dropout=0.0,
+            output_dims=4,
+            pack_sequences=True,
+        )
+        return Hlm12NliTripletModule(Hlm12NliEncoder(config), **kwargs)